@@ -0,0 +1,694 @@
+# -*- coding: utf-8 -*-
+"""
+Analisis: avalanche effect, key sensitivity, dan metrik S-Box
+(NL, SAC, BIC, LAP, DAP, BCT). Tidak ada kerja saat import; demo ada di
+aes_backend.run_demos().
+"""
+
+from aes_core import AES_SBOX, SBOX44, get_cipher, inverse_sbox, np, pkcs7_pad
+
+__all__ = [
+    "hex_to_bitstring", "bit_diff_stats", "encrypt_bytes_std", "encrypt_bytes_44",
+    "avalanche_plaintext", "key_sensitivity", "sbox_bool_coords", "fwht", "fwht_rows",
+    "component_walsh", "walsh_spectrum", "nonlinearity_from_walsh",
+    "nonlinearity_per_bit", "sbox_nonlinearity", "sac_matrix", "sac_stats_per_bit",
+    "analyze_sbox_per_bit", "bic_nl", "bic_sac", "linear_approximation_table",
+    "lat_entry", "lat_row", "lat_column", "lat_linearity", "lat_spectrum",
+    "lap_from_lat", "lap_param", "difference_distribution_table", "ddt_entry",
+    "ddt_row", "ddt_column", "differential_uniformity", "differential_spectrum",
+    "dap_from_ddt", "dap_param", "BCT_CHUNK", "boomerang_connectivity_table",
+    "boomerang_uniformity", "bct_param", "analyze_advanced",
+]
+
+# ===========================================
+# Cell 7 — Avalanche Effect & Key Sensitivity
+# DIPERBAIKI: Gunakan hanya 1 block untuk tes avalanche
+# ===========================================
+
+def hex_to_bitstring(h: str) -> str:
+    """Konversi hex string → bitstring ('0101...') dengan panjang tepat."""
+    if len(h) == 0:
+        return ""
+    return bin(int(h, 16))[2:].zfill(len(h) * 4)
+
+
+def bit_diff_stats(hex1: str, hex2: str):
+    """
+    Hitung:
+    - jumlah bit berbeda
+    - total bit
+    - persentase perubahannya
+    """
+    b1 = hex_to_bitstring(hex1)
+    b2 = hex_to_bitstring(hex2)
+
+    # Samakan panjang kalau sampai beda (jaga-jaga)
+    max_len = max(len(b1), len(b2))
+    b1 = b1.zfill(max_len)
+    b2 = b2.zfill(max_len)
+
+    total = len(b1)
+    changed = sum(1 for x, y in zip(b1, b2) if x != y)
+    pct = (changed / total) * 100 if total > 0 else 0.0
+    return changed, total, pct
+
+
+def encrypt_bytes_std(data_padded: bytes, key_bytes: bytes) -> bytes:
+    """Enkripsi data yang SUDAH dipadding (panjang kelipatan 16) dengan AES standar."""
+    assert len(data_padded) % 16 == 0
+    return get_cipher(key_bytes, AES_SBOX).encrypt_blocks(data_padded)
+
+
+def encrypt_bytes_44(data_padded: bytes, key_bytes: bytes) -> bytes:
+    """Enkripsi data yang SUDAH dipadding (panjang kelipatan 16) dengan AES SBOX44."""
+    assert len(data_padded) % 16 == 0
+    return get_cipher(key_bytes, SBOX44).encrypt_blocks(data_padded)
+
+
+def avalanche_plaintext(plaintext: str, key_str: str, debug=True):
+    """
+    Avalanche Effect terhadap plaintext:
+    - Flip 1 bit pada 1 byte pertama dari plaintext.
+    - Bandingkan perubahan bit HANYA pada block pertama ciphertext.
+    - Ini menghindari bias dari block yang tidak berubah di ECB mode.
+    """
+    key_bytes = key_str.encode("utf-8")
+    if len(key_bytes) != 16:
+        raise ValueError("Key harus 16 byte (16 karakter).")
+
+    pt_bytes = plaintext.encode("utf-8")
+    if len(pt_bytes) == 0:
+        raise ValueError("Plaintext tidak boleh kosong.")
+
+    # Padding dulu
+    pt_padded = pkcs7_pad(pt_bytes, 16)
+
+    # Buat versi dimodifikasi: flip 1 bit di byte pertama
+    pt_mod = bytearray(pt_padded)
+    pt_mod[0] ^= 0x01  # flip bit LSB
+    pt_mod = bytes(pt_mod)
+
+    # Enkripsi dengan AES standar
+    ct_std_1_full = encrypt_bytes_std(pt_padded, key_bytes)
+    ct_std_2_full = encrypt_bytes_std(pt_mod,    key_bytes)
+
+    # Enkripsi dengan AES SBOX44
+    ct_44_1_full = encrypt_bytes_44(pt_padded, key_bytes)
+    ct_44_2_full = encrypt_bytes_44(pt_mod,    key_bytes)
+
+    # PERBAIKAN: Ambil HANYA block pertama (16 byte = 128 bit)
+    ct_std_1 = ct_std_1_full[:16].hex()
+    ct_std_2 = ct_std_2_full[:16].hex()
+    ct_44_1 = ct_44_1_full[:16].hex()
+    ct_44_2 = ct_44_2_full[:16].hex()
+
+    # Hitung perubahan bit
+    changed_std, total_std, pct_std = bit_diff_stats(ct_std_1, ct_std_2)
+    changed_44, total_44, pct_44   = bit_diff_stats(ct_44_1,  ct_44_2)
+
+    # Debugging output (debug=False untuk service / pemanggil non-interaktif)
+    if debug:
+        print(f"\n=== DEBUG AVALANCHE PLAINTEXT ===")
+        print(f"Plaintext original (hex): {pt_padded.hex()}")
+        print(f"Plaintext modified (hex): {pt_mod.hex()}")
+        print(f"CT Std 1 (block 1 only): {ct_std_1}")
+        print(f"CT Std 2 (block 1 only): {ct_std_2}")
+        print(f"CT 44  1 (block 1 only): {ct_44_1}")
+        print(f"CT 44  2 (block 1 only): {ct_44_2}")
+
+    return {
+        "plaintext": plaintext,
+        "key": key_str,
+        "std": {
+            "ct1": ct_std_1,
+            "ct2": ct_std_2,
+            "changed_bits": changed_std,
+            "total_bits": total_std,
+            "percent": pct_std,
+        },
+        "sbox44": {
+            "ct1": ct_44_1,
+            "ct2": ct_44_2,
+            "changed_bits": changed_44,
+            "total_bits": total_44,
+            "percent": pct_44,
+        }
+    }
+
+
+def key_sensitivity(plaintext: str, key_str: str, debug=True):
+    """
+    Key Sensitivity:
+    - Flip 1 bit pada key (byte pertama).
+    - Bandingkan perubahan bit ciphertext AES standar vs AES SBOX44.
+    """
+    key_bytes = key_str.encode("utf-8")
+    if len(key_bytes) != 16:
+        raise ValueError("Key harus 16 byte (16 karakter).")
+
+    pt_bytes = plaintext.encode("utf-8")
+    if len(pt_bytes) == 0:
+        raise ValueError("Plaintext tidak boleh kosong.")
+
+    pt_padded = pkcs7_pad(pt_bytes, 16)
+
+    # Key asli
+    key_orig = key_bytes
+
+    # Key dimodifikasi: flip 1 bit pada byte pertama
+    key_mod = bytearray(key_bytes)
+    key_mod[0] ^= 0x01
+    key_mod = bytes(key_mod)
+
+    # Enkripsi dengan AES standar
+    ct_std_1 = encrypt_bytes_std(pt_padded, key_orig).hex()
+    ct_std_2 = encrypt_bytes_std(pt_padded, key_mod).hex()
+
+    # Enkripsi dengan AES SBOX44
+    ct_44_1 = encrypt_bytes_44(pt_padded, key_orig).hex()
+    ct_44_2 = encrypt_bytes_44(pt_padded, key_mod).hex()
+
+    # Hitung perubahan bit
+    changed_std, total_std, pct_std = bit_diff_stats(ct_std_1, ct_std_2)
+    changed_44, total_44, pct_44   = bit_diff_stats(ct_44_1,  ct_44_2)
+
+    # Debugging output (debug=False untuk service / pemanggil non-interaktif)
+    if debug:
+        print(f"\n=== DEBUG KEY SENSITIVITY ===")
+        print(f"Key original (hex): {key_orig.hex()}")
+        print(f"Key modified (hex): {key_mod.hex()}")
+        print(f"CT Std 1: {ct_std_1}")
+        print(f"CT Std 2: {ct_std_2}")
+        print(f"CT 44  1: {ct_44_1}")
+        print(f"CT 44  2: {ct_44_2}")
+
+    return {
+        "plaintext": plaintext,
+        "key_original": key_str,
+        "key_original_hex": key_orig.hex(),
+        "key_modified_hex": key_mod.hex(),
+        "std": {
+            "ct1": ct_std_1,
+            "ct2": ct_std_2,
+            "changed_bits": changed_std,
+            "total_bits": total_std,
+            "percent": pct_std,
+        },
+        "sbox44": {
+            "ct1": ct_44_1,
+            "ct2": ct_44_2,
+            "changed_bits": changed_44,
+            "total_bits": total_44,
+            "percent": pct_44,
+        }
+    }
+
+
+# @title
+# ===========================================
+# Cell 8 — Analisis S-Box per bit (NL & SAC)
+# ===========================================
+
+from math import sqrt
+
+# -------------------------------------------
+# 1. Konversi S-Box → 8 fungsi Boolean (tiap bit)
+# -------------------------------------------
+
+def sbox_bool_coords(sbox):
+    """
+    Mengubah S-Box ukuran 256 → 8 fungsi Boolean.
+    coords[i][x] = bit ke-i dari sbox[x], untuk i=0..7, x=0..255
+    """
+    coords = []
+    for bit in range(8):
+        f = []
+        for x in range(256):
+            f.append((sbox[x] >> bit) & 1)
+        coords.append(f)
+    return coords  # list 8 elemen, masing-masing list 256 elemen
+
+
+# -------------------------------------------
+# 2. Walsh–Hadamard & Nonlinearity per bit
+# -------------------------------------------
+# Fast Walsh–Hadamard transform (FWHT), O(n·2^n): butterfly in-place pada
+# bentuk ±1 fungsi Boolean, F(x) = (-1)^f(x). Hasilnya W_f(w) = Σ (-1)^{f(x) ⊕ w·x}.
+# Dengan NumPy banyak fungsi ditransformasi sekaligus (satu baris per fungsi),
+# misalnya ke-255 fungsi komponen b·S(x) sebuah S-Box dalam satu panggilan.
+
+# Paritas (jumlah bit 1 mod 2) untuk tiap byte
+_PARITY = bytes(bin(v).count("1") & 1 for v in range(256))
+
+
+def fwht(values):
+    """FWHT in-place pada list integer (panjang 2^n). Return list yang sama."""
+    N = len(values)
+    h = 1
+    while h < N:
+        for i in range(0, N, 2 * h):
+            for j in range(i, i + h):
+                a, b = values[j], values[j + h]
+                values[j], values[j + h] = a + b, a - b
+        h *= 2
+    return values
+
+
+def fwht_rows(arr):
+    """FWHT in-place untuk tiap baris array NumPy 2D (C-contiguous, integer)."""
+    m, N = arr.shape
+    h = 1
+    while h < N:
+        blocks = arr.reshape(m, N // (2 * h), 2, h)
+        lo = blocks[:, :, 0, :]
+        hi = blocks[:, :, 1, :]
+        # (lo, hi) → (lo + hi, lo - hi) tanpa array sementara
+        lo += hi
+        hi *= -2
+        hi += lo
+        h *= 2
+    return arr
+
+
+def component_walsh(sbox, masks=None):
+    """
+    Walsh spectrum fungsi komponen b·S(x) untuk tiap mask output b
+    (default: semua b = 0..255). Baris ke-i = spektrum untuk masks[i],
+    kolom = mask input a. NumPy: array int32 (len(masks), 256) dari satu
+    FWHT batch; tanpa NumPy: list of list.
+    """
+    masks = range(256) if masks is None else masks
+    if np is not None:
+        s = np.asarray(sbox, dtype=np.uint8)
+        b = np.asarray(masks, dtype=np.uint8)
+        parity = np.frombuffer(_PARITY, dtype=np.uint8)
+        signs = 1 - 2 * parity[b[:, None] & s[None, :]].astype(np.int32)
+        return fwht_rows(signs)
+    return [fwht([1 - 2 * _PARITY[b & y] for y in sbox]) for b in masks]
+
+
+def walsh_spectrum(f):
+    """
+    Walsh spectrum untuk fungsi Boolean f: {0,1}^8 → {0,1}
+    f direpresentasikan sebagai list panjang 256, f[x] ∈ {0,1}.
+    """
+    return fwht([1 - 2 * v for v in f])
+
+
+def nonlinearity_from_walsh(W):
+    """
+    Nonlinearity = 2^{n-1} - (1/2) * max_{w} |W_f(w)|, n=8.
+    W boleh satu spektrum (→ float) atau batch spektrum per baris dari
+    component_walsh (→ list float).
+    """
+    n = 8
+    if np is not None and isinstance(W, np.ndarray) and W.ndim == 2:
+        return [(1 << (n - 1)) - int(m) / 2 for m in np.abs(W).max(axis=1)]
+    if len(W) and hasattr(W[0], "__len__"):
+        return [nonlinearity_from_walsh(row) for row in W]
+    max_w = max(abs(v) for v in W)
+    return (1 << (n - 1)) - max_w / 2
+
+
+def nonlinearity_per_bit(sbox):
+    """
+    Menghasilkan NL untuk tiap output bit (0..7) dari S-Box.
+    Return: list panjang 8.
+    """
+    return nonlinearity_from_walsh(component_walsh(sbox, [1 << bit for bit in range(8)]))
+
+
+def sbox_nonlinearity(sbox):
+    """
+    NL ke-255 fungsi komponen b·S(x), b ≠ 0 (satu FWHT batch).
+    NL S-Box = nilai minimumnya.
+    """
+    nl_values = nonlinearity_from_walsh(component_walsh(sbox, range(1, 256)))
+    return {
+        "min": min(nl_values),
+        "avg": sum(nl_values) / len(nl_values),
+        "all": nl_values
+    }
+
+
+# -------------------------------------------
+# 3. SAC (Strict Avalanche Criterion) per output bit
+# -------------------------------------------
+
+def sac_matrix(sbox):
+    """
+    Menghitung SAC matrix 8x8:
+    sac[i][j] = Probabilitas bit output i berubah jika input bit j di-flip.
+    Ideal: ~0.5
+    """
+    coords = sbox_bool_coords(sbox)
+    sac = [[0.0 for _ in range(8)] for _ in range(8)]
+
+    for out_bit in range(8):
+        f = coords[out_bit]
+        for in_bit in range(8):
+            cnt = 0
+            for x in range(256):
+                x2 = x ^ (1 << in_bit)
+                if f[x] != f[x2]:
+                    cnt += 1
+            sac[out_bit][in_bit] = cnt / 256.0
+    return sac
+
+
+def sac_stats_per_bit(sac_mat):
+    """
+    Dari matriks SAC 8x8, ambil:
+    - rata-rata per output bit
+    - deviasi standar per output bit (seberapa rata 0.5 di semua input bit)
+    """
+    stats = []
+    for out_bit in range(8):
+        row = sac_mat[out_bit]
+        avg = sum(row) / len(row)
+        var = sum((x - avg) ** 2 for x in row) / len(row)
+        std = sqrt(var)
+        stats.append((avg, std))
+    return stats  # list 8 elemen: (avg, std) per output bit
+
+
+# -------------------------------------------
+# 4. Fungsi ringkas untuk analisis dua S-Box
+# -------------------------------------------
+
+def analyze_sbox_per_bit(name, sbox):
+    """
+    Cetak NL & SAC per bit untuk sebuah S-Box.
+    name: label string, misal "AES" atau "SBOX44"
+    """
+    print(f"=== Analisis S-Box: {name} ===")
+    nl_list = nonlinearity_per_bit(sbox)
+    sac_mat = sac_matrix(sbox)
+    sac_stats = sac_stats_per_bit(sac_mat)
+
+    print("Bit |  NL    | SAC avg | SAC std")
+    print("--------------------------------------")
+    for bit in range(8):
+        nl = nl_list[bit]
+        sac_avg, sac_std = sac_stats[bit]
+        print(f"{bit:3d} | {nl:6.1f} | {sac_avg:7.5f} | {sac_std:7.5f}")
+    print()
+
+    # Optional: kembalikan data mentah kalau mau dipakai lagi
+    return {
+        "nl_per_bit": nl_list,
+        "sac_matrix": sac_mat,
+        "sac_stats_per_bit": sac_stats,
+    }
+
+
+# @title
+# ===========================================
+# Cell 9 — BIC, LAP, DAP, BCT (Analisis S-Box lanjutan)
+# ===========================================
+
+from math import sqrt
+
+# -------------------------------------------
+# Bit Interdependence Criterion — NL
+# -------------------------------------------
+def bic_nl(sbox):
+    # XOR dua bit output i<j = fungsi komponen dengan mask (1<<i)|(1<<j)
+    masks = [(1 << i) | (1 << j) for i in range(8) for j in range(i + 1, 8)]
+    nl_values = nonlinearity_from_walsh(component_walsh(sbox, masks))
+
+    return {
+        "min": min(nl_values),
+        "avg": sum(nl_values) / len(nl_values),
+        "all": nl_values
+    }
+
+
+# -------------------------------------------
+# Bit Interdependence Criterion — SAC
+# -------------------------------------------
+def bic_sac(sbox):
+    coords = sbox_bool_coords(sbox)
+    n = len(coords)
+    probs = []
+
+    for i in range(n):
+        for j in range(i+1, n):
+            for k in range(8):
+                cnt = 0
+                for x in range(256):
+                    x2 = x ^ (1 << k)
+                    if (coords[i][x] ^ coords[j][x]) != (coords[i][x2] ^ coords[j][x2]):
+                        cnt += 1
+                probs.append(cnt / 256.0)
+
+    return {
+        "avg": sum(probs) / len(probs),
+        "all": probs
+    }
+
+
+# -------------------------------------------
+# Linear Approximation Table (LAT)
+# -------------------------------------------
+# LAT[a][b] = #{x : a·x = b·S(x)} - 128, a = mask input, b = mask output.
+# Kolom b = W_{b·S}(a) / 2, jadi seluruh tabel = satu FWHT batch dari
+# ke-256 fungsi komponen (component_walsh), bukan loop 2^24.
+
+def linear_approximation_table(sbox):
+    """LAT 256×256: array NumPy int16 [a, b], tanpa NumPy list of list."""
+    W = component_walsh(sbox)
+    if np is not None:
+        return np.ascontiguousarray(W.T // 2, dtype=np.int16)
+    return [[W[b][a] // 2 for b in range(256)] for a in range(256)]
+
+
+def _table_row(table, a):
+    return [int(v) for v in table[a]]
+
+
+def _table_column(table, b):
+    return [int(row[b]) for row in table]
+
+
+def _nontrivial_values(table):
+    """Semua entri tabel kecuali [0][0] (selalu maksimal, tidak informatif)."""
+    if np is not None and isinstance(table, np.ndarray):
+        return table.ravel()[1:]
+    return [v for row in table for v in row][1:]
+
+
+def lat_entry(lat, a, b):
+    """Bias (×256) aproksimasi linear a·x = b·S(x)."""
+    return int(lat[a][b])
+
+
+def lat_row(lat, a):
+    """Semua mask output b untuk mask input a."""
+    return _table_row(lat, a)
+
+
+def lat_column(lat, b):
+    """Semua mask input a untuk mask output b (= W_{b·S} / 2)."""
+    return _table_column(lat, b)
+
+
+def lat_linearity(lat):
+    """Linearity L = max |W_{b·S}(a)| = 2 · max |LAT| di luar (0,0). NL S-Box = 128 - L/2."""
+    values = _nontrivial_values(lat)
+    if np is not None and isinstance(values, np.ndarray):
+        return 2 * int(np.abs(values).max())
+    return 2 * max(abs(v) for v in values)
+
+
+def lat_spectrum(lat):
+    """Spektrum linear: {|LAT[a][b]|: jumlah entri}, di luar (0,0)."""
+    values = _nontrivial_values(lat)
+    if np is not None and isinstance(values, np.ndarray):
+        counts = np.bincount(np.abs(values.astype(np.int32)))
+        return {v: int(c) for v, c in enumerate(counts) if c}
+    spectrum = {}
+    for v in values:
+        spectrum[abs(v)] = spectrum.get(abs(v), 0) + 1
+    return dict(sorted(spectrum.items()))
+
+
+def lap_from_lat(lat):
+    """LAP dari LAT: max_P = max |Σ (-1)^{a·x ⊕ b·S(x)}| / 256."""
+    P = lat_linearity(lat) / 256.0
+    bias = abs(P - 0.5)
+
+    return {
+        "max_P": P,
+        "bias": bias
+    }
+
+
+# -------------------------------------------
+# Linear Approximation Probability (LAP)
+# -------------------------------------------
+def lap_param(sbox):
+    return lap_from_lat(linear_approximation_table(sbox))
+
+
+# -------------------------------------------
+# Difference Distribution Table (DDT)
+# -------------------------------------------
+# DDT[a][b] = #{x : S(x) ⊕ S(x ⊕ a) = b}. Satu lintasan atas semua (a, x)
+# langsung memberi histogram tiap baris (bincount), bukan loop (a, b, x).
+
+def difference_distribution_table(sbox):
+    """
+    DDT 256×256: array NumPy uint16 [a, b] (uint8 tidak cukup: DDT[0][0] = 256),
+    tanpa NumPy list of list.
+    """
+    if np is not None:
+        s = np.asarray(sbox, dtype=np.uint16)
+        a = np.arange(256, dtype=np.uint16)[:, None]
+        x = np.arange(256, dtype=np.uint16)[None, :]
+        flat = (a << 8) | (s[x] ^ s[x ^ a])
+        counts = np.bincount(flat.ravel(), minlength=1 << 16)
+        return counts.astype(np.uint16).reshape(256, 256)
+
+    table = []
+    for a in range(256):
+        row = [0] * 256
+        for x in range(256):
+            row[sbox[x] ^ sbox[x ^ a]] += 1
+        table.append(row)
+    return table
+
+
+def ddt_entry(ddt, a, b):
+    """Jumlah x dengan S(x) ⊕ S(x ⊕ a) = b."""
+    return int(ddt[a][b])
+
+
+def ddt_row(ddt, a):
+    """Distribusi beda output untuk beda input a."""
+    return _table_row(ddt, a)
+
+
+def ddt_column(ddt, b):
+    """Jumlah pasangan per beda input a yang menghasilkan beda output b."""
+    return _table_column(ddt, b)
+
+
+def differential_uniformity(ddt):
+    """δ = max DDT[a][b] untuk a ≠ 0."""
+    if np is not None and isinstance(ddt, np.ndarray):
+        return int(ddt[1:].max())
+    return max(max(row) for row in ddt[1:])
+
+
+def differential_spectrum(ddt):
+    """Spektrum diferensial: {nilai DDT: jumlah entri} untuk a ≠ 0."""
+    if np is not None and isinstance(ddt, np.ndarray):
+        counts = np.bincount(ddt[1:].ravel())
+        return {v: int(c) for v, c in enumerate(counts) if c}
+    spectrum = {}
+    for row in ddt[1:]:
+        for v in row:
+            spectrum[v] = spectrum.get(v, 0) + 1
+    return dict(sorted(spectrum.items()))
+
+
+def dap_from_ddt(ddt):
+    """DAP dari DDT: max_P = δ / 256."""
+    return {
+        "max_P": differential_uniformity(ddt) / 256.0
+    }
+
+
+# -------------------------------------------
+# Differential Approximation Probability (DAP)
+# -------------------------------------------
+def dap_param(sbox):
+    return dap_from_ddt(difference_distribution_table(sbox))
+
+
+# -------------------------------------------
+# Boomerang Connectivity Table (BCT)
+# -------------------------------------------
+# BCT[a][b] = #{x : S⁻¹(S(x) ⊕ b) ⊕ S⁻¹(S(x ⊕ a) ⊕ b) = a}  (Cid dkk., 2018).
+# Baris a = 0 dan kolom b = 0 selalu 256. Dengan NumPy semua (b, x) untuk
+# sekelompok a dihitung sekaligus lewat tabel invers.
+
+# Jumlah baris a per batch NumPy (BCT_CHUNK × 256 × 256 elemen sementara)
+BCT_CHUNK = 16
+
+
+def boomerang_connectivity_table(sbox):
+    """BCT 256×256 untuk S-Box bijektif: array NumPy uint16 [a, b], tanpa NumPy list of list."""
+    if len(sbox) != 256 or len(set(sbox)) != 256:
+        raise ValueError("S-Box harus bijektif (permutasi 0..255) untuk BCT.")
+    inv = inverse_sbox(sbox)
+
+    if np is not None:
+        s = np.asarray(sbox, dtype=np.uint8)
+        inv_np = np.asarray(inv, dtype=np.uint8)
+        x = np.arange(256, dtype=np.uint8)
+        b = x[None, :, None]
+        table = np.empty((256, 256), dtype=np.uint16)
+        for start in range(0, 256, BCT_CHUNK):
+            a = np.arange(start, start + BCT_CHUNK, dtype=np.uint8)[:, None, None]
+            y0 = s[x][None, None, :]
+            y1 = s[x[None, None, :] ^ a]
+            back = inv_np[y0 ^ b] ^ inv_np[y1 ^ b]          # (a, b, x)
+            table[start:start + BCT_CHUNK] = (back == a).sum(axis=2)
+        return table
+
+    table = []
+    for a in range(256):
+        pairs = [(sbox[x], sbox[x ^ a]) for x in range(256)]
+        table.append([
+            sum(1 for y0, y1 in pairs if inv[y0 ^ b] ^ inv[y1 ^ b] == a)
+            for b in range(256)
+        ])
+    return table
+
+
+def boomerang_uniformity(bct):
+    """β = max BCT[a][b] untuk a ≠ 0 dan b ≠ 0."""
+    if np is not None and isinstance(bct, np.ndarray):
+        return int(bct[1:, 1:].max())
+    return max(max(row[1:]) for row in bct[1:])
+
+
+def bct_param(sbox):
+    bct = boomerang_connectivity_table(sbox)
+    uniformity = boomerang_uniformity(bct)
+
+    return {
+        "uniformity": uniformity,
+        "max_P": uniformity / 256.0
+    }
+
+
+# -------------------------------------------
+# Fungsi wrapper untuk bandingkan dua S-Box
+# -------------------------------------------
+def analyze_advanced(name, sbox):
+    print(f"=== Advanced Analysis: {name} ===")
+
+    bic_nl_res  = bic_nl(sbox)
+    bic_sac_res = bic_sac(sbox)
+    lap_res     = lap_param(sbox)
+    dap_res     = dap_param(sbox)
+    bct_res     = bct_param(sbox)
+
+    print(f"BIC-NL (min) : {bic_nl_res['min']:.1f}")
+    print(f"BIC-NL (avg) : {bic_nl_res['avg']:.1f}")
+    print(f"BIC-SAC(avg) : {bic_sac_res['avg']:.5f}")
+    print(f"LAP bias    : {lap_res['bias']:.6f}")
+    print(f"DAP max P   : {dap_res['max_P']:.6f}")
+    print(f"BCT unif.   : {bct_res['uniformity']}")
+    print()
+
+    return {
+        "bic_nl": bic_nl_res,
+        "bic_sac": bic_sac_res,
+        "lap": lap_res,
+        "dap": dap_res,
+        "bct": bct_res,
+    }
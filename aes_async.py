@@ -0,0 +1,249 @@
+"""
+API asyncio untuk enkripsi/dekripsi bulk & streaming aes_backend.
+
+Kerja blok tidak pernah jalan di event loop: data dipecah per chunk lalu
+dikirim ke executor (thread atau proses). Jumlah chunk yang jalan bersamaan
+dibatasi semaphore, jadi payload besar tidak memonopoli executor dan latensi
+request lain di loop tidak bergantung pada payload terbesar.
+Pembatalan (task.cancel()) berlaku di antara chunk: chunk yang sedang jalan
+selesai di executor, chunk berikutnya tidak dijalankan.
+
+    ac = AsyncCipher(key, sbox=SBOX44, executor="process", max_concurrency=4)
+    ct = await ac.encrypt_ecb(data)
+    async for out in ac.aiter_decrypt(chunks):
+        ...
+"""
+
+import asyncio
+import os
+import weakref
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+import aes_backend as ab
+
+# Default ukuran chunk per task executor (kelipatan 16)
+ASYNC_CHUNK_SIZE = 1 << 20
+
+_SHARED_EXECUTORS = {}
+
+
+def shared_executor(kind="thread") -> Executor:
+    """Executor bersama per jenis ("thread" / "process"), dibuat saat pertama dipakai."""
+    ex = _SHARED_EXECUTORS.get(kind)
+    if ex is None:
+        if kind == "thread":
+            ex = ThreadPoolExecutor(thread_name_prefix="aes-async")
+        elif kind == "process":
+            ex = ProcessPoolExecutor()
+        else:
+            raise ValueError(f"Jenis executor tidak dikenal: {kind!r} (pilih 'thread' atau 'process').")
+        _SHARED_EXECUTORS[kind] = ex
+    return ex
+
+
+# ===========================================
+# Sisi executor (harus bisa di-pickle untuk ProcessPoolExecutor)
+# ===========================================
+
+def _crypt_chunk(key_bytes, sbox, op, data, arg=None) -> bytes:
+    # get_cipher di-cache per proses: key diekspansi sekali per worker
+    cipher = ab.get_cipher(key_bytes, sbox)
+    if op == "encrypt":
+        return cipher.encrypt_blocks(data)
+    if op == "decrypt":
+        return cipher.decrypt_blocks(data)
+    iv, offset = arg
+    return ab.ctr_crypt(cipher, iv, data, offset)
+
+
+class _Aligner:
+    """
+    Potong aliran chunk jadi kelipatan 16 byte (tanpa kerja cipher; itu di executor).
+    holdback=True → blok terakhir ditahan sampai finalize (untuk unpad).
+    """
+
+    def __init__(self, holdback=False):
+        self.holdback = holdback
+        self._buf = bytearray()
+
+    def update(self, data) -> bytes:
+        buf = self._buf
+        buf += data
+        n = len(buf) - len(buf) % 16
+        if self.holdback and n == len(buf):
+            n -= 16
+        if n <= 0:
+            return b""
+        out = bytes(buf[:n])
+        del buf[:n]
+        return out
+
+    def finalize(self) -> bytes:
+        tail = bytes(self._buf)
+        self._buf.clear()
+        return tail
+
+
+# ===========================================
+# AsyncCipher
+# ===========================================
+
+class AsyncCipher:
+    """
+    Konteks cipher untuk asyncio.
+    executor        : "thread" / "process" (executor bersama) atau Executor sendiri.
+    max_concurrency : batas chunk yang jalan bersamaan untuk cipher ini.
+    limiter         : asyncio.Semaphore bersama untuk membatasi lintas beberapa cipher
+                      (terikat ke satu event loop, seperti semua primitive asyncio).
+    Tanpa limiter, tiap event loop mendapat semaphore sendiri, jadi satu AsyncCipher
+    boleh dipakai di beberapa asyncio.run berturut-turut.
+    """
+
+    def __init__(self, key_bytes, sbox=ab.AES_SBOX, executor="thread", max_concurrency=None,
+                 chunk_size=ASYNC_CHUNK_SIZE, limiter=None):
+        key_bytes = bytes(key_bytes)
+        if len(key_bytes) != 16:
+            raise ValueError("Key harus 16 byte (AES-128).")
+
+        self.key = key_bytes
+        self.sbox = tuple(sbox)
+        self.executor = shared_executor(executor) if isinstance(executor, str) else executor
+        self.chunk_size = max(16, chunk_size - chunk_size % 16)
+        self.max_concurrency = max_concurrency or os.cpu_count() or 1
+        self._limiter = limiter
+        # Semaphore terikat ke event loop: satu per loop yang memakai cipher ini
+        self._semaphores = weakref.WeakKeyDictionary()
+        # Proses lain butuh salinan bytes; thread cukup memoryview (tanpa salin)
+        self._copy_chunks = isinstance(self.executor, ProcessPoolExecutor)
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        if self._limiter is not None:
+            return self._limiter
+        loop = asyncio.get_running_loop()
+        sem = self._semaphores.get(loop)
+        if sem is None:
+            sem = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return sem
+
+    async def _run(self, op, data, iv=None) -> bytes:
+        mv = ab.as_byte_view(data)
+        n = len(mv)
+        if op != "ctr" and n % 16 != 0:
+            raise ValueError("Panjang data (dalam byte) harus kelipatan 16.")
+        if n == 0:
+            return b""
+
+        loop = asyncio.get_running_loop()
+        sem = self._semaphore()
+
+        async def run_chunk(a):
+            async with sem:
+                chunk = mv[a:a + self.chunk_size]
+                if self._copy_chunks:
+                    chunk = bytes(chunk)
+                arg = (iv, a) if op == "ctr" else None
+                return await loop.run_in_executor(
+                    self.executor, _crypt_chunk, self.key, self.sbox, op, chunk, arg
+                )
+
+        # gather membatalkan semua chunk yang belum jalan kalau task ini dibatalkan
+        parts = await asyncio.gather(*(run_chunk(a) for a in range(0, n, self.chunk_size)))
+        return b"".join(parts)
+
+    # --------------------------
+    # Bulk
+    # --------------------------
+    async def encrypt_blocks(self, data) -> bytes:
+        """ECB tanpa padding (panjang kelipatan 16)."""
+        return await self._run("encrypt", data)
+
+    async def decrypt_blocks(self, data) -> bytes:
+        return await self._run("decrypt", data)
+
+    async def encrypt_ecb(self, data) -> bytes:
+        return await self.encrypt_blocks(ab.pkcs7_pad(bytes(data), 16))
+
+    async def decrypt_ecb(self, data) -> bytes:
+        return ab.pkcs7_unpad(await self.decrypt_blocks(data))
+
+    async def ctr_crypt(self, data, iv) -> bytes:
+        """CTR (enkripsi = dekripsi); tiap chunk menghitung counter dari offset-nya."""
+        if len(iv) != 16:
+            raise ValueError("IV/counter awal CTR harus 16 byte.")
+        return await self._run("ctr", data, bytes(iv))
+
+    # --------------------------
+    # Streaming (async iterator)
+    # --------------------------
+    async def _stream(self, chunks, decrypt):
+        aligner = _Aligner(holdback=decrypt)
+        crypt = self.decrypt_blocks if decrypt else self.encrypt_blocks
+
+        async for chunk in _aiter(chunks):
+            block = aligner.update(chunk)
+            if block:
+                yield await crypt(block)
+
+        tail = aligner.finalize()
+        if decrypt:
+            if len(tail) != 16:
+                raise ValueError("Panjang ciphertext (dalam byte) harus kelipatan 16.")
+            yield ab.pkcs7_unpad(await crypt(tail))
+        else:
+            yield await crypt(ab.pkcs7_pad(tail, 16))
+
+    def aiter_encrypt(self, chunks):
+        """Async generator: iterable/async iterable chunk plaintext → chunk ciphertext (ECB + PKCS7)."""
+        return self._stream(chunks, decrypt=False)
+
+    def aiter_decrypt(self, chunks):
+        """Async generator: chunk ciphertext → chunk plaintext."""
+        return self._stream(chunks, decrypt=True)
+
+
+async def _aiter(chunks):
+    if hasattr(chunks, "__aiter__"):
+        async for chunk in chunks:
+            yield chunk
+    else:
+        for chunk in chunks:
+            yield chunk
+            await asyncio.sleep(0)   # beri giliran ke task lain di antara chunk
+
+
+# ===========================================
+# Fungsi praktis
+# ===========================================
+
+async def encrypt_ecb_async(data, key_bytes, sbox=ab.AES_SBOX, executor="thread") -> bytes:
+    """Versi async dari AESCipher.encrypt_ecb."""
+    return await AsyncCipher(key_bytes, sbox, executor).encrypt_ecb(data)
+
+
+async def decrypt_ecb_async(data, key_bytes, sbox=ab.AES_SBOX, executor="thread") -> bytes:
+    return await AsyncCipher(key_bytes, sbox, executor).decrypt_ecb(data)
+
+
+async def encrypt_aes_44_str_async(plaintext: str, key_str: str) -> str:
+    """Versi async encrypt_aes_44_str (untuk service asyncio)."""
+    return await asyncio.get_running_loop().run_in_executor(
+        shared_executor("thread"), ab.encrypt_aes_44_str, plaintext, key_str
+    )
+
+
+async def decrypt_aes_44_str_async(cipher_hex: str, key_str: str) -> str:
+    return await asyncio.get_running_loop().run_in_executor(
+        shared_executor("thread"), ab.decrypt_aes_44_str, cipher_hex, key_str
+    )
+
+
+async def encrypt_aes_std_str_async(plaintext: str, key_str: str) -> str:
+    return await asyncio.get_running_loop().run_in_executor(
+        shared_executor("thread"), ab.encrypt_aes_std_str, plaintext, key_str
+    )
+
+
+async def decrypt_aes_std_str_async(cipher_hex: str, key_str: str) -> str:
+    return await asyncio.get_running_loop().run_in_executor(
+        shared_executor("thread"), ab.decrypt_aes_std_str, cipher_hex, key_str
+    )
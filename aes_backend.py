@@ -5,986 +5,136 @@ Automatically generated by Colab.
 
 Original file is located at
     https://colab.research.google.com/drive/1zxF-agauLrEEQYM4DU3KOmUQt-IY7iph
-"""
-
-
-
-# Array S-BOX
-
-# AES S-Box Standar
-AES_SBOX = [
-    99,124,119,123,242,107,111,197,48,1,103,43,254,215,171,118,
-    202,130,201,125,250,89,71,240,173,212,162,175,156,164,114,192,
-    183,253,147,38,54,63,247,204,52,165,229,241,113,216,49,21,
-    4,199,35,195,24,150,5,154,7,18,128,226,235,39,178,117,
-    9,131,44,26,27,110,90,160,82,59,214,179,41,227,47,132,
-    83,209,0,237,32,252,177,91,106,203,190,57,74,76,88,207,
-    208,239,170,251,67,77,51,133,69,249,2,127,80,60,159,168,
-    81,163,64,143,146,157,56,245,188,182,218,33,16,255,243,210,
-    205,12,19,236,95,151,68,23,196,167,126,61,100,93,25,115,
-    96,129,79,220,34,42,144,136,70,238,184,20,222,94,11,219,
-    224,50,58,10,73,6,36,92,194,211,172,98,145,149,228,121,
-    231,200,55,109,141,213,78,169,108,86,244,234,101,122,174,8,
-    186,120,37,46,28,166,180,198,232,221,116,31,75,189,139,138,
-    112,62,181,102,72,3,246,14,97,53,87,185,134,193,29,158,
-    225,248,152,17,105,217,142,148,155,30,135,233,206,85,40,223,
-    140,161,137,13,191,230,66,104,65,153,45,15,176,84,187,22,
-]
-
-# SBOX44 (Proposed)
-SBOX44 = [
-    99,205,85,71,25,127,113,219,63,244,109,159,11,228,94,214,
-    77,177,201,78,5,48,29,30,87,96,193,80,156,200,216,86,
-    116,143,10,14,54,169,148,68,49,75,171,157,92,114,188,194,
-    121,220,131,210,83,135,250,149,253,72,182,33,190,141,249,82,
-    232,50,21,84,215,242,180,198,168,167,103,122,152,162,145,184,
-    43,237,119,183,7,12,125,55,252,206,235,160,140,133,179,192,
-    110,176,221,134,19,6,187,59,26,129,112,73,175,45,24,218,
-    44,66,151,32,137,31,35,147,236,247,117,132,79,136,154,105,
-    199,101,203,52,57,4,153,197,88,76,202,174,233,62,208,91,
-    231,53,1,124,0,28,142,170,158,51,226,65,123,186,239,246,
-    38,56,36,108,8,126,9,189,81,234,212,224,13,3,40,64,
-    172,74,181,118,39,227,130,89,245,166,16,61,106,196,211,107,
-    229,195,138,18,93,207,240,95,58,255,209,217,15,111,46,173,
-    223,42,115,238,139,243,23,98,100,178,37,97,191,213,222,155,
-    165,2,146,204,120,241,163,128,22,90,60,185,67,34,27,248,
-    164,69,41,230,104,47,144,251,20,17,150,225,254,161,102,70,
-]
-
-# ===========================================
-# Cell 2 — Fungsi dasar AES (manual)
-# ===========================================
-
-# Operasi xtime: perkalian dengan 0x02 di GF(2^8)
-def xtime(a):
-    return ((a << 1) ^ 0x1B) & 0xFF if a & 0x80 else (a << 1) & 0xFF
-
-# Perkalian GF(2^8) general untuk inv_mix_columns
-def gmul(a, b):
-    p = 0
-    for _ in range(8):
-        if b & 1:
-            p ^= a
-        hi = a & 0x80
-        a = (a << 1) & 0xFF
-        if hi:
-            a ^= 0x1B
-        b >>= 1
-    return p & 0xFF
-
-# Tambah round key = XOR byte ke byte
-def add_round_key(state, round_key):
-    return [s ^ rk for s, rk in zip(state, round_key)]
-
-# PKCS7 Padding (untuk teks bebas panjang)
-def pkcs7_pad(data: bytes, block_size=16) -> bytes:
-    pad_len = block_size - (len(data) % block_size)
-    return data + bytes([pad_len]) * pad_len
-
-def pkcs7_unpad(data: bytes) -> bytes:
-    pad_len = data[-1]
-    return data[:-pad_len]
-
-# Helper debug — print state dalam bentuk kotak 4x4
-def print_state(state, label="State"):
-    print(f"{label}:")
-    for i in range(4):
-        row = state[i*4:(i+1)*4]
-        print(" ".join(f"{x:02X}" for x in row))
-    print()
-
-# ===========================================
-# Cell 3 — Core AES (untuk AES standar)
-# ===========================================
-
-Nb = 4   # block size (4 kolom, 4x4 = 16 byte)
-Nk = 4   # key length (4 word = 16 byte)
-Nr = 10  # jumlah ronde AES-128
-
-# --------------------------
-# 1. Invers S-Box AES
-# --------------------------
-INV_AES_SBOX = [0] * 256
-for i, v in enumerate(AES_SBOX):
-    INV_AES_SBOX[v] = i
-
-# --------------------------
-# 2. SubBytes & InvSubBytes
-# --------------------------
-def sub_bytes_aes(state):
-    """Substitusi byte menggunakan AES_SBOX."""
-    return [AES_SBOX[b] for b in state]
-
-def inv_sub_bytes_aes(state):
-    """Substitusi balik menggunakan INV_AES_SBOX."""
-    return [INV_AES_SBOX[b] for b in state]
-
-# --------------------------
-# 3. ShiftRows & InvShiftRows
-# --------------------------
-def shift_rows(state):
-    """
-    Representasi state sebagai array 16 byte:
-    [s0, s1, s2, s3, s4, s5, ... s15]
-    Dianggap dalam urutan column-major (4x4).
-    Implementasi ini mengikuti standard AES.
-    """
-    return [
-        state[0],  state[5],  state[10], state[15],
-        state[4],  state[9],  state[14], state[3],
-        state[8],  state[13], state[2],  state[7],
-        state[12], state[1],  state[6],  state[11],
-    ]
-
-def inv_shift_rows(state):
-    return [
-        state[0],  state[13], state[10], state[7],
-        state[4],  state[1],  state[14], state[11],
-        state[8],  state[5],  state[2],  state[15],
-        state[12], state[9],  state[6],  state[3],
-    ]
-
-# --------------------------
-# 4. MixColumns & InvMixColumns
-# --------------------------
-def mix_single_column(col):
-    """
-    MixColumns untuk 1 kolom (4 byte).
-    col: list panjang 4.
-    """
-    t = col[0] ^ col[1] ^ col[2] ^ col[3]
-    u = col[0]
-    col[0] ^= t ^ xtime(col[0] ^ col[1])
-    col[1] ^= t ^ xtime(col[1] ^ col[2])
-    col[2] ^= t ^ xtime(col[2] ^ col[3])
-    col[3] ^= t ^ xtime(col[3] ^ u)
-    return col
-
-def mix_columns(state):
-    """MixColumns untuk seluruh state (16 byte)."""
-    state = state[:]  # copy biar tidak in-place ke argumen
-    for i in range(0, 16, 4):
-        col = state[i:i+4]
-        col = mix_single_column(col)
-        state[i:i+4] = col
-    return state
-
-def inv_mix_columns(state):
-    """Inverse MixColumns (pakai gmul)."""
-    state = state[:]
-    for i in range(0, 16, 4):
-        a0, a1, a2, a3 = state[i:i+4]
-        state[i+0] = gmul(a0,0x0e) ^ gmul(a1,0x0b) ^ gmul(a2,0x0d) ^ gmul(a3,0x09)
-        state[i+1] = gmul(a0,0x09) ^ gmul(a1,0x0e) ^ gmul(a2,0x0b) ^ gmul(a3,0x0d)
-        state[i+2] = gmul(a0,0x0d) ^ gmul(a1,0x09) ^ gmul(a2,0x0e) ^ gmul(a3,0x0b)
-        state[i+3] = gmul(a0,0x0b) ^ gmul(a1,0x0d) ^ gmul(a2,0x09) ^ gmul(a3,0x0e)
-    return state
-
-# --------------------------
-# 5. Key Expansion (AES standar)
-# --------------------------
-Rcon = [0x01,0x02,0x04,0x08,0x10,0x20,0x40,0x80,0x1B,0x36]
-
-def key_expansion_aes(key_bytes: bytes):
-    """
-    Ekspansi key AES-128:
-    - Input: 16 byte (128-bit key)
-    - Output: 176 byte (11 round key * 16)
-    """
-    assert len(key_bytes) == 16, "Key harus 16 byte (AES-128)."
-
-    # Mulai dari key asli (4 word pertama)
-    key_schedule = list(key_bytes)
-
-    # Tiap iterasi menghasilkan 4 byte tambahan
-    # sampai total 176 byte tercapai
-    i = Nk
-    while len(key_schedule) < 16 * (Nr + 1):
-        temp = key_schedule[-4:]  # 4 byte terakhir
-
-        if i % Nk == 0:
-            # RotWord
-            temp = temp[1:] + temp[:1]
-            # SubWord memakai AES_SBOX
-            temp = [AES_SBOX[b] for b in temp]
-            # XOR dengan Rcon
-            temp[0] ^= Rcon[(i // Nk) - 1]
-
-        # XOR dengan 4 byte ke-16 sebelumnya
-        for j in range(4):
-            temp[j] ^= key_schedule[-16 + j]
-
-        key_schedule.extend(temp)
-        i += 1
-
-    return key_schedule  # list panjang 176 byte
-
-# ===========================================
-# Cell 4 — AES standar: enkripsi & dekripsi 1 blok
-# ===========================================
-
-def aes_encrypt_block_std(block: bytes, key_bytes: bytes) -> bytes:
-    assert len(block) == 16, "Plaintext block harus 16 byte."
-    assert len(key_bytes) == 16, "Key harus 16 byte (AES-128)."
-
-    state = list(block)
-    round_keys = key_expansion_aes(key_bytes)
-
-    # Initial round
-    state = add_round_key(state, round_keys[:16])
-
-    # Main rounds (1-9)
-    for rnd in range(1, Nr):
-        state = sub_bytes_aes(state)
-        state = shift_rows(state)
-        state = mix_columns(state)
-        state = add_round_key(state, round_keys[16*rnd : 16*(rnd+1)])
-
-    # Final round (tanpa MixColumns)
-    state = sub_bytes_aes(state)
-    state = shift_rows(state)
-    state = add_round_key(state, round_keys[160:176])
-
-    return bytes(state)
-
-
-def aes_decrypt_block_std(block: bytes, key_bytes: bytes) -> bytes:
-    assert len(block) == 16, "Ciphertext block harus 16 byte."
-    assert len(key_bytes) == 16, "Key harus 16 byte (AES-128)."
-
-    state = list(block)
-    round_keys = key_expansion_aes(key_bytes)
-
-    # Initial step of decryption
-    state = add_round_key(state, round_keys[160:176])
-    state = inv_shift_rows(state)
-    state = inv_sub_bytes_aes(state)
-
-    # Rounds 9..1
-    for rnd in range(Nr-1, 0, -1):
-        state = add_round_key(state, round_keys[16*rnd : 16*(rnd+1)])
-        state = inv_mix_columns(state)
-        state = inv_shift_rows(state)
-        state = inv_sub_bytes_aes(state)
 
-    # Final round key
-    state = add_round_key(state, round_keys[:16])
-    return bytes(state)
-
-
-# ----------------------------------------------
-# Test manual NIST — Jika mau cek fungsinya
-# ----------------------------------------------
-def test_aes_block_std():
-    key_hex = "000102030405060708090A0B0C0D0E0F"
-    pt_hex  = "00112233445566778899AABBCCDDEEFF"
-    key = bytes.fromhex(key_hex)
-    pt  = bytes.fromhex(pt_hex)
-
-    ct = aes_encrypt_block_std(pt, key)
-    dec = aes_decrypt_block_std(ct, key)
-
-    print("Cipher    :", ct.hex().upper())
-    print("DecryptOK :", dec.hex().upper() == pt_hex.upper())
-
-test_aes_block_std()
-
-# ===========================================
-# Cell 5 — AES SBOX44: enkripsi & dekripsi 1 blok
-# ===========================================
-
-# Bangun inverse SBOX44
-INV_SBOX44 = [0] * 256
-for i, v in enumerate(SBOX44):
-    INV_SBOX44[v] = i
-
-# SubBytes versi SBOX44
-def sub_bytes_44(state):
-    return [SBOX44[b] for b in state]
-
-# Inverse SubBytes versi SBOX44
-def inv_sub_bytes_44(state):
-    return [INV_SBOX44[b] for b in state]
-
-# Key expansion versi SBOX44
-def key_expansion_sbox44(key_bytes: bytes):
-    assert len(key_bytes) == 16, "Key harus 16 byte (AES-128)."
-
-    key_schedule = list(key_bytes)
-    i = Nk
-
-    while len(key_schedule) < 16 * (Nr + 1):
-        temp = key_schedule[-4:]
-
-        if i % Nk == 0:
-            temp = temp[1:] + temp[:1]          # RotWord
-            temp = [SBOX44[b] for b in temp]    # SubWord dengan SBOX44
-            temp[0] ^= Rcon[(i // Nk) - 1]      # Tambah Rcon
-
-        for j in range(4):
-            temp[j] ^= key_schedule[-16 + j]
-
-        key_schedule.extend(temp)
-        i += 1
-
-    return key_schedule
-
-
-def aes_encrypt_block_44(block: bytes, key_bytes: bytes) -> bytes:
-    assert len(block) == 16
-    assert len(key_bytes) == 16
-
-    state = list(block)
-    round_keys = key_expansion_sbox44(key_bytes)
-
-    # Initial round
-    state = add_round_key(state, round_keys[:16])
-
-    # Ronde 1-9
-    for rnd in range(1, Nr):
-        state = sub_bytes_44(state)
-        state = shift_rows(state)
-        state = mix_columns(state)
-        state = add_round_key(state, round_keys[16*rnd : 16*(rnd+1)])
-
-    # Final round
-    state = sub_bytes_44(state)
-    state = shift_rows(state)
-    state = add_round_key(state, round_keys[160:176])
-
-    return bytes(state)
-
-
-def aes_decrypt_block_44(block: bytes, key_bytes: bytes) -> bytes:
-    assert len(block) == 16
-    assert len(key_bytes) == 16
-
-    state = list(block)
-    round_keys = key_expansion_sbox44(key_bytes)
-
-    # Initial decrypt step
-    state = add_round_key(state, round_keys[160:176])
-    state = inv_shift_rows(state)
-    state = inv_sub_bytes_44(state)
-
-    # Rounds 9..1
-    for rnd in range(Nr-1, 0, -1):
-        state = add_round_key(state, round_keys[16*rnd : 16*(rnd+1)])
-        state = inv_mix_columns(state)
-        state = inv_shift_rows(state)
-        state = inv_sub_bytes_44(state)
-
-    # Final round key
-    state = add_round_key(state, round_keys[:16])
-
-    return bytes(state)
+Sekarang hanya fasad: implementasi ada di aes_core (cipher & engine),
+aes_modes (API byte, streaming, mode operasi) dan aes_analysis (avalanche &
+metrik S-Box). Semua nama publik (__all__) tetap bisa di-import dari sini, dan import
+tidak menjalankan apa pun. Demo notebook: `python -m aes_backend`.
+"""
 
-# Optional: quick check
-key = b"1234567890ABCDEF"
-pt = b"ABCDEFGHIJKLMNOP"
-ct = aes_encrypt_block_44(pt, key)
-print("DecryptOK :", aes_decrypt_block_44(ct, key) == pt)
+import argparse
+import os
+
+import aes_analysis
+import aes_core
+import aes_modes
+from aes_analysis import *  # noqa: F401,F403
+from aes_analysis import (
+    analyze_advanced,
+    analyze_sbox_per_bit,
+    avalanche_plaintext,
+    key_sensitivity,
+)
+from aes_core import *  # noqa: F401,F403
+from aes_core import (
+    AES_SBOX,
+    SBOX44,
+    aes_decrypt_block_44,
+    aes_encrypt_block_44,
+    np,  # numpy opsional (None kalau tidak terpasang)
+    test_aes_block_std,
+)
+from aes_modes import *  # noqa: F401,F403
+from aes_modes import (
+    decrypt_aes_44_str,
+    decrypt_aes_std_str,
+    encrypt_aes_44_str,
+    encrypt_aes_std_str,
+)
+
+# Re-export API publik (__all__) ketiga modul supaya kode lama
+# `import aes_backend as ab; ab.xxx` tetap jalan.
+__all__ = (aes_core.__all__ + aes_modes.__all__ + aes_analysis.__all__
+           + ["np", "demo_block", "demo_strings", "demo_avalanche", "demo_sbox_analysis",
+              "run_demos"])
 
 # ===========================================
-# Cell 6 — Wrapper string (AES standar & SBOX44)
+# Profiling per tahap (opt-in, lihat aes_profile)
 # ===========================================
+# AES_PROFILE=1 → tabel waktu per tahap di stderr saat proses selesai;
+# AES_PROFILE=<file> → tabel + collapsed stack untuk flamegraph.
+if os.environ.get("AES_PROFILE"):
+    import sys
 
-def encrypt_aes_std_str(plaintext: str, key_str: str) -> str:
-    """
-    Enkripsi plaintext (string bebas panjang) dengan AES standar (ECB, 128-bit).
-    Hasil: hex string.
-    """
-    key_bytes = key_str.encode("utf-8")
-    if len(key_bytes) != 16:
-        raise ValueError("Key untuk AES standar harus 16 byte (16 karakter ASCII/UTF-8 sederhana).")
-
-    data = plaintext.encode("utf-8")
-    data_padded = pkcs7_pad(data, 16)
-
-    ciphertext = b""
-    for i in range(0, len(data_padded), 16):
-        block = data_padded[i:i+16]
-        ciphertext += aes_encrypt_block_std(block, key_bytes)
-
-    return ciphertext.hex()
-
-
-def decrypt_aes_std_str(cipher_hex: str, key_str: str) -> str:
-    """
-    Dekripsi hex string dengan AES standar (ECB, 128-bit).
-    Mengembalikan plaintext string.
-    """
-    key_bytes = key_str.encode("utf-8")
-    if len(key_bytes) != 16:
-        raise ValueError("Key untuk AES standar harus 16 byte (16 karakter ASCII/UTF-8 sederhana).")
-
-    ciphertext = bytes.fromhex(cipher_hex)
-    if len(ciphertext) % 16 != 0:
-        raise ValueError("Panjang ciphertext (dalam byte) harus kelipatan 16.")
-
-    plaintext_padded = b""
-    for i in range(0, len(ciphertext), 16):
-        block = ciphertext[i:i+16]
-        plaintext_padded += aes_decrypt_block_std(block, key_bytes)
-
-    plaintext = pkcs7_unpad(plaintext_padded)
-    return plaintext.decode("utf-8")
-
-
-def encrypt_aes_44_str(plaintext: str, key_str: str) -> str:
-    """
-    Enkripsi plaintext (string) dengan AES yang memakai SBOX44 (ECB, 128-bit).
-    Hasil: hex string.
-    """
-    key_bytes = key_str.encode("utf-8")
-    if len(key_bytes) != 16:
-        raise ValueError("Key untuk AES SBOX44 harus 16 byte (16 karakter).")
-
-    data = plaintext.encode("utf-8")
-    data_padded = pkcs7_pad(data, 16)
-
-    ciphertext = b""
-    for i in range(0, len(data_padded), 16):
-        block = data_padded[i:i+16]
-        ciphertext += aes_encrypt_block_44(block, key_bytes)
-
-    return ciphertext.hex()
-
-
-def decrypt_aes_44_str(cipher_hex: str, key_str: str) -> str:
-    """
-    Dekripsi hex string dengan AES yang memakai SBOX44 (ECB, 128-bit).
-    Mengembalikan plaintext string.
-    """
-    key_bytes = key_str.encode("utf-8")
-    if len(key_bytes) != 16:
-        raise ValueError("Key untuk AES SBOX44 harus 16 byte (16 karakter).")
+    import aes_profile
+    aes_profile.enable_from_env((aes_core, aes_modes, aes_analysis, sys.modules[__name__]))
 
-    ciphertext = bytes.fromhex(cipher_hex)
-    if len(ciphertext) % 16 != 0:
-        raise ValueError("Panjang ciphertext (dalam byte) harus kelipatan 16.")
-
-    plaintext_padded = b""
-    for i in range(0, len(ciphertext), 16):
-        block = ciphertext[i:i+16]
-        plaintext_padded += aes_decrypt_block_44(block, key_bytes)
-
-    plaintext = pkcs7_unpad(plaintext_padded)
-    return plaintext.decode("utf-8")
-
-
-# ------------------------------------------
-# Contoh test cepat (opsional)
-# ------------------------------------------
-text = "Kriptografi melindungi pesan rahasia"
-key  = "1234567890ABCDEF"   # 16 karakter
-
-ct_std = encrypt_aes_std_str(text, key)
-ct_44  = encrypt_aes_44_str(text, key)
-
-print("Cipher AES Std :", ct_std)
-print("Cipher AES 44  :", ct_44)
-print("Dec Std OK :", decrypt_aes_std_str(ct_std, key) == text)
-print("Dec 44  OK :", decrypt_aes_44_str(ct_44, key) == text)
 
 # ===========================================
-# Cell 7 — Avalanche Effect & Key Sensitivity
-# DIPERBAIKI: Gunakan hanya 1 block untuk tes avalanche
+# Demo notebook (dulu jalan saat import)
 # ===========================================
 
-def pkcs7_pad(data: bytes, block_size: int) -> bytes:
-    """Padding PKCS7 standar."""
-    padding_len = block_size - (len(data) % block_size)
-    padding = bytes([padding_len] * padding_len)
-    return data + padding
-
-
-def hex_to_bitstring(h: str) -> str:
-    """Konversi hex string → bitstring ('0101...') dengan panjang tepat."""
-    if len(h) == 0:
-        return ""
-    return bin(int(h, 16))[2:].zfill(len(h) * 4)
-
-
-def bit_diff_stats(hex1: str, hex2: str):
-    """
-    Hitung:
-    - jumlah bit berbeda
-    - total bit
-    - persentase perubahannya
-    """
-    b1 = hex_to_bitstring(hex1)
-    b2 = hex_to_bitstring(hex2)
-
-    # Samakan panjang kalau sampai beda (jaga-jaga)
-    max_len = max(len(b1), len(b2))
-    b1 = b1.zfill(max_len)
-    b2 = b2.zfill(max_len)
-
-    total = len(b1)
-    changed = sum(1 for x, y in zip(b1, b2) if x != y)
-    pct = (changed / total) * 100 if total > 0 else 0.0
-    return changed, total, pct
-
+def demo_block():
+    """Cell 4 & 5: vektor uji NIST (AES standar) dan round-trip SBOX44."""
+    test_aes_block_std()
 
-def encrypt_bytes_std(data_padded: bytes, key_bytes: bytes) -> bytes:
-    """Enkripsi data yang SUDAH dipadding (panjang kelipatan 16) dengan AES standar."""
-    assert len(data_padded) % 16 == 0
-    out = b""
-    for i in range(0, len(data_padded), 16):
-        block = data_padded[i:i+16]
-        out += aes_encrypt_block_std(block, key_bytes)
-    return out
+    key = b"1234567890ABCDEF"
+    pt = b"ABCDEFGHIJKLMNOP"
+    ct = aes_encrypt_block_44(pt, key)
+    print("DecryptOK :", aes_decrypt_block_44(ct, key) == pt)
 
 
-def encrypt_bytes_44(data_padded: bytes, key_bytes: bytes) -> bytes:
-    """Enkripsi data yang SUDAH dipadding (panjang kelipatan 16) dengan AES SBOX44."""
-    assert len(data_padded) % 16 == 0
-    out = b""
-    for i in range(0, len(data_padded), 16):
-        block = data_padded[i:i+16]
-        out += aes_encrypt_block_44(block, key_bytes)
-    return out
+def demo_strings(text="Kriptografi melindungi pesan rahasia", key="1234567890ABCDEF"):
+    """Cell 6: wrapper string."""
+    ct_std = encrypt_aes_std_str(text, key)
+    ct_44 = encrypt_aes_44_str(text, key)
 
+    print("Cipher AES Std :", ct_std)
+    print("Cipher AES 44  :", ct_44)
+    print("Dec Std OK :", decrypt_aes_std_str(ct_std, key) == text)
+    print("Dec 44  OK :", decrypt_aes_44_str(ct_44, key) == text)
 
-def avalanche_plaintext(plaintext: str, key_str: str):
-    """
-    Avalanche Effect terhadap plaintext:
-    - Flip 1 bit pada 1 byte pertama dari plaintext.
-    - Bandingkan perubahan bit HANYA pada block pertama ciphertext.
-    - Ini menghindari bias dari block yang tidak berubah di ECB mode.
-    """
-    key_bytes = key_str.encode("utf-8")
-    if len(key_bytes) != 16:
-        raise ValueError("Key harus 16 byte (16 karakter).")
 
-    pt_bytes = plaintext.encode("utf-8")
-    if len(pt_bytes) == 0:
-        raise ValueError("Plaintext tidak boleh kosong.")
+def demo_avalanche(text="Kriptografi melindungi pesan rahasia", key="1234567890ABCDEF"):
+    """Cell 7: avalanche effect & key sensitivity."""
+    res_av = avalanche_plaintext(text, key)
+    print("\n=== HASIL AKHIR ===")
+    print("Avalanche — AES Std   : {:.2f}% ({} dari {} bit)".format(
+        res_av["std"]["percent"], res_av["std"]["changed_bits"], res_av["std"]["total_bits"]
+    ))
+    print("Avalanche — AES SBOX44: {:.2f}% ({} dari {} bit)".format(
+        res_av["sbox44"]["percent"], res_av["sbox44"]["changed_bits"], res_av["sbox44"]["total_bits"]
+    ))
 
-    # Padding dulu
-    pt_padded = pkcs7_pad(pt_bytes, 16)
+    res_key = key_sensitivity(text, key)
+    print("Key Sensitivity — AES Std   : {:.2f}%".format(res_key["std"]["percent"]))
+    print("Key Sensitivity — AES SBOX44: {:.2f}%".format(res_key["sbox44"]["percent"]))
+    return res_av, res_key
 
-    # Buat versi dimodifikasi: flip 1 bit di byte pertama
-    pt_mod = bytearray(pt_padded)
-    pt_mod[0] ^= 0x01  # flip bit LSB
-    pt_mod = bytes(pt_mod)
-
-    # Enkripsi dengan AES standar
-    ct_std_1_full = encrypt_bytes_std(pt_padded, key_bytes)
-    ct_std_2_full = encrypt_bytes_std(pt_mod,    key_bytes)
-
-    # Enkripsi dengan AES SBOX44
-    ct_44_1_full = encrypt_bytes_44(pt_padded, key_bytes)
-    ct_44_2_full = encrypt_bytes_44(pt_mod,    key_bytes)
-
-    # PERBAIKAN: Ambil HANYA block pertama (16 byte = 128 bit)
-    ct_std_1 = ct_std_1_full[:16].hex()
-    ct_std_2 = ct_std_2_full[:16].hex()
-    ct_44_1 = ct_44_1_full[:16].hex()
-    ct_44_2 = ct_44_2_full[:16].hex()
-
-    # Hitung perubahan bit
-    changed_std, total_std, pct_std = bit_diff_stats(ct_std_1, ct_std_2)
-    changed_44, total_44, pct_44   = bit_diff_stats(ct_44_1,  ct_44_2)
-
-    # Debugging output
-    print(f"\n=== DEBUG AVALANCHE PLAINTEXT ===")
-    print(f"Plaintext original (hex): {pt_padded.hex()}")
-    print(f"Plaintext modified (hex): {pt_mod.hex()}")
-    print(f"CT Std 1 (block 1 only): {ct_std_1}")
-    print(f"CT Std 2 (block 1 only): {ct_std_2}")
-    print(f"CT 44  1 (block 1 only): {ct_44_1}")
-    print(f"CT 44  2 (block 1 only): {ct_44_2}")
 
+def demo_sbox_analysis():
+    """Cell 8 & 9: NL/SAC per bit dan BIC/LAP/DAP untuk kedua S-Box."""
     return {
-        "plaintext": plaintext,
-        "key": key_str,
-        "std": {
-            "ct1": ct_std_1,
-            "ct2": ct_std_2,
-            "changed_bits": changed_std,
-            "total_bits": total_std,
-            "percent": pct_std,
+        "per_bit": {
+            "aes": analyze_sbox_per_bit("AES S-Box Standar", AES_SBOX),
+            "sbox44": analyze_sbox_per_bit("SBOX44", SBOX44),
         },
-        "sbox44": {
-            "ct1": ct_44_1,
-            "ct2": ct_44_2,
-            "changed_bits": changed_44,
-            "total_bits": total_44,
-            "percent": pct_44,
-        }
-    }
-
-
-def key_sensitivity(plaintext: str, key_str: str):
-    """
-    Key Sensitivity:
-    - Flip 1 bit pada key (byte pertama).
-    - Bandingkan perubahan bit ciphertext AES standar vs AES SBOX44.
-    """
-    key_bytes = key_str.encode("utf-8")
-    if len(key_bytes) != 16:
-        raise ValueError("Key harus 16 byte (16 karakter).")
-
-    pt_bytes = plaintext.encode("utf-8")
-    if len(pt_bytes) == 0:
-        raise ValueError("Plaintext tidak boleh kosong.")
-
-    pt_padded = pkcs7_pad(pt_bytes, 16)
-
-    # Key asli
-    key_orig = key_bytes
-
-    # Key dimodifikasi: flip 1 bit pada byte pertama
-    key_mod = bytearray(key_bytes)
-    key_mod[0] ^= 0x01
-    key_mod = bytes(key_mod)
-
-    # Enkripsi dengan AES standar
-    ct_std_1 = encrypt_bytes_std(pt_padded, key_orig).hex()
-    ct_std_2 = encrypt_bytes_std(pt_padded, key_mod).hex()
-
-    # Enkripsi dengan AES SBOX44
-    ct_44_1 = encrypt_bytes_44(pt_padded, key_orig).hex()
-    ct_44_2 = encrypt_bytes_44(pt_padded, key_mod).hex()
-
-    # Hitung perubahan bit
-    changed_std, total_std, pct_std = bit_diff_stats(ct_std_1, ct_std_2)
-    changed_44, total_44, pct_44   = bit_diff_stats(ct_44_1,  ct_44_2)
-
-    # Debugging output
-    print(f"\n=== DEBUG KEY SENSITIVITY ===")
-    print(f"Key original (hex): {key_orig.hex()}")
-    print(f"Key modified (hex): {key_mod.hex()}")
-    print(f"CT Std 1: {ct_std_1}")
-    print(f"CT Std 2: {ct_std_2}")
-    print(f"CT 44  1: {ct_44_1}")
-    print(f"CT 44  2: {ct_44_2}")
-
-    return {
-        "plaintext": plaintext,
-        "key_original": key_str,
-        "key_original_hex": key_orig.hex(),
-        "key_modified_hex": key_mod.hex(),
-        "std": {
-            "ct1": ct_std_1,
-            "ct2": ct_std_2,
-            "changed_bits": changed_std,
-            "total_bits": total_std,
-            "percent": pct_std,
+        "advanced": {
+            "aes": analyze_advanced("AES S-Box Standar", AES_SBOX),
+            "sbox44": analyze_advanced("SBOX44", SBOX44),
         },
-        "sbox44": {
-            "ct1": ct_44_1,
-            "ct2": ct_44_2,
-            "changed_bits": changed_44,
-            "total_bits": total_44,
-            "percent": pct_44,
-        }
     }
 
 
-# ------------------------------------------
-# Contoh pakai (opsional)
-# ------------------------------------------
-text = "Kriptografi melindungi pesan rahasia"
-key  = "1234567890ABCDEF"
-
-res_av = avalanche_plaintext(text, key)
-print("\n=== HASIL AKHIR ===")
-print("Avalanche — AES Std   : {:.2f}% ({} dari {} bit)".format(
-    res_av["std"]["percent"], res_av["std"]["changed_bits"], res_av["std"]["total_bits"]
-))
-print("Avalanche — AES SBOX44: {:.2f}% ({} dari {} bit)".format(
-    res_av["sbox44"]["percent"], res_av["sbox44"]["changed_bits"], res_av["sbox44"]["total_bits"]
-))
-
-res_key = key_sensitivity(text, key)
-print("Key Sensitivity — AES Std   : {:.2f}%".format(res_key["std"]["percent"]))
-print("Key Sensitivity — AES SBOX44: {:.2f}%".format(res_key["sbox44"]["percent"]))
-
-# @title
-# ===========================================
-# Cell 8 — Analisis S-Box per bit (NL & SAC)
-# ===========================================
-
-from math import sqrt
-
-# -------------------------------------------
-# 1. Konversi S-Box → 8 fungsi Boolean (tiap bit)
-# -------------------------------------------
-
-def sbox_bool_coords(sbox):
-    """
-    Mengubah S-Box ukuran 256 → 8 fungsi Boolean.
-    coords[i][x] = bit ke-i dari sbox[x], untuk i=0..7, x=0..255
-    """
-    coords = []
-    for bit in range(8):
-        f = []
-        for x in range(256):
-            f.append((sbox[x] >> bit) & 1)
-        coords.append(f)
-    return coords  # list 8 elemen, masing-masing list 256 elemen
-
-
-# -------------------------------------------
-# 2. Walsh–Hadamard & Nonlinearity per bit
-# -------------------------------------------
-
-def walsh_spectrum(f):
-    """
-    Walsh spectrum untuk fungsi Boolean f: {0,1}^8 → {0,1}
-    f direpresentasikan sebagai list panjang 256, f[x] ∈ {0,1}.
-    """
-    n = 8
-    N = 1 << n  # 256
-    W = [0] * N
-
-    for w in range(N):
-        s = 0
-        for x in range(N):
-            # inner product w·x mod 2
-            dot = bin(w & x).count("1") & 1
-            # (-1)^{f(x) ⊕ (w·x)}
-            if (f[x] ^ dot) == 0:
-                s += 1
-            else:
-                s -= 1
-        W[w] = s
-    return W
-
-
-def nonlinearity_from_walsh(W):
-    """
-    Nonlinearity = 2^{n-1} - (1/2) * max_{w} |W_f(w)|, n=8.
-    """
-    n = 8
-    max_w = max(abs(v) for v in W)
-    return (1 << (n - 1)) - max_w / 2
-
-
-def nonlinearity_per_bit(sbox):
-    """
-    Menghasilkan NL untuk tiap output bit (0..7) dari S-Box.
-    Return: list panjang 8.
-    """
-    coords = sbox_bool_coords(sbox)
-    nl_list = []
-    for bit in range(8):
-        W = walsh_spectrum(coords[bit])
-        nl = nonlinearity_from_walsh(W)
-        nl_list.append(nl)
-    return nl_list
-
-
-# -------------------------------------------
-# 3. SAC (Strict Avalanche Criterion) per output bit
-# -------------------------------------------
+def run_demos(analysis=True):
+    """Jalankan semua demo notebook secara berurutan."""
+    demo_block()
+    demo_strings()
+    demo_avalanche()
+    if analysis:
+        demo_sbox_analysis()
 
-def sac_matrix(sbox):
-    """
-    Menghitung SAC matrix 8x8:
-    sac[i][j] = Probabilitas bit output i berubah jika input bit j di-flip.
-    Ideal: ~0.5
-    """
-    coords = sbox_bool_coords(sbox)
-    sac = [[0.0 for _ in range(8)] for _ in range(8)]
 
-    for out_bit in range(8):
-        f = coords[out_bit]
-        for in_bit in range(8):
-            cnt = 0
-            for x in range(256):
-                x2 = x ^ (1 << in_bit)
-                if f[x] != f[x2]:
-                    cnt += 1
-            sac[out_bit][in_bit] = cnt / 256.0
-    return sac
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m aes_backend", description="Demo notebook AES vs SBOX44.")
+    parser.add_argument("--no-analysis", action="store_true",
+                        help="lewati analisis S-Box (NL/SAC/BIC/LAP/DAP) yang lambat")
+    args = parser.parse_args(argv)
+    run_demos(analysis=not args.no_analysis)
 
 
-def sac_stats_per_bit(sac_mat):
-    """
-    Dari matriks SAC 8x8, ambil:
-    - rata-rata per output bit
-    - deviasi standar per output bit (seberapa rata 0.5 di semua input bit)
-    """
-    stats = []
-    for out_bit in range(8):
-        row = sac_mat[out_bit]
-        avg = sum(row) / len(row)
-        var = sum((x - avg) ** 2 for x in row) / len(row)
-        std = sqrt(var)
-        stats.append((avg, std))
-    return stats  # list 8 elemen: (avg, std) per output bit
-
-
-# -------------------------------------------
-# 4. Fungsi ringkas untuk analisis dua S-Box
-# -------------------------------------------
-
-def analyze_sbox_per_bit(name, sbox):
-    """
-    Cetak NL & SAC per bit untuk sebuah S-Box.
-    name: label string, misal "AES" atau "SBOX44"
-    """
-    print(f"=== Analisis S-Box: {name} ===")
-    nl_list = nonlinearity_per_bit(sbox)
-    sac_mat = sac_matrix(sbox)
-    sac_stats = sac_stats_per_bit(sac_mat)
-
-    print("Bit |  NL    | SAC avg | SAC std")
-    print("--------------------------------------")
-    for bit in range(8):
-        nl = nl_list[bit]
-        sac_avg, sac_std = sac_stats[bit]
-        print(f"{bit:3d} | {nl:6.1f} | {sac_avg:7.5f} | {sac_std:7.5f}")
-    print()
-
-    # Optional: kembalikan data mentah kalau mau dipakai lagi
-    return {
-        "nl_per_bit": nl_list,
-        "sac_matrix": sac_mat,
-        "sac_stats_per_bit": sac_stats,
-    }
-
-
-# -------------------------------------------
-# 5. Contoh pemanggilan (opsional)
-# -------------------------------------------
-data_aes   = analyze_sbox_per_bit("AES S-Box Standar", AES_SBOX)
-data_sbox44 = analyze_sbox_per_bit("SBOX44", SBOX44)
-
-# @title
-# ===========================================
-# Cell 9 — BIC, LAP, DAP (Analisis S-Box lanjutan)
-# ===========================================
-
-from math import sqrt
-
-# -------------------------------------------
-# Bit Interdependence Criterion — NL
-# -------------------------------------------
-def bic_nl(sbox):
-    coords = sbox_bool_coords(sbox)
-    n = len(coords)  # =8
-
-    nl_values = []
-
-    for i in range(n):
-        for j in range(i+1, n):
-            # Kombinasi XOR dua fungsi Boolean
-            f = [coords[i][x] ^ coords[j][x] for x in range(256)]
-            W = walsh_spectrum(f)
-            nl_values.append(nonlinearity_from_walsh(W))
-
-    return {
-        "min": min(nl_values),
-        "avg": sum(nl_values) / len(nl_values),
-        "all": nl_values
-    }
-
-
-# -------------------------------------------
-# Bit Interdependence Criterion — SAC
-# -------------------------------------------
-def bic_sac(sbox):
-    coords = sbox_bool_coords(sbox)
-    n = len(coords)
-    probs = []
-
-    for i in range(n):
-        for j in range(i+1, n):
-            for k in range(8):
-                cnt = 0
-                for x in range(256):
-                    x2 = x ^ (1 << k)
-                    if (coords[i][x] ^ coords[j][x]) != (coords[i][x2] ^ coords[j][x2]):
-                        cnt += 1
-                probs.append(cnt / 256.0)
-
-    return {
-        "avg": sum(probs) / len(probs),
-        "all": probs
-    }
-
-
-# -------------------------------------------
-# Linear Approximation Probability (LAP)
-# -------------------------------------------
-def lap_param(sbox):
-    max_S = 0
-    for a in range(256):
-        for b in range(256):
-            if a == 0 and b == 0:
-                continue
-            S = 0
-            for x in range(256):
-                fx = sbox[x]
-                # parity of dot products
-                v = (bin(a & x).count("1") + bin(b & fx).count("1")) & 1
-                S += 1 if v == 0 else -1
-            max_S = max(max_S, abs(S))
-
-    P = max_S / 256.0
-    bias = abs(P - 0.5)
-
-    return {
-        "max_P": P,
-        "bias": bias
-    }
-
-
-# -------------------------------------------
-# Differential Approximation Probability (DAP)
-# -------------------------------------------
-def dap_param(sbox):
-    max_P = 0.0
-    for a in range(1, 256):  # a=0 trivial
-        for b in range(256):
-            cnt = 0
-            for x in range(256):
-                if (sbox[x] ^ sbox[x ^ a]) == b:
-                    cnt += 1
-            P = cnt / 256.0
-            max_P = max(max_P, P)
-
-    return {
-        "max_P": max_P
-    }
-
-
-# -------------------------------------------
-# Fungsi wrapper untuk bandingkan dua S-Box
-# -------------------------------------------
-def analyze_advanced(name, sbox):
-    print(f"=== Advanced Analysis: {name} ===")
-
-    bic_nl_res  = bic_nl(sbox)
-    bic_sac_res = bic_sac(sbox)
-    lap_res     = lap_param(sbox)
-    dap_res     = dap_param(sbox)
-
-    print(f"BIC-NL (min) : {bic_nl_res['min']:.1f}")
-    print(f"BIC-NL (avg) : {bic_nl_res['avg']:.1f}")
-    print(f"BIC-SAC(avg) : {bic_sac_res['avg']:.5f}")
-    print(f"LAP bias    : {lap_res['bias']:.6f}")
-    print(f"DAP max P   : {dap_res['max_P']:.6f}")
-    print()
-
-    return {
-        "bic_nl": bic_nl_res,
-        "bic_sac": bic_sac_res,
-        "lap": lap_res,
-        "dap": dap_res,
-    }
-
-
-# -------------------------------------------
-# Contoh (opsional)
-# -------------------------------------------
-res_aes   = analyze_advanced("AES S-Box Standar", AES_SBOX)
-res_44    = analyze_advanced("SBOX44", SBOX44)
+if __name__ == "__main__":
+    main()
 
 # Commented out IPython magic to ensure Python compatibility.
 # # @title
@@ -2882,6 +2032,3 @@ res_44    = analyze_advanced("SBOX44", SBOX44)
 # public_url = ngrok.connect(port).public_url
 # print("Akses Streamlit di URL berikut:")
 # print(public_url)
-
-
-
@@ -0,0 +1,392 @@
+"""
+Benchmark hot path aes_backend: blok, bulk per backend, mode, dan analisis S-Box.
+
+    python -m aes_bench -o hasil.json
+    python -m aes_bench --quick --filter bulk --compare baseline.json
+    python -m aes_bench --filter import --import-budget 0.3
+
+Tiap kasus diulang `repeat` kali; jumlah panggilan per ulangan dikalibrasi
+otomatis supaya tiap ulangan >= min_time. Hasil: wall time (mean/stdev/min/
+median per panggilan), blok/s, MB/s dan cycles/byte (kalau frekuensi CPU
+diketahui) — ditulis sebagai JSON untuk dibandingkan antar-run.
+Kelompok "import" mengukur import tiap modul di interpreter baru dan gagal
+(exit 1) kalau melebihi anggaran waktu import.
+"""
+
+import argparse
+import contextlib
+import functools
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+import aes_backend as ab
+
+KEY = bytes(range(16))
+IV = bytes(range(16, 32))
+
+SBOXES = {
+    "std": ab.AES_SBOX,
+    "44": ab.SBOX44,
+}
+
+BULK_SIZES = (1 << 10, 1 << 16, 1 << 20)
+QUICK_SIZES = (1 << 10, 1 << 16)
+
+# Backend dengan speed di bawah ini hanya diukur sampai ukuran ini (bisa puluhan detik per MB)
+SLOW_BACKEND_SPEED = 30
+SLOW_BACKEND_MAX_SIZE = 1 << 16
+
+# Kenaikan waktu (relatif) yang dianggap regresi oleh --compare
+REGRESSION_THRESHOLD = 0.10
+
+# Anggaran waktu import per modul (detik, di luar start-up interpreter kosong)
+IMPORT_BUDGET = 0.5
+IMPORT_MODULES = ("aes_core", "aes_modes", "aes_analysis", "aes_backend")
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+# ===========================================
+# Pengukuran
+# ===========================================
+
+def cpu_hz():
+    """Frekuensi CPU (Hz) dari /proc/cpuinfo, atau None kalau tidak tersedia."""
+    try:
+        with open("/proc/cpuinfo") as f:
+            for line in f:
+                if line.lower().startswith("cpu mhz"):
+                    return float(line.split(":")[1]) * 1e6
+    except OSError:
+        pass
+    return None
+
+
+def measure(fn, repeat=5, min_time=0.05):
+    """Waktu per panggilan (detik) untuk `repeat` ulangan; jumlah panggilan dikalibrasi."""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or number >= 1 << 20:
+            break
+        number *= 2 if elapsed <= 0 else max(2, min(10, int(min_time / elapsed) + 1))
+
+    times = [elapsed / number]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        times.append((time.perf_counter() - start) / number)
+    return times, number
+
+
+class Case:
+    """
+    Satu kasus benchmark: fungsi tanpa argumen + jumlah byte yang diproses per panggilan.
+    setup: opsional, membangun fungsi tersebut (beserta fixture mahal) baru saat
+    kasus dijalankan, jadi kasus yang tersaring --filter tidak memakan waktu.
+    """
+
+    def __init__(self, group, name, fn=None, n_bytes=None, setup=None, **params):
+        self.group = group
+        self.name = name
+        self.fn = fn
+        self.setup = setup
+        self.n_bytes = n_bytes
+        self.params = params
+
+    @property
+    def key(self):
+        extra = ",".join(f"{k}={v}" for k, v in sorted(self.params.items()))
+        return f"{self.group}/{self.name}" + (f"[{extra}]" if extra else "")
+
+    def run(self, repeat, min_time, hz):
+        fn = self.setup() if self.setup is not None else self.fn
+        # Fungsi analisis mencetak debug; jangan ikut diukur ke terminal
+        with contextlib.redirect_stdout(io.StringIO()):
+            fn()   # pemanasan (cache tabel, self-check backend, kompilasi)
+            times, number = measure(fn, repeat, min_time)
+
+        mean = statistics.fmean(times)
+        result = {
+            "key": self.key,
+            "group": self.group,
+            "name": self.name,
+            "params": self.params,
+            "bytes": self.n_bytes,
+            "wall": {
+                "mean": mean,
+                "stdev": statistics.stdev(times) if len(times) > 1 else 0.0,
+                "min": min(times),
+                "median": statistics.median(times),
+                "repeat": repeat,
+                "number": number,
+            },
+        }
+        if self.n_bytes:
+            result["blocks_per_s"] = (self.n_bytes / 16) / mean
+            result["mb_per_s"] = self.n_bytes / mean / 1e6
+            result["cycles_per_byte"] = mean * hz / self.n_bytes if hz else None
+        return result
+
+
+# ===========================================
+# Daftar kasus
+# ===========================================
+
+def _import_cases():
+    env = {k: v for k, v in os.environ.items() if k != "AES_PROFILE"}
+
+    def importer(stmt):
+        cmd = [sys.executable, "-c", stmt]
+        return lambda: subprocess.run(cmd, check=True, cwd=_HERE, env=env)
+
+    cases = [Case("import", "python", importer("pass"))]
+    cases += [Case("import", name, importer(f"import {name}")) for name in IMPORT_MODULES]
+    return cases
+
+
+def _block_cases():
+    block = bytes(range(16))
+    ct_std = ab.aes_encrypt_block_std(block, KEY)
+    ct_44 = ab.aes_encrypt_block_44(block, KEY)
+    return [
+        Case("block", "aes_encrypt_block_std", lambda: ab.aes_encrypt_block_std(block, KEY), 16),
+        Case("block", "aes_decrypt_block_std", lambda: ab.aes_decrypt_block_std(ct_std, KEY), 16),
+        Case("block", "aes_encrypt_block_44", lambda: ab.aes_encrypt_block_44(block, KEY), 16),
+        Case("block", "aes_decrypt_block_44", lambda: ab.aes_decrypt_block_44(ct_44, KEY), 16),
+        Case("block", "key_expansion_aes", lambda: ab.key_expansion_aes(KEY)),
+        Case("block", "key_expansion_sbox44", lambda: ab.key_expansion_sbox44(KEY)),
+        Case("block", "AESCipher", lambda: ab.AESCipher(KEY, ab.SBOX44)),
+    ]
+
+
+@functools.lru_cache(maxsize=None)
+def _payload(size):
+    return bytes(i & 0xFF for i in range(size))
+
+
+def _bind(fn, size):
+    """Setup lazy: fn(payload) dengan payload dibuat saat kasus dijalankan."""
+    data = _payload(size)
+    return lambda: fn(data)
+
+
+def _bulk_setup(sbox, backend, size, decrypt):
+    cipher = ab.AESCipher(KEY, sbox, backend=backend)
+    data = _payload(size)
+    if decrypt:
+        ct = cipher.encrypt_blocks(data)
+        return lambda: cipher.decrypt_blocks(ct)
+    return lambda: cipher.encrypt_blocks(data)
+
+
+def _bulk_cases(sizes, backends=None):
+    cases = []
+    for sbox_name, sbox in SBOXES.items():
+        for backend in ab.available_backends(sbox):
+            if backends and backend.name not in backends:
+                continue
+            for size in sizes:
+                if backend.speed < SLOW_BACKEND_SPEED and size > SLOW_BACKEND_MAX_SIZE:
+                    continue
+                params = {"sbox": sbox_name, "backend": backend.name, "size": size}
+                for name, decrypt in (("encrypt_blocks", False), ("decrypt_blocks", True)):
+                    setup = functools.partial(_bulk_setup, sbox, backend.name, size, decrypt)
+                    cases.append(Case("bulk", name, n_bytes=size, setup=setup, **params))
+
+    for size in sizes:
+        cases.append(Case("bulk", "encrypt_bytes_std", n_bytes=size, size=size,
+                          setup=functools.partial(_bind, lambda d: ab.encrypt_bytes_std(d, KEY), size)))
+        cases.append(Case("bulk", "encrypt_bytes_44", n_bytes=size, size=size,
+                          setup=functools.partial(_bind, lambda d: ab.encrypt_bytes_44(d, KEY), size)))
+    return cases
+
+
+def _mode_cases(sizes):
+    cases = []
+    for sbox_name, sbox in SBOXES.items():
+        cipher = ab.get_cipher(KEY, sbox)
+        fns = {
+            "cbc_encrypt": lambda d, c=cipher: ab.cbc_encrypt_blocks(c, IV, d),
+            "cbc_decrypt": lambda d, c=cipher: ab.cbc_decrypt_blocks(c, IV, d),
+            "ctr": lambda d, c=cipher: ab.ctr_crypt(c, IV, d),
+            "cfb_encrypt": lambda d, c=cipher: ab.cfb_encrypt(c, IV, d),
+            "cfb_decrypt": lambda d, c=cipher: ab.cfb_decrypt(c, IV, d),
+            "ofb": lambda d, c=cipher: ab.ofb_crypt(c, IV, d),
+            "gcm_encrypt": lambda d, s=sbox: ab.encrypt_gcm(d, KEY, IV[:12], sbox=s),
+        }
+        for size in sizes:
+            params = {"sbox": sbox_name, "size": size}
+            cases += [Case("mode", name, n_bytes=size, setup=functools.partial(_bind, fn, size),
+                           **params) for name, fn in fns.items()]
+    return cases
+
+
+def _analysis_cases():
+    text = "Kriptografi melindungi pesan rahasia"
+    key_str = "1234567890ABCDEF"
+    cases = [
+        Case("analysis", "avalanche_plaintext", lambda: ab.avalanche_plaintext(text, key_str)),
+        Case("analysis", "key_sensitivity", lambda: ab.key_sensitivity(text, key_str)),
+    ]
+    for sbox_name, sbox in SBOXES.items():
+        f0 = ab.sbox_bool_coords(sbox)[0]
+        fns = {
+            "walsh_spectrum": lambda f=f0: ab.walsh_spectrum(f),
+            "nonlinearity_per_bit": lambda s=sbox: ab.nonlinearity_per_bit(s),
+            "component_walsh": lambda s=sbox: ab.component_walsh(s),
+            "sbox_nonlinearity": lambda s=sbox: ab.sbox_nonlinearity(s),
+            "sac_matrix": lambda s=sbox: ab.sac_matrix(s),
+            "bic_nl": lambda s=sbox: ab.bic_nl(s),
+            "bic_sac": lambda s=sbox: ab.bic_sac(s),
+            "linear_approximation_table": lambda s=sbox: ab.linear_approximation_table(s),
+            "lap_param": lambda s=sbox: ab.lap_param(s),
+            "difference_distribution_table": lambda s=sbox: ab.difference_distribution_table(s),
+            "dap_param": lambda s=sbox: ab.dap_param(s),
+            "bct_param": lambda s=sbox: ab.bct_param(s),
+        }
+        cases += [Case("analysis", name, fn, sbox=sbox_name) for name, fn in fns.items()]
+    return cases
+
+
+def collect_cases(sizes=BULK_SIZES, backends=None):
+    return (_import_cases() + _block_cases() + _bulk_cases(sizes, backends)
+            + _mode_cases(sizes) + _analysis_cases())
+
+
+# ===========================================
+# Run, simpan, bandingkan
+# ===========================================
+
+def metadata(hz):
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "cpu_hz": hz,
+        "numpy": getattr(ab.np, "__version__", None),
+        "backends": [b.name for b in ab.available_backends(ab.AES_SBOX)],
+    }
+
+
+def run_suite(cases, repeat=5, min_time=0.05, hz=None, log=sys.stderr):
+    results = []
+    for case in cases:
+        res = case.run(repeat, min_time, hz)
+        results.append(res)
+        if log is not None:
+            print(format_result(res), file=log, flush=True)
+    return results
+
+
+def format_result(res):
+    wall = res["wall"]
+    line = f"{res['key']:<70} {wall['mean'] * 1e3:10.3f} ms ±{wall['stdev'] * 1e3:8.3f}"
+    if "mb_per_s" in res:
+        line += f"  {res['mb_per_s']:9.3f} MB/s  {res['blocks_per_s']:12,.0f} blok/s"
+        if res["cycles_per_byte"] is not None:
+            line += f"  {res['cycles_per_byte']:10.1f} c/B"
+    return line
+
+
+def check_import_budget(results, budget=IMPORT_BUDGET, log=sys.stderr):
+    """
+    Tandai hasil import yang (min - start-up interpreter) melebihi budget.
+    Return: daftar key yang melebihi anggaran.
+    """
+    base = next((r["wall"]["min"] for r in results if r["key"] == "import/python"), 0.0)
+    over = []
+    for res in results:
+        if res["group"] != "import" or res["name"] == "python":
+            continue
+        res["import_time"] = res["wall"]["min"] - base
+        res["budget"] = budget
+        res["over_budget"] = res["import_time"] > budget
+        if res["over_budget"]:
+            over.append(res["key"])
+            print(f"{res['key']}: import {res['import_time']:.3f} s > anggaran {budget:.3f} s", file=log)
+    return over
+
+
+def compare(results, baseline, threshold=REGRESSION_THRESHOLD, log=sys.stderr):
+    """
+    Bandingkan dengan baseline (JSON run sebelumnya) memakai waktu minimum,
+    yang paling tahan noise. Return: daftar key yang regresi.
+    """
+    base = {r["key"]: r["wall"]["min"] for r in baseline["results"]}
+    regressions = []
+    for res in results:
+        old = base.get(res["key"])
+        if not old:
+            continue
+        ratio = res["wall"]["min"] / old
+        flag = ""
+        if ratio > 1 + threshold:
+            regressions.append(res["key"])
+            flag = "  REGRESI"
+        print(f"{res['key']:<70} x{ratio:6.2f}{flag}", file=log)
+    return regressions
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m aes_bench", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-o", "--output", help="tulis hasil JSON ke file ini ('-' untuk stdout)")
+    parser.add_argument("--quick", action="store_true", help="ukuran lebih sedikit & repeat 3")
+    parser.add_argument("--sizes", type=int, nargs="+", help="ukuran pesan (byte, kelipatan 16)")
+    parser.add_argument("--backends", nargs="+", choices=tuple(ab.BACKENDS), help="batasi backend bulk")
+    parser.add_argument("--filter", help="hanya kasus yang key-nya mengandung teks ini")
+    parser.add_argument("--repeat", type=int, help="jumlah ulangan per kasus (default: 5)")
+    parser.add_argument("--min-time", type=float, default=0.05, help="durasi minimal per ulangan (detik)")
+    parser.add_argument("--cpu-ghz", type=float, help="frekuensi CPU untuk cycles/byte (default: /proc/cpuinfo)")
+    parser.add_argument("--compare", help="JSON baseline; exit 1 kalau ada regresi")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD,
+                        help="ambang regresi relatif (default: %(default)s)")
+    parser.add_argument("--import-budget", type=float, default=IMPORT_BUDGET,
+                        help="anggaran waktu import per modul dalam detik (default: %(default)s)")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    sizes = args.sizes or (QUICK_SIZES if args.quick else BULK_SIZES)
+    repeat = args.repeat or (3 if args.quick else 5)
+    hz = args.cpu_ghz * 1e9 if args.cpu_ghz else cpu_hz()
+
+    cases = collect_cases(sizes, args.backends)
+    if args.filter:
+        cases = [c for c in cases if args.filter in c.key]
+
+    report = {
+        "meta": metadata(hz),
+        "results": run_suite(cases, repeat, args.min_time, hz),
+    }
+    failed = bool(check_import_budget(report["results"], args.import_budget))
+
+    if args.output == "-":
+        json.dump(report, sys.stdout, indent=2)
+    elif args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        failed |= bool(compare(report["results"], baseline, args.threshold))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,361 @@
+"""
+CLI enkripsi/dekripsi bulk (file, direktori, stdin/stdout) + laporan throughput.
+
+    python -m aes_cli encrypt data.bin --key 1234567890ABCDEF --sbox 44 --mode ctr
+    python -m aes_cli decrypt data.bin.enc --key 1234567890ABCDEF --sbox 44 --mode ctr
+    python -m aes_cli encrypt dir_input -o dir_output --key-hex 00112233... --workers 8
+    cat x | python -m aes_cli encrypt - --key ... > x.enc
+
+Format file: ECB tanpa header; mode lain diawali IV (16 byte, GCM 12 byte)
+dan GCM ditutup tag 16 byte. Padding PKCS7 hanya untuk ECB & CBC.
+Di akhir dicetak (stderr) total byte, waktu, MB/s dan blok/s.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import aes_backend as ab
+from aes_parallel import ParallelCipher
+
+SBOXES = {
+    "std": ab.AES_SBOX,
+    "44": ab.SBOX44,
+}
+
+MODES = ("ecb", "cbc", "ctr", "cfb", "ofb", "gcm")
+
+# Panjang IV yang ditulis di awal file per mode
+IV_SIZES = {"ecb": 0, "gcm": 12}
+
+GCM_TAG_SIZE = 16
+
+
+# ===========================================
+# Stream per mode (update → bytes, finalize → bytes)
+# ===========================================
+
+class _ECBStream(ab.BlockStream):
+    """ECB streaming; `crypt` bisa diganti ParallelCipher (lihat --workers)."""
+
+    def __init__(self, cipher, decrypt, engine=None):
+        super().__init__(cipher, holdback=decrypt)
+        self.decrypt = decrypt
+        engine = engine or cipher
+        self._crypt = engine.decrypt_blocks if decrypt else engine.encrypt_blocks
+
+    def _process(self, mv):
+        return self._crypt(mv)
+
+    def _final(self, tail):
+        if not self.decrypt:
+            return self._crypt(ab.pkcs7_pad(tail, 16))
+        if len(tail) != 16:
+            raise ValueError("Panjang ciphertext (dalam byte) harus kelipatan 16.")
+        return ab.pkcs7_unpad(self._crypt(tail))
+
+
+class _CBCStream(ab.BlockStream):
+    def __init__(self, cipher, iv, decrypt):
+        super().__init__(cipher, holdback=decrypt)
+        self.decrypt = decrypt
+        self.iv = bytes(iv)
+
+    def _process(self, mv):
+        if self.decrypt:
+            out = ab.cbc_decrypt_blocks(self.cipher, self.iv, mv)
+            self.iv = bytes(mv[-16:])
+        else:
+            out = ab.cbc_encrypt_blocks(self.cipher, self.iv, mv)
+            self.iv = out[-16:]
+        return out
+
+    def _final(self, tail):
+        if not self.decrypt:
+            return self._process(memoryview(ab.pkcs7_pad(tail, 16)))
+        if len(tail) != 16:
+            raise ValueError("Panjang ciphertext (dalam byte) harus kelipatan 16.")
+        return ab.pkcs7_unpad(self._process(memoryview(tail)))
+
+
+class _CFBStream(ab.BlockStream):
+    """CFB-128 tanpa padding; IV berikutnya = blok ciphertext terakhir."""
+
+    def __init__(self, cipher, iv, decrypt):
+        super().__init__(cipher)
+        self.decrypt = decrypt
+        self.iv = bytes(iv)
+
+    def _process(self, mv):
+        if self.decrypt:
+            out = ab.cfb_decrypt(self.cipher, self.iv, mv)
+            self.iv = bytes(mv[-16:])
+        else:
+            out = ab.cfb_encrypt(self.cipher, self.iv, mv)
+            self.iv = out[-16:]
+        return out
+
+    def _final(self, tail):
+        return self._process(memoryview(tail)) if tail else b""
+
+
+class _OFBStream(ab.BlockStream):
+    """OFB tanpa padding; IV berikutnya = blok keystream terakhir."""
+
+    def __init__(self, cipher, iv, decrypt):
+        super().__init__(cipher)
+        self.iv = bytes(iv)
+
+    def _process(self, mv):
+        out = ab.ofb_crypt(self.cipher, self.iv, mv)
+        self.iv = ab.xor_bytes(out[-16:], mv[-16:])
+        return out
+
+    def _final(self, tail):
+        return self._process(memoryview(tail)) if tail else b""
+
+
+class _CTRStream:
+    def __init__(self, cipher, iv, decrypt, engine=None):
+        self.cipher = cipher
+        self.iv = bytes(iv)
+        self.offset = 0
+        self._engine = engine
+
+    def update(self, data) -> bytes:
+        if self._engine is not None and self.offset % 16 == 0 and len(data) % 16 == 0:
+            out = self._engine.ctr_crypt(data, self._iv_at(self.offset))
+        else:
+            out = ab.ctr_crypt(self.cipher, self.iv, data, self.offset)
+        self.offset += len(data)
+        return out
+
+    def _iv_at(self, offset):
+        return ((int.from_bytes(self.iv, "big") + offset // 16) & ab.MASK128).to_bytes(16, "big")
+
+    def finalize(self) -> bytes:
+        return b""
+
+
+class _GCMStream:
+    """GCM: enkripsi menambahkan tag di akhir; dekripsi menahan 16 byte terakhir (tag)."""
+
+    def __init__(self, cipher, iv, decrypt):
+        self.decrypt = decrypt
+        self._ctx = (ab.GCMDecryptor if decrypt else ab.GCMEncryptor)(cipher, iv)
+        self._tail = bytearray()
+
+    def update(self, data) -> bytes:
+        if not self.decrypt:
+            return self._ctx.update(data)
+        buf = self._tail
+        buf += data
+        n = len(buf) - GCM_TAG_SIZE
+        if n <= 0:
+            return b""
+        out = self._ctx.update(bytes(buf[:n]))
+        del buf[:n]
+        return out
+
+    def finalize(self) -> bytes:
+        if not self.decrypt:
+            out = self._ctx.finalize()
+            return out + self._ctx.tag
+        if len(self._tail) != GCM_TAG_SIZE:
+            raise ValueError("Ciphertext GCM terlalu pendek (tag 16 byte tidak ada).")
+        return self._ctx.finalize(bytes(self._tail))
+
+
+def make_stream(mode, cipher, iv, decrypt, engine=None):
+    """Stream untuk mode tertentu; engine = ParallelCipher opsional (ECB & CTR)."""
+    if mode == "ecb":
+        return _ECBStream(cipher, decrypt, engine)
+    if mode == "ctr":
+        return _CTRStream(cipher, iv, decrypt, engine)
+    cls = {"cbc": _CBCStream, "cfb": _CFBStream, "ofb": _OFBStream, "gcm": _GCMStream}[mode]
+    return cls(cipher, iv, decrypt)
+
+
+# ===========================================
+# Proses satu input
+# ===========================================
+
+def _read_exact(fin, n) -> bytes:
+    buf = b""
+    while len(buf) < n:
+        chunk = fin.read(n - len(buf))
+        if not chunk:
+            break
+        buf += chunk
+    return buf
+
+
+def crypt_stream(fin, fout, args, cipher, engine=None) -> int:
+    """Enkripsi/dekripsi fin → fout. Return: jumlah byte input yang diproses."""
+    decrypt = args.command == "decrypt"
+    iv_size = IV_SIZES.get(args.mode, 16)
+    total = 0
+
+    if decrypt:
+        iv = _read_exact(fin, iv_size)
+        if len(iv) != iv_size:
+            raise ValueError(f"Input terlalu pendek: IV {iv_size} byte tidak ada.")
+        total += iv_size
+    else:
+        iv = bytes.fromhex(args.iv_hex) if args.iv_hex else os.urandom(iv_size)
+        if len(iv) != iv_size:
+            raise ValueError(f"IV mode {args.mode.upper()} harus {iv_size} byte.")
+        fout.write(iv)
+
+    stream = make_stream(args.mode, cipher, iv, decrypt, engine)
+    read_size = args.chunk_size * (args.workers if engine is not None else 1)
+    while True:
+        chunk = fin.read(read_size)
+        if not chunk:
+            break
+        total += len(chunk)
+        out = stream.update(chunk)
+        if out:
+            fout.write(out)
+    fout.write(stream.finalize())
+    return total
+
+
+def _default_output(path, decrypt):
+    if decrypt:
+        return path[:-4] if path.endswith(".enc") else path + ".dec"
+    return path + ".enc"
+
+
+def iter_jobs(inputs, output, decrypt):
+    """(src, dst) untuk tiap file; direktori ditelusuri rekursif dan strukturnya dicerminkan."""
+    if len(inputs) > 1 and output and output != "-" and not os.path.isdir(output):
+        # Semua input akan menimpa file output yang sama
+        raise ValueError("Lebih dari satu input: -o harus direktori yang sudah ada atau '-'.")
+    for src in inputs:
+        if src == "-":
+            yield "-", output or "-"
+        elif os.path.isdir(src):
+            root_out = output or (src.rstrip(os.sep) + (".dec" if decrypt else ".enc"))
+            for dirpath, _, filenames in os.walk(src):
+                rel = os.path.relpath(dirpath, src)
+                for name in sorted(filenames):
+                    yield (os.path.join(dirpath, name),
+                           os.path.normpath(os.path.join(root_out, rel, name)))
+        elif output and os.path.isdir(output):
+            yield src, os.path.join(output, os.path.basename(_default_output(src, decrypt)))
+        else:
+            yield src, output or _default_output(src, decrypt)
+
+
+def run_job(src, dst, args, cipher, engine=None) -> int:
+    if src == "-":
+        fin = sys.stdin.buffer
+    else:
+        fin = open(src, "rb")
+    try:
+        if dst == "-":
+            return crypt_stream(fin, sys.stdout.buffer, args, cipher, engine)
+        if src != "-" and os.path.exists(dst) and os.path.samefile(src, dst):
+            raise ValueError(f"Output sama dengan input: {dst}")
+        out_dir = os.path.dirname(dst) or "."
+        os.makedirs(out_dir, exist_ok=True)
+        # Tulis ke file sementara di direktori yang sama, lalu ganti atomik saat sukses
+        fd, tmp = tempfile.mkstemp(dir=out_dir, prefix="." + os.path.basename(dst), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fout:
+                total = crypt_stream(fin, fout, args, cipher, engine)
+            os.replace(tmp, dst)
+            return total
+        except BaseException:
+            # Jangan tinggalkan output setengah jadi / gagal verifikasi
+            os.remove(tmp)
+            raise
+    finally:
+        if fin is not sys.stdin.buffer:
+            fin.close()
+
+
+# ===========================================
+# Entry point
+# ===========================================
+
+def parse_key(args) -> bytes:
+    key_bytes = bytes.fromhex(args.key_hex) if args.key_hex else args.key.encode("utf-8")
+    if len(key_bytes) != 16:
+        raise ValueError("Key harus 16 byte (AES-128).")
+    return key_bytes
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m aes_cli",
+        description="Enkripsi/dekripsi file, direktori, atau stdin/stdout dengan AES (standar / SBOX44).",
+    )
+    parser.add_argument("command", choices=("encrypt", "decrypt"))
+    parser.add_argument("inputs", nargs="+", help="file, direktori, atau '-' untuk stdin")
+    parser.add_argument("-o", "--output", help="file/direktori output, atau '-' untuk stdout")
+    key = parser.add_mutually_exclusive_group(required=True)
+    key.add_argument("--key", help="key 16 karakter (UTF-8)")
+    key.add_argument("--key-hex", help="key 16 byte dalam hex")
+    parser.add_argument("--iv-hex", help="IV tetap, hanya untuk satu input (default: acak per file, ditulis di awal file)")
+    parser.add_argument("--sbox", choices=tuple(SBOXES), default="std")
+    parser.add_argument("--mode", choices=MODES, default="ecb")
+    parser.add_argument("--chunk-size", type=int, default=ab.STREAM_CHUNK_SIZE,
+                        help="ukuran chunk baca dalam byte (default: %(default)s)")
+    parser.add_argument("--backend", choices=tuple(ab.BACKENDS),
+                        help="paksa backend engine blok (default: otomatis)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="jumlah proses worker untuk ECB/CTR (default: %(default)s)")
+    parser.add_argument("-q", "--quiet", action="store_true", help="jangan cetak laporan throughput")
+    return parser
+
+
+def report(n_bytes, elapsed, n_files, stream=sys.stderr):
+    elapsed = max(elapsed, 1e-9)
+    print(
+        f"{n_files} input, {n_bytes} byte dalam {elapsed:.3f} s — "
+        f"{n_bytes / elapsed / 1e6:.2f} MB/s, {(n_bytes / 16) / elapsed:,.0f} blok/s",
+        file=stream,
+    )
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    args.chunk_size = max(16, args.chunk_size - args.chunk_size % 16)
+
+    try:
+        key_bytes = parse_key(args)
+        sbox = SBOXES[args.sbox]
+        cipher = ab.get_cipher(key_bytes, sbox, args.backend)
+        jobs = list(iter_jobs(args.inputs, args.output, args.command == "decrypt"))
+        if args.iv_hex and args.command == "encrypt" and len(jobs) > 1:
+            # IV sama untuk beberapa file = keystream/nonce dipakai ulang (CTR, GCM, OFB, CFB)
+            raise ValueError("--iv-hex hanya boleh untuk satu input; tanpa --iv-hex tiap file mendapat IV acak.")
+
+        engine = None
+        if args.workers > 1 and args.mode in ("ecb", "ctr"):
+            engine = ParallelCipher(key_bytes, sbox, args.workers, args.chunk_size, args.backend)
+
+        total = 0
+        start = time.perf_counter()
+        try:
+            for src, dst in jobs:
+                total += run_job(src, dst, args, cipher, engine)
+        finally:
+            if engine is not None:
+                engine.close()
+        elapsed = time.perf_counter() - start
+    except (ValueError, OSError) as exc:
+        parser.exit(1, f"error: {exc}\n")
+
+    if not args.quiet:
+        report(total, elapsed, len(jobs))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,1735 @@
+# -*- coding: utf-8 -*-
+"""
+Core AES-128 untuk S-Box apa pun (AES standar & SBOX44).
+
+Berisi S-Box, fungsi dasar AES (versi list), key expansion, enkripsi/dekripsi
+1 blok, engine cepat (T-table, batch NumPy, bitsliced, unrolled) dan registry
+backend. Import modul ini tidak menjalankan apa pun selain membangun konstanta.
+"""
+
+__all__ = [
+    "AES_SBOX", "SBOX44", "xtime", "gmul", "add_round_key", "pkcs7_pad",
+    "pkcs7_unpad_length", "pkcs7_unpad", "print_state", "Nb", "Nk", "Nr",
+    "INV_AES_SBOX", "sub_bytes_aes", "inv_sub_bytes_aes", "shift_rows",
+    "inv_shift_rows", "mix_single_column", "mix_columns", "inv_mix_columns", "Rcon",
+    "key_expansion_aes", "aes_encrypt_block_std", "aes_decrypt_block_std",
+    "test_aes_block_std", "INV_SBOX44", "sub_bytes_44", "inv_sub_bytes_44",
+    "key_expansion_sbox44", "aes_encrypt_block_44", "aes_decrypt_block_44",
+    "key_expansion_sbox", "bytes_to_words", "words_to_bytes", "build_t_tables",
+    "ttable_encrypt_block", "aes_encrypt_block_ttable", "build_inv_t_tables",
+    "equivalent_inverse_round_keys", "ttable_decrypt_block", "aes_decrypt_block_ttable",
+    "inverse_sbox", "AESCipher", "get_cipher", "as_byte_view", "padded_length",
+    "BATCH_MIN_BLOCKS", "SHIFT_ROWS_IDX", "INV_SHIFT_ROWS_IDX", "as_block_array",
+    "batch_encrypt_blocks", "batch_decrypt_blocks", "sbox_anf", "anf_circuit",
+    "get_sbox_circuit", "eval_circuit", "bitslice_pack", "bitslice_unpack",
+    "bitsliced_encrypt_blocks", "bitsliced_decrypt_blocks", "COMPILED_CACHE_MAX",
+    "CompiledCipher", "generate_cipher_source", "compile_cipher", "ALL_MODES",
+    "MASK128", "INTO_CHUNK_SIZE", "CipherBackend", "BACKENDS", "register_backend",
+    "get_backend", "sub_bytes", "reference_encrypt_block", "reference_decrypt_block",
+    "available_backends", "select_backend", "native_mode_impl",
+]
+
+# Array S-BOX
+
+# AES S-Box Standar
+AES_SBOX = [
+    99,124,119,123,242,107,111,197,48,1,103,43,254,215,171,118,
+    202,130,201,125,250,89,71,240,173,212,162,175,156,164,114,192,
+    183,253,147,38,54,63,247,204,52,165,229,241,113,216,49,21,
+    4,199,35,195,24,150,5,154,7,18,128,226,235,39,178,117,
+    9,131,44,26,27,110,90,160,82,59,214,179,41,227,47,132,
+    83,209,0,237,32,252,177,91,106,203,190,57,74,76,88,207,
+    208,239,170,251,67,77,51,133,69,249,2,127,80,60,159,168,
+    81,163,64,143,146,157,56,245,188,182,218,33,16,255,243,210,
+    205,12,19,236,95,151,68,23,196,167,126,61,100,93,25,115,
+    96,129,79,220,34,42,144,136,70,238,184,20,222,94,11,219,
+    224,50,58,10,73,6,36,92,194,211,172,98,145,149,228,121,
+    231,200,55,109,141,213,78,169,108,86,244,234,101,122,174,8,
+    186,120,37,46,28,166,180,198,232,221,116,31,75,189,139,138,
+    112,62,181,102,72,3,246,14,97,53,87,185,134,193,29,158,
+    225,248,152,17,105,217,142,148,155,30,135,233,206,85,40,223,
+    140,161,137,13,191,230,66,104,65,153,45,15,176,84,187,22,
+]
+
+# SBOX44 (Proposed)
+SBOX44 = [
+    99,205,85,71,25,127,113,219,63,244,109,159,11,228,94,214,
+    77,177,201,78,5,48,29,30,87,96,193,80,156,200,216,86,
+    116,143,10,14,54,169,148,68,49,75,171,157,92,114,188,194,
+    121,220,131,210,83,135,250,149,253,72,182,33,190,141,249,82,
+    232,50,21,84,215,242,180,198,168,167,103,122,152,162,145,184,
+    43,237,119,183,7,12,125,55,252,206,235,160,140,133,179,192,
+    110,176,221,134,19,6,187,59,26,129,112,73,175,45,24,218,
+    44,66,151,32,137,31,35,147,236,247,117,132,79,136,154,105,
+    199,101,203,52,57,4,153,197,88,76,202,174,233,62,208,91,
+    231,53,1,124,0,28,142,170,158,51,226,65,123,186,239,246,
+    38,56,36,108,8,126,9,189,81,234,212,224,13,3,40,64,
+    172,74,181,118,39,227,130,89,245,166,16,61,106,196,211,107,
+    229,195,138,18,93,207,240,95,58,255,209,217,15,111,46,173,
+    223,42,115,238,139,243,23,98,100,178,37,97,191,213,222,155,
+    165,2,146,204,120,241,163,128,22,90,60,185,67,34,27,248,
+    164,69,41,230,104,47,144,251,20,17,150,225,254,161,102,70,
+]
+
+# ===========================================
+# Cell 2 — Fungsi dasar AES (manual)
+# ===========================================
+
+# Operasi xtime: perkalian dengan 0x02 di GF(2^8)
+def xtime(a):
+    return ((a << 1) ^ 0x1B) & 0xFF if a & 0x80 else (a << 1) & 0xFF
+
+# Perkalian GF(2^8) general untuk inv_mix_columns
+def gmul(a, b):
+    p = 0
+    for _ in range(8):
+        if b & 1:
+            p ^= a
+        hi = a & 0x80
+        a = (a << 1) & 0xFF
+        if hi:
+            a ^= 0x1B
+        b >>= 1
+    return p & 0xFF
+
+# Tambah round key = XOR byte ke byte
+def add_round_key(state, round_key):
+    return [s ^ rk for s, rk in zip(state, round_key)]
+
+# PKCS7 Padding (untuk teks bebas panjang)
+def pkcs7_pad(data: bytes, block_size=16) -> bytes:
+    pad_len = block_size - (len(data) % block_size)
+    return data + bytes([pad_len]) * pad_len
+
+def pkcs7_unpad_length(data, n=None, block_size=16) -> int:
+    # Validasi padding di data[:n] (semua byte pad = N); return panjang tanpa padding
+    n = len(data) if n is None else n
+    pad_len = data[n - 1] if n else 0
+    if (not 1 <= pad_len <= block_size or n % block_size
+            or bytes(data[n - pad_len:n]) != bytes([pad_len]) * pad_len):
+        raise ValueError("Padding PKCS7 tidak valid.")
+    return n - pad_len
+
+def pkcs7_unpad(data: bytes, block_size=16, strict=True) -> bytes:
+    # strict=False: perilaku lama (buang data[-1] byte tanpa validasi)
+    if not strict:
+        return data[:-data[-1]]
+    return data[:pkcs7_unpad_length(data, block_size=block_size)]
+
+# Helper debug — print state dalam bentuk kotak 4x4
+def print_state(state, label="State"):
+    print(f"{label}:")
+    for i in range(4):
+        row = state[i*4:(i+1)*4]
+        print(" ".join(f"{x:02X}" for x in row))
+    print()
+
+# ===========================================
+# Cell 3 — Core AES (untuk AES standar)
+# ===========================================
+
+Nb = 4   # block size (4 kolom, 4x4 = 16 byte)
+Nk = 4   # key length (4 word = 16 byte)
+Nr = 10  # jumlah ronde AES-128
+
+# --------------------------
+# 1. Invers S-Box AES
+# --------------------------
+INV_AES_SBOX = [0] * 256
+for i, v in enumerate(AES_SBOX):
+    INV_AES_SBOX[v] = i
+
+# --------------------------
+# 2. SubBytes & InvSubBytes
+# --------------------------
+def sub_bytes_aes(state):
+    """Substitusi byte menggunakan AES_SBOX."""
+    return [AES_SBOX[b] for b in state]
+
+def inv_sub_bytes_aes(state):
+    """Substitusi balik menggunakan INV_AES_SBOX."""
+    return [INV_AES_SBOX[b] for b in state]
+
+# --------------------------
+# 3. ShiftRows & InvShiftRows
+# --------------------------
+def shift_rows(state):
+    """
+    Representasi state sebagai array 16 byte:
+    [s0, s1, s2, s3, s4, s5, ... s15]
+    Dianggap dalam urutan column-major (4x4).
+    Implementasi ini mengikuti standard AES.
+    """
+    return [
+        state[0],  state[5],  state[10], state[15],
+        state[4],  state[9],  state[14], state[3],
+        state[8],  state[13], state[2],  state[7],
+        state[12], state[1],  state[6],  state[11],
+    ]
+
+def inv_shift_rows(state):
+    return [
+        state[0],  state[13], state[10], state[7],
+        state[4],  state[1],  state[14], state[11],
+        state[8],  state[5],  state[2],  state[15],
+        state[12], state[9],  state[6],  state[3],
+    ]
+
+# --------------------------
+# 4. MixColumns & InvMixColumns
+# --------------------------
+def mix_single_column(col):
+    """
+    MixColumns untuk 1 kolom (4 byte).
+    col: list panjang 4.
+    """
+    t = col[0] ^ col[1] ^ col[2] ^ col[3]
+    u = col[0]
+    col[0] ^= t ^ xtime(col[0] ^ col[1])
+    col[1] ^= t ^ xtime(col[1] ^ col[2])
+    col[2] ^= t ^ xtime(col[2] ^ col[3])
+    col[3] ^= t ^ xtime(col[3] ^ u)
+    return col
+
+def mix_columns(state):
+    """MixColumns untuk seluruh state (16 byte)."""
+    state = state[:]  # copy biar tidak in-place ke argumen
+    for i in range(0, 16, 4):
+        col = state[i:i+4]
+        col = mix_single_column(col)
+        state[i:i+4] = col
+    return state
+
+def inv_mix_columns(state):
+    """Inverse MixColumns (pakai gmul)."""
+    state = state[:]
+    for i in range(0, 16, 4):
+        a0, a1, a2, a3 = state[i:i+4]
+        state[i+0] = gmul(a0,0x0e) ^ gmul(a1,0x0b) ^ gmul(a2,0x0d) ^ gmul(a3,0x09)
+        state[i+1] = gmul(a0,0x09) ^ gmul(a1,0x0e) ^ gmul(a2,0x0b) ^ gmul(a3,0x0d)
+        state[i+2] = gmul(a0,0x0d) ^ gmul(a1,0x09) ^ gmul(a2,0x0e) ^ gmul(a3,0x0b)
+        state[i+3] = gmul(a0,0x0b) ^ gmul(a1,0x0d) ^ gmul(a2,0x09) ^ gmul(a3,0x0e)
+    return state
+
+# --------------------------
+# 5. Key Expansion (AES standar)
+# --------------------------
+Rcon = [0x01,0x02,0x04,0x08,0x10,0x20,0x40,0x80,0x1B,0x36]
+
+def key_expansion_aes(key_bytes: bytes):
+    """
+    Ekspansi key AES-128:
+    - Input: 16 byte (128-bit key)
+    - Output: 176 byte (11 round key * 16)
+    """
+    assert len(key_bytes) == 16, "Key harus 16 byte (AES-128)."
+
+    # Mulai dari key asli (4 word pertama)
+    key_schedule = list(key_bytes)
+
+    # Tiap iterasi menghasilkan 4 byte tambahan
+    # sampai total 176 byte tercapai
+    i = Nk
+    while len(key_schedule) < 16 * (Nr + 1):
+        temp = key_schedule[-4:]  # 4 byte terakhir
+
+        if i % Nk == 0:
+            # RotWord
+            temp = temp[1:] + temp[:1]
+            # SubWord memakai AES_SBOX
+            temp = [AES_SBOX[b] for b in temp]
+            # XOR dengan Rcon
+            temp[0] ^= Rcon[(i // Nk) - 1]
+
+        # XOR dengan 4 byte ke-16 sebelumnya
+        for j in range(4):
+            temp[j] ^= key_schedule[-16 + j]
+
+        key_schedule.extend(temp)
+        i += 1
+
+    return key_schedule  # list panjang 176 byte
+
+# ===========================================
+# Cell 4 — AES standar: enkripsi & dekripsi 1 blok
+# ===========================================
+
+def aes_encrypt_block_std(block: bytes, key_bytes: bytes) -> bytes:
+    assert len(block) == 16, "Plaintext block harus 16 byte."
+    assert len(key_bytes) == 16, "Key harus 16 byte (AES-128)."
+
+    state = list(block)
+    round_keys = key_expansion_aes(key_bytes)
+
+    # Initial round
+    state = add_round_key(state, round_keys[:16])
+
+    # Main rounds (1-9)
+    for rnd in range(1, Nr):
+        state = sub_bytes_aes(state)
+        state = shift_rows(state)
+        state = mix_columns(state)
+        state = add_round_key(state, round_keys[16*rnd : 16*(rnd+1)])
+
+    # Final round (tanpa MixColumns)
+    state = sub_bytes_aes(state)
+    state = shift_rows(state)
+    state = add_round_key(state, round_keys[160:176])
+
+    return bytes(state)
+
+
+def aes_decrypt_block_std(block: bytes, key_bytes: bytes) -> bytes:
+    assert len(block) == 16, "Ciphertext block harus 16 byte."
+    assert len(key_bytes) == 16, "Key harus 16 byte (AES-128)."
+
+    state = list(block)
+    round_keys = key_expansion_aes(key_bytes)
+
+    # Initial step of decryption
+    state = add_round_key(state, round_keys[160:176])
+    state = inv_shift_rows(state)
+    state = inv_sub_bytes_aes(state)
+
+    # Rounds 9..1
+    for rnd in range(Nr-1, 0, -1):
+        state = add_round_key(state, round_keys[16*rnd : 16*(rnd+1)])
+        state = inv_mix_columns(state)
+        state = inv_shift_rows(state)
+        state = inv_sub_bytes_aes(state)
+
+    # Final round key
+    state = add_round_key(state, round_keys[:16])
+    return bytes(state)
+
+
+# ----------------------------------------------
+# Test manual NIST — Jika mau cek fungsinya
+# ----------------------------------------------
+def test_aes_block_std():
+    key_hex = "000102030405060708090A0B0C0D0E0F"
+    pt_hex  = "00112233445566778899AABBCCDDEEFF"
+    key = bytes.fromhex(key_hex)
+    pt  = bytes.fromhex(pt_hex)
+
+    ct = aes_encrypt_block_std(pt, key)
+    dec = aes_decrypt_block_std(ct, key)
+
+    print("Cipher    :", ct.hex().upper())
+    print("DecryptOK :", dec.hex().upper() == pt_hex.upper())
+
+
+# ===========================================
+# Cell 5 — AES SBOX44: enkripsi & dekripsi 1 blok
+# ===========================================
+
+# Bangun inverse SBOX44
+INV_SBOX44 = [0] * 256
+for i, v in enumerate(SBOX44):
+    INV_SBOX44[v] = i
+
+# SubBytes versi SBOX44
+def sub_bytes_44(state):
+    return [SBOX44[b] for b in state]
+
+# Inverse SubBytes versi SBOX44
+def inv_sub_bytes_44(state):
+    return [INV_SBOX44[b] for b in state]
+
+# Key expansion versi SBOX44
+def key_expansion_sbox44(key_bytes: bytes):
+    assert len(key_bytes) == 16, "Key harus 16 byte (AES-128)."
+
+    key_schedule = list(key_bytes)
+    i = Nk
+
+    while len(key_schedule) < 16 * (Nr + 1):
+        temp = key_schedule[-4:]
+
+        if i % Nk == 0:
+            temp = temp[1:] + temp[:1]          # RotWord
+            temp = [SBOX44[b] for b in temp]    # SubWord dengan SBOX44
+            temp[0] ^= Rcon[(i // Nk) - 1]      # Tambah Rcon
+
+        for j in range(4):
+            temp[j] ^= key_schedule[-16 + j]
+
+        key_schedule.extend(temp)
+        i += 1
+
+    return key_schedule
+
+
+def aes_encrypt_block_44(block: bytes, key_bytes: bytes) -> bytes:
+    assert len(block) == 16
+    assert len(key_bytes) == 16
+
+    state = list(block)
+    round_keys = key_expansion_sbox44(key_bytes)
+
+    # Initial round
+    state = add_round_key(state, round_keys[:16])
+
+    # Ronde 1-9
+    for rnd in range(1, Nr):
+        state = sub_bytes_44(state)
+        state = shift_rows(state)
+        state = mix_columns(state)
+        state = add_round_key(state, round_keys[16*rnd : 16*(rnd+1)])
+
+    # Final round
+    state = sub_bytes_44(state)
+    state = shift_rows(state)
+    state = add_round_key(state, round_keys[160:176])
+
+    return bytes(state)
+
+
+def aes_decrypt_block_44(block: bytes, key_bytes: bytes) -> bytes:
+    assert len(block) == 16
+    assert len(key_bytes) == 16
+
+    state = list(block)
+    round_keys = key_expansion_sbox44(key_bytes)
+
+    # Initial decrypt step
+    state = add_round_key(state, round_keys[160:176])
+    state = inv_shift_rows(state)
+    state = inv_sub_bytes_44(state)
+
+    # Rounds 9..1
+    for rnd in range(Nr-1, 0, -1):
+        state = add_round_key(state, round_keys[16*rnd : 16*(rnd+1)])
+        state = inv_mix_columns(state)
+        state = inv_shift_rows(state)
+        state = inv_sub_bytes_44(state)
+
+    # Final round key
+    state = add_round_key(state, round_keys[:16])
+
+    return bytes(state)
+
+# ===========================================
+# Cell 5A — T-table engine (word-oriented, untuk S-Box apa pun)
+# ===========================================
+#
+# SubBytes + ShiftRows + MixColumns digabung jadi 4 tabel 32-bit (T0..T3).
+# Satu ronde = 16 lookup tabel + XOR pada 4 word kolom.
+# Word kolom disusun big-endian: byte baris 0 ada di bit 31..24.
+
+import struct
+
+_pack_4w = struct.Struct(">4I").pack
+_unpack_4w = struct.Struct(">4I").unpack
+
+# Cache T-table per S-Box (key: tuple S-Box)
+_TTABLE_CACHE = {}
+
+
+def key_expansion_sbox(key_bytes: bytes, sbox):
+    """Key expansion AES-128 generik: SubWord memakai `sbox` yang diberikan."""
+    assert len(key_bytes) == 16, "Key harus 16 byte (AES-128)."
+
+    key_schedule = list(key_bytes)
+    i = Nk
+    while len(key_schedule) < 16 * (Nr + 1):
+        temp = key_schedule[-4:]
+        if i % Nk == 0:
+            temp = temp[1:] + temp[:1]          # RotWord
+            temp = [sbox[b] for b in temp]      # SubWord
+            temp[0] ^= Rcon[(i // Nk) - 1]      # Rcon
+        for j in range(4):
+            temp[j] ^= key_schedule[-16 + j]
+        key_schedule.extend(temp)
+        i += 1
+
+    return key_schedule
+
+
+def bytes_to_words(data):
+    """List/bytes (kelipatan 4) → list word 32-bit big-endian."""
+    data = bytes(data)
+    return list(struct.unpack(f">{len(data) // 4}I", data))
+
+
+def words_to_bytes(words) -> bytes:
+    """List word 32-bit → bytes big-endian."""
+    return struct.pack(f">{len(words)}I", *words)
+
+
+def build_t_tables(sbox):
+    """
+    Bangun T0..T3 dari S-Box:
+    T0[x] = (2·S[x], S[x], S[x], 3·S[x]), T1..T3 = rotasi kanan 8/16/24 bit dari T0.
+    Hasil di-cache per S-Box.
+    """
+    cache_key = tuple(sbox)
+    tables = _TTABLE_CACHE.get(cache_key)
+    if tables is not None:
+        return tables
+
+    T0, T1, T2, T3 = [], [], [], []
+    for x in range(256):
+        s = sbox[x]
+        s2 = xtime(s)
+        s3 = s2 ^ s
+        w = (s2 << 24) | (s << 16) | (s << 8) | s3
+        T0.append(w)
+        T1.append(((w >> 8) | (w << 24)) & 0xFFFFFFFF)
+        T2.append(((w >> 16) | (w << 16)) & 0xFFFFFFFF)
+        T3.append(((w >> 24) | (w << 8)) & 0xFFFFFFFF)
+
+    tables = (tuple(T0), tuple(T1), tuple(T2), tuple(T3), tuple(sbox))
+    _TTABLE_CACHE[cache_key] = tables
+    return tables
+
+
+def ttable_encrypt_block(block, rk_words, tables) -> bytes:
+    """
+    Enkripsi 1 blok dengan T-table.
+    rk_words: 44 word round key (hasil bytes_to_words(key_expansion_*)).
+    tables  : hasil build_t_tables(sbox).
+    """
+    T0, T1, T2, T3, S = tables
+    s0, s1, s2, s3 = _unpack_4w(block)
+    s0 ^= rk_words[0]
+    s1 ^= rk_words[1]
+    s2 ^= rk_words[2]
+    s3 ^= rk_words[3]
+
+    # Ronde 1-9
+    k = 4
+    for _ in range(Nr - 1):
+        t0 = T0[s0 >> 24] ^ T1[(s1 >> 16) & 0xFF] ^ T2[(s2 >> 8) & 0xFF] ^ T3[s3 & 0xFF] ^ rk_words[k]
+        t1 = T0[s1 >> 24] ^ T1[(s2 >> 16) & 0xFF] ^ T2[(s3 >> 8) & 0xFF] ^ T3[s0 & 0xFF] ^ rk_words[k + 1]
+        t2 = T0[s2 >> 24] ^ T1[(s3 >> 16) & 0xFF] ^ T2[(s0 >> 8) & 0xFF] ^ T3[s1 & 0xFF] ^ rk_words[k + 2]
+        t3 = T0[s3 >> 24] ^ T1[(s0 >> 16) & 0xFF] ^ T2[(s1 >> 8) & 0xFF] ^ T3[s2 & 0xFF] ^ rk_words[k + 3]
+        s0, s1, s2, s3 = t0, t1, t2, t3
+        k += 4
+
+    # Final round (SubBytes + ShiftRows, tanpa MixColumns)
+    return _pack_4w(
+        ((S[s0 >> 24] << 24) | (S[(s1 >> 16) & 0xFF] << 16) | (S[(s2 >> 8) & 0xFF] << 8) | S[s3 & 0xFF]) ^ rk_words[40],
+        ((S[s1 >> 24] << 24) | (S[(s2 >> 16) & 0xFF] << 16) | (S[(s3 >> 8) & 0xFF] << 8) | S[s0 & 0xFF]) ^ rk_words[41],
+        ((S[s2 >> 24] << 24) | (S[(s3 >> 16) & 0xFF] << 16) | (S[(s0 >> 8) & 0xFF] << 8) | S[s1 & 0xFF]) ^ rk_words[42],
+        ((S[s3 >> 24] << 24) | (S[(s0 >> 16) & 0xFF] << 16) | (S[(s1 >> 8) & 0xFF] << 8) | S[s2 & 0xFF]) ^ rk_words[43],
+    )
+
+
+def aes_encrypt_block_ttable(block: bytes, key_bytes: bytes, sbox=AES_SBOX) -> bytes:
+    """Enkripsi 1 blok via T-table untuk S-Box apa pun (AES_SBOX, SBOX44, ...)."""
+    assert len(block) == 16, "Plaintext block harus 16 byte."
+    assert len(key_bytes) == 16, "Key harus 16 byte (AES-128)."
+
+    rk_words = bytes_to_words(key_expansion_sbox(key_bytes, sbox))
+    return ttable_encrypt_block(block, rk_words, build_t_tables(sbox))
+
+
+# --------------------------
+# Equivalent inverse cipher (dekripsi T-table)
+# --------------------------
+def build_inv_t_tables(inv_sbox):
+    """
+    Bangun Td0..Td3 dari S-Box invers:
+    Td0[x] = (14·S⁻¹[x], 9·S⁻¹[x], 13·S⁻¹[x], 11·S⁻¹[x]), Td1..Td3 = rotasi kanan.
+    InvSubBytes + InvShiftRows + InvMixColumns jadi 16 lookup per ronde.
+    """
+    cache_key = ("inv", tuple(inv_sbox))
+    tables = _TTABLE_CACHE.get(cache_key)
+    if tables is not None:
+        return tables
+
+    Td0, Td1, Td2, Td3 = [], [], [], []
+    for x in range(256):
+        s = inv_sbox[x]
+        w = (gmul(s, 0x0e) << 24) | (gmul(s, 0x09) << 16) | (gmul(s, 0x0d) << 8) | gmul(s, 0x0b)
+        Td0.append(w)
+        Td1.append(((w >> 8) | (w << 24)) & 0xFFFFFFFF)
+        Td2.append(((w >> 16) | (w << 16)) & 0xFFFFFFFF)
+        Td3.append(((w >> 24) | (w << 8)) & 0xFFFFFFFF)
+
+    tables = (tuple(Td0), tuple(Td1), tuple(Td2), tuple(Td3), tuple(inv_sbox))
+    _TTABLE_CACHE[cache_key] = tables
+    return tables
+
+
+def equivalent_inverse_round_keys(round_keys):
+    """
+    Round key dekripsi untuk equivalent inverse cipher (44 word):
+    urutan ronde dibalik, InvMixColumns sudah diterapkan ke ronde 1..9.
+    """
+    dk = list(round_keys[16*Nr : 16*(Nr+1)])
+    for rnd in range(Nr - 1, 0, -1):
+        dk.extend(inv_mix_columns(list(round_keys[16*rnd : 16*(rnd+1)])))
+    dk.extend(round_keys[:16])
+    return bytes_to_words(dk)
+
+
+def ttable_decrypt_block(block, dk_words, inv_tables) -> bytes:
+    """
+    Dekripsi 1 blok dengan Td-table.
+    dk_words  : hasil equivalent_inverse_round_keys(...).
+    inv_tables: hasil build_inv_t_tables(inv_sbox).
+    """
+    Td0, Td1, Td2, Td3, IS = inv_tables
+    s0, s1, s2, s3 = _unpack_4w(block)
+    s0 ^= dk_words[0]
+    s1 ^= dk_words[1]
+    s2 ^= dk_words[2]
+    s3 ^= dk_words[3]
+
+    # Ronde 9..1
+    k = 4
+    for _ in range(Nr - 1):
+        t0 = Td0[s0 >> 24] ^ Td1[(s3 >> 16) & 0xFF] ^ Td2[(s2 >> 8) & 0xFF] ^ Td3[s1 & 0xFF] ^ dk_words[k]
+        t1 = Td0[s1 >> 24] ^ Td1[(s0 >> 16) & 0xFF] ^ Td2[(s3 >> 8) & 0xFF] ^ Td3[s2 & 0xFF] ^ dk_words[k + 1]
+        t2 = Td0[s2 >> 24] ^ Td1[(s1 >> 16) & 0xFF] ^ Td2[(s0 >> 8) & 0xFF] ^ Td3[s3 & 0xFF] ^ dk_words[k + 2]
+        t3 = Td0[s3 >> 24] ^ Td1[(s2 >> 16) & 0xFF] ^ Td2[(s1 >> 8) & 0xFF] ^ Td3[s0 & 0xFF] ^ dk_words[k + 3]
+        s0, s1, s2, s3 = t0, t1, t2, t3
+        k += 4
+
+    # Final round (InvSubBytes + InvShiftRows)
+    return _pack_4w(
+        ((IS[s0 >> 24] << 24) | (IS[(s3 >> 16) & 0xFF] << 16) | (IS[(s2 >> 8) & 0xFF] << 8) | IS[s1 & 0xFF]) ^ dk_words[40],
+        ((IS[s1 >> 24] << 24) | (IS[(s0 >> 16) & 0xFF] << 16) | (IS[(s3 >> 8) & 0xFF] << 8) | IS[s2 & 0xFF]) ^ dk_words[41],
+        ((IS[s2 >> 24] << 24) | (IS[(s1 >> 16) & 0xFF] << 16) | (IS[(s0 >> 8) & 0xFF] << 8) | IS[s3 & 0xFF]) ^ dk_words[42],
+        ((IS[s3 >> 24] << 24) | (IS[(s2 >> 16) & 0xFF] << 16) | (IS[(s1 >> 8) & 0xFF] << 8) | IS[s0 & 0xFF]) ^ dk_words[43],
+    )
+
+
+def aes_decrypt_block_ttable(block: bytes, key_bytes: bytes, sbox=AES_SBOX) -> bytes:
+    """Dekripsi 1 blok via equivalent inverse cipher untuk S-Box apa pun."""
+    assert len(block) == 16, "Ciphertext block harus 16 byte."
+    assert len(key_bytes) == 16, "Key harus 16 byte (AES-128)."
+
+    dk_words = equivalent_inverse_round_keys(key_expansion_sbox(key_bytes, sbox))
+    return ttable_decrypt_block(block, dk_words, build_inv_t_tables(inverse_sbox(sbox)))
+
+
+# ===========================================
+# Cell 5B — Konteks cipher (key schedule di-cache)
+# ===========================================
+
+from functools import lru_cache
+
+
+def inverse_sbox(sbox):
+    """Bangun tabel invers dari S-Box bijektif 256 elemen."""
+    inv = [0] * 256
+    for i, v in enumerate(sbox):
+        inv[v] = i
+    return inv
+
+
+class AESCipher:
+    """
+    Konteks AES-128 (ECB) untuk S-Box apa pun.
+    Key diekspansi SEKALI saat dibuat, lalu dipakai ulang untuk semua blok:
+    - round_keys : 176 byte (bytes)
+    - _ek        : 44 word round key untuk enkripsi T-table
+    - _dk        : 44 word round key equivalent inverse cipher (Td-table)
+    Operasi bulk memakai backend tercepat yang valid (lihat select_backend),
+    atau backend tertentu kalau `backend` diisi (mis. "numpy", "bitsliced").
+    """
+
+    block_size = 16
+
+    def __init__(self, key_bytes, sbox=AES_SBOX, backend=None):
+        key_bytes = bytes(key_bytes)
+        if len(key_bytes) != 16:
+            raise ValueError("Key harus 16 byte (AES-128).")
+
+        self.key = key_bytes
+        self.sbox = tuple(sbox)
+        self.backend = backend
+        if backend is not None and not get_backend(backend).supports(self.sbox):
+            raise ValueError(f"Backend {backend!r} tidak mendukung S-Box ini.")
+        self.inv_sbox = tuple(inverse_sbox(self.sbox))
+        self.round_keys = bytes(key_expansion_sbox(key_bytes, self.sbox))
+
+        self._tables = build_t_tables(self.sbox)
+        self._inv_tables = build_inv_t_tables(self.inv_sbox)
+        self._ek = tuple(bytes_to_words(self.round_keys))
+        self._dk = tuple(equivalent_inverse_round_keys(self.round_keys))
+        self._rk_np = None  # array (11,16) untuk engine batch, dibuat saat perlu
+
+    # --------------------------
+    # Blok tunggal
+    # --------------------------
+    def encrypt_block(self, block) -> bytes:
+        assert len(block) == 16, "Plaintext block harus 16 byte."
+        return ttable_encrypt_block(block, self._ek, self._tables)
+
+    def decrypt_block(self, block) -> bytes:
+        assert len(block) == 16, "Ciphertext block harus 16 byte."
+        return ttable_decrypt_block(block, self._dk, self._inv_tables)
+
+    # --------------------------
+    # Bulk (panjang kelipatan 16, tanpa padding)
+    # --------------------------
+    def backend_for(self, mode="ecb", n_blocks=1) -> "CipherBackend":
+        if self.backend is not None:
+            return get_backend(self.backend)
+        return select_backend(self.sbox, mode, n_blocks)
+
+    def encrypt_blocks(self, data) -> bytes:
+        if len(data) % 16 != 0:
+            raise ValueError("Panjang data (dalam byte) harus kelipatan 16.")
+        if not len(data):
+            return b""
+        return self.backend_for("ecb", len(data) // 16).encrypt(self, data)
+
+    def decrypt_blocks(self, data) -> bytes:
+        if len(data) % 16 != 0:
+            raise ValueError("Panjang ciphertext (dalam byte) harus kelipatan 16.")
+        if not len(data):
+            return b""
+        return self.backend_for("ecb", len(data) // 16).decrypt(self, data)
+
+    # --------------------------
+    # Zero-copy: tulis langsung ke buffer milik pemanggil
+    # --------------------------
+    def _crypt_into(self, src, dst, decrypt) -> int:
+        src = as_byte_view(src)
+        dst = as_byte_view(dst, writable=True)
+        n = len(src)
+        if n % 16 != 0:
+            raise ValueError("Panjang data (dalam byte) harus kelipatan 16.")
+        if len(dst) < n:
+            raise ValueError("Buffer output lebih kecil dari input.")
+        if n:
+            self.backend_for("ecb", n // 16).crypt_into(self, src, dst[:n], decrypt)
+        return n
+
+    def encrypt_into(self, src, dst) -> int:
+        """
+        ECB tanpa padding: src (buffer apa pun) → dst (buffer writable).
+        dst boleh objek yang sama dengan src (in-place). Return: byte tertulis.
+        """
+        return self._crypt_into(src, dst, decrypt=False)
+
+    def decrypt_into(self, src, dst) -> int:
+        return self._crypt_into(src, dst, decrypt=True)
+
+    # --------------------------
+    # Batch NumPy: array (N,16) uint8
+    # --------------------------
+    def _rk_array(self):
+        rk = self._rk_np
+        if rk is None:
+            rk = self._rk_np = _round_key_array(self.round_keys)
+        return rk
+
+    def encrypt_array(self, blocks):
+        return batch_encrypt_blocks(blocks, self._rk_array(), self.sbox)
+
+    def decrypt_array(self, blocks):
+        return batch_decrypt_blocks(blocks, self.round_keys, self.sbox, dk_words=self._dk)
+
+    # --------------------------
+    # Unrolled (source di-generate per key)
+    # --------------------------
+    def compiled(self) -> "CompiledCipher":
+        return compile_cipher(self.key, self.sbox)
+
+    # --------------------------
+    # Bitsliced (tanpa tabel, banyak lane)
+    # --------------------------
+    def encrypt_bitsliced(self, data) -> bytes:
+        return bitsliced_encrypt_blocks(data, self.round_keys, self.sbox)
+
+    def decrypt_bitsliced(self, data) -> bytes:
+        return bitsliced_decrypt_blocks(data, self.round_keys, self.sbox)
+
+    # --------------------------
+    # ECB + PKCS7
+    # --------------------------
+    def encrypt_ecb_into(self, src, dst) -> int:
+        """
+        ECB + PKCS7 ke dst (minimal padded_length(len(src)) byte).
+        Hanya blok terakhir (sisa + padding) yang disalin. Return: panjang ciphertext.
+        """
+        src = as_byte_view(src)
+        dst = as_byte_view(dst, writable=True)
+        n = len(src)
+        full = n - n % 16
+        total = padded_length(n)
+        if len(dst) < total:
+            raise ValueError("Buffer output lebih kecil dari ciphertext (plaintext + padding).")
+        pad = total - n
+        last = bytes(src[full:]) + bytes([pad]) * pad
+        self.encrypt_into(src[:full], dst[:full])
+        self.encrypt_into(last, dst[full:total])
+        return total
+
+    def decrypt_ecb_into(self, src, dst) -> int:
+        """Dekripsi ECB ke dst lalu buang padding. Return: panjang plaintext di dst."""
+        n = self.decrypt_into(src, dst)
+        return pkcs7_unpad_length(as_byte_view(dst), n)
+
+    def encrypt_ecb(self, data) -> bytes:
+        out = bytearray(padded_length(len(as_byte_view(data))))
+        self.encrypt_ecb_into(data, out)
+        return bytes(out)
+
+    def decrypt_ecb(self, data) -> bytes:
+        out = bytearray(len(as_byte_view(data)))
+        n = self.decrypt_ecb_into(data, out)
+        del out[n:]
+        return bytes(out)
+
+    def encryptor(self):
+        from aes_modes import StreamEncryptor
+        return StreamEncryptor(self)
+
+    def decryptor(self):
+        from aes_modes import StreamDecryptor
+        return StreamDecryptor(self)
+
+
+@lru_cache(maxsize=32)
+def _cached_cipher(key_bytes: bytes, sbox: tuple, backend=None) -> AESCipher:
+    return AESCipher(key_bytes, sbox, backend)
+
+
+def get_cipher(key_bytes, sbox=AES_SBOX, backend=None) -> AESCipher:
+    """AESCipher yang di-cache per (key, S-Box, backend) — dipakai wrapper string & bulk."""
+    return _cached_cipher(bytes(key_bytes), tuple(sbox), backend)
+
+
+def as_byte_view(buf, writable=False) -> memoryview:
+    """
+    memoryview 1-D byte atas buffer apa pun (bytes, bytearray, memoryview,
+    array NumPy C-contiguous, mmap) — tanpa menyalin data.
+    """
+    mv = memoryview(buf)
+    if mv.format != "B" or mv.ndim != 1:
+        mv = mv.cast("B")
+    if writable and mv.readonly:
+        raise TypeError("Buffer output harus writable (bytearray, memoryview, array NumPy, mmap).")
+    return mv
+
+
+def padded_length(n, block_size=16) -> int:
+    """Panjang data setelah PKCS7 (selalu bertambah 1..block_size byte)."""
+    return n + block_size - n % block_size
+
+
+# ===========================================
+# Cell 5C — Batch engine NumPy (N blok sekaligus)
+# ===========================================
+#
+# State berbentuk array (N,16) uint8; setiap ronde dikerjakan untuk
+# semua blok bersamaan:
+# - SubBytes    : fancy-index ke tabel S-Box
+# - ShiftRows   : permutasi kolom tetap
+# - MixColumns  : tabel xtime
+# - AddRoundKey : XOR broadcast dengan round key (16,)
+#
+# Dekripsi memakai Td-table uint32 (equivalent inverse cipher).
+
+try:
+    import numpy as np
+except ImportError:  # numpy opsional: engine batch tidak tersedia
+    np = None
+
+# Minimal jumlah blok sebelum AESCipher memakai engine batch
+BATCH_MIN_BLOCKS = 64
+
+SHIFT_ROWS_IDX = [0, 5, 10, 15, 4, 9, 14, 3, 8, 13, 2, 7, 12, 1, 6, 11]
+INV_SHIFT_ROWS_IDX = [0, 13, 10, 7, 4, 1, 14, 11, 8, 5, 2, 15, 12, 9, 6, 3]
+
+# Cache tabel NumPy per S-Box
+_NP_TABLE_CACHE = {}
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("Engine batch membutuhkan numpy (pip install numpy).")
+
+
+def _np_tables(sbox):
+    """Tabel untuk engine batch: S, S^-1, xtime, indeks (Inv)ShiftRows."""
+    cache_key = tuple(sbox)
+    tables = _NP_TABLE_CACHE.get(cache_key)
+    if tables is not None:
+        return tables
+
+    _require_numpy()
+    u8 = np.uint8
+    tables = {
+        "S":   np.array(sbox, dtype=u8),
+        "IS":  np.array(inverse_sbox(sbox), dtype=u8),
+        "XT":  np.array([xtime(x) for x in range(256)], dtype=u8),
+        "SR":  np.array(SHIFT_ROWS_IDX, dtype=np.intp),
+        "ISR": np.array(INV_SHIFT_ROWS_IDX, dtype=np.intp),
+    }
+    _NP_TABLE_CACHE[cache_key] = tables
+    return tables
+
+
+def as_block_array(data):
+    """bytes/bytearray/memoryview (kelipatan 16) → view array (N,16) uint8 tanpa copy."""
+    _require_numpy()
+    arr = np.frombuffer(data, dtype=np.uint8)
+    if arr.size % 16 != 0:
+        raise ValueError("Panjang data (dalam byte) harus kelipatan 16.")
+    return arr.reshape(-1, 16)
+
+
+def _round_key_array(round_keys):
+    """176 byte round key → array (11,16) uint8."""
+    return np.frombuffer(bytes(round_keys), dtype=np.uint8).reshape(Nr + 1, 16)
+
+
+def _mix_columns_np(state, XT):
+    cols = state.reshape(-1, 4, 4)   # (N, kolom, baris)
+    a0, a1, a2, a3 = cols[:, :, 0], cols[:, :, 1], cols[:, :, 2], cols[:, :, 3]
+    t = a0 ^ a1 ^ a2 ^ a3
+    out = np.empty_like(cols)
+    out[:, :, 0] = a0 ^ t ^ XT[a0 ^ a1]
+    out[:, :, 1] = a1 ^ t ^ XT[a1 ^ a2]
+    out[:, :, 2] = a2 ^ t ^ XT[a2 ^ a3]
+    out[:, :, 3] = a3 ^ t ^ XT[a3 ^ a0]
+    return out.reshape(-1, 16)
+
+
+def batch_encrypt_blocks(blocks, round_keys, sbox=AES_SBOX):
+    """
+    Enkripsi ECB untuk array (N,16) uint8 sekaligus.
+    round_keys: 176 byte (bytes/list) atau array (11,16) uint8.
+    Return: array (N,16) uint8 baru.
+    """
+    _require_numpy()
+    t = _np_tables(sbox)
+    S, XT, SR = t["S"], t["XT"], t["SR"]
+    rk = round_keys if isinstance(round_keys, np.ndarray) else _round_key_array(round_keys)
+
+    state = np.asarray(blocks, dtype=np.uint8).reshape(-1, 16) ^ rk[0]
+    for rnd in range(1, Nr):
+        state = S[state][:, SR]
+        state = _mix_columns_np(state, XT)
+        state ^= rk[rnd]
+
+    state = S[state][:, SR]
+    state ^= rk[Nr]
+    return state
+
+
+def _np_inv_t_tables(sbox):
+    """Td0..Td3 (equivalent inverse cipher) sebagai array '<u4' untuk engine batch."""
+    t = _np_tables(sbox)
+    td = t.get("TD")
+    if td is None:
+        inv_tables = build_inv_t_tables(inverse_sbox(sbox))
+        td = t["TD"] = [np.frombuffer(words_to_bytes(tab), dtype="<u4") for tab in inv_tables[:4]]
+    return td
+
+
+def batch_decrypt_blocks(blocks, round_keys, sbox=AES_SBOX, dk_words=None):
+    """
+    Dekripsi ECB untuk array (N,16) uint8 sekaligus, memakai equivalent inverse
+    cipher: tiap ronde = 16 lookup Td-table (uint32) per kolom, untuk semua blok.
+    dk_words: round key hasil equivalent_inverse_round_keys (opsional, dihitung
+    dari round_keys kalau tidak diberikan).
+    """
+    _require_numpy()
+    t = _np_tables(sbox)
+    IS, ISR = t["IS"], t["ISR"]
+    Td0, Td1, Td2, Td3 = _np_inv_t_tables(sbox)
+    if dk_words is None:
+        dk_words = equivalent_inverse_round_keys(round_keys)
+    dk_bytes = words_to_bytes(dk_words)
+    dk = np.frombuffer(dk_bytes, dtype="<u4").reshape(Nr + 1, 4)
+
+    # Word kolom dibaca '<u4' langsung dari byte state (tanpa copy)
+    state = np.ascontiguousarray(blocks, dtype=np.uint8).reshape(-1, 16).view("<u4") ^ dk[0]
+    for rnd in range(1, Nr):
+        b = state.view(np.uint8)
+        new = np.empty_like(state)
+        for c in range(4):
+            w = Td0[b[:, 4*c]]
+            w ^= Td1[b[:, 4*((c - 1) % 4) + 1]]
+            w ^= Td2[b[:, 4*((c - 2) % 4) + 2]]
+            w ^= Td3[b[:, 4*((c - 3) % 4) + 3]]
+            new[:, c] = w
+        new ^= dk[rnd]
+        state = new
+
+    # Final round: InvShiftRows + InvSubBytes + round key asli ke-0
+    state = IS[state.view(np.uint8)[:, ISR]]
+    state ^= np.frombuffer(dk_bytes, dtype=np.uint8)[16*Nr:]
+    return state
+
+# ===========================================
+# Cell 5D — Bitsliced AES (big-int lanes)
+# ===========================================
+#
+# N blok dikemas jadi 128 bit-plane: plane[8*i + b] adalah integer Python
+# yang bit ke-j-nya = bit b dari byte i pada blok ke-j. Setiap operasi
+# Boolean pada plane memproses N blok sekaligus, tanpa lookup tabel.
+# - SubBytes    : sirkuit Boolean (Boyar–Peralta untuk AES_SBOX,
+#                 sirkuit dari ANF untuk SBOX44 / S-Box lain)
+# - ShiftRows   : permutasi plane
+# - MixColumns  : XOR plane (xtime = rotasi bit + XOR)
+# - AddRoundKey : XOR dengan plane all-ones di posisi bit key = 1
+
+# Sirkuit S-Box AES (Boyar & Peralta, depth 16).
+# U0 = bit MSB input, S0 = bit MSB output. "^" XOR, "&" AND, "~^" XNOR.
+_BP_AES_SBOX_CIRCUIT = """
+T1 = U0 ^ U3
+T2 = U0 ^ U5
+T3 = U0 ^ U6
+T4 = U3 ^ U5
+T5 = U4 ^ U6
+T6 = T1 ^ T5
+T7 = U1 ^ U2
+T8 = U7 ^ T6
+T9 = U7 ^ T7
+T10 = T6 ^ T7
+T11 = U1 ^ U5
+T12 = U2 ^ U5
+T13 = T3 ^ T4
+T14 = T6 ^ T11
+T15 = T5 ^ T11
+T16 = T5 ^ T12
+T17 = T9 ^ T16
+T18 = U3 ^ U7
+T19 = T7 ^ T18
+T20 = T1 ^ T19
+T21 = U6 ^ U7
+T22 = T7 ^ T21
+T23 = T2 ^ T22
+T24 = T2 ^ T10
+T25 = T20 ^ T17
+T26 = T3 ^ T16
+T27 = T1 ^ T12
+M1 = T13 & T6
+M2 = T23 & T8
+M3 = T14 ^ M1
+M4 = T19 & U7
+M5 = M4 ^ M1
+M6 = T3 & T16
+M7 = T22 & T9
+M8 = T26 ^ M6
+M9 = T20 & T17
+M10 = M9 ^ M6
+M11 = T1 & T15
+M12 = T4 & T27
+M13 = M12 ^ M11
+M14 = T2 & T10
+M15 = M14 ^ M11
+M16 = M3 ^ M2
+M17 = M5 ^ T24
+M18 = M8 ^ M7
+M19 = M10 ^ M15
+M20 = M16 ^ M13
+M21 = M17 ^ M15
+M22 = M18 ^ M13
+M23 = M19 ^ T25
+M24 = M22 ^ M23
+M25 = M22 & M20
+M26 = M21 ^ M25
+M27 = M20 ^ M21
+M28 = M23 ^ M25
+M29 = M28 & M27
+M30 = M26 & M24
+M31 = M20 & M23
+M32 = M27 & M31
+M33 = M27 ^ M25
+M34 = M21 & M22
+M35 = M24 & M34
+M36 = M24 ^ M25
+M37 = M21 ^ M29
+M38 = M32 ^ M33
+M39 = M23 ^ M30
+M40 = M35 ^ M36
+M41 = M38 ^ M40
+M42 = M37 ^ M39
+M43 = M37 ^ M38
+M44 = M39 ^ M40
+M45 = M42 ^ M41
+M46 = M44 & T6
+M47 = M40 & T8
+M48 = M39 & U7
+M49 = M43 & T16
+M50 = M38 & T9
+M51 = M37 & T17
+M52 = M42 & T15
+M53 = M45 & T27
+M54 = M41 & T10
+M55 = M44 & T13
+M56 = M40 & T23
+M57 = M39 & T19
+M58 = M43 & T3
+M59 = M38 & T22
+M60 = M37 & T20
+M61 = M42 & T1
+M62 = M45 & T4
+M63 = M41 & T2
+L0 = M61 ^ M62
+L1 = M50 ^ M56
+L2 = M46 ^ M48
+L3 = M47 ^ M55
+L4 = M54 ^ M58
+L5 = M49 ^ M61
+L6 = M62 ^ L5
+L7 = M46 ^ L3
+L8 = M51 ^ M59
+L9 = M52 ^ M53
+L10 = M53 ^ L4
+L11 = M60 ^ L2
+L12 = M48 ^ M51
+L13 = M50 ^ L0
+L14 = M52 ^ M61
+L15 = M55 ^ L1
+L16 = M56 ^ L0
+L17 = M57 ^ L1
+L18 = M58 ^ L8
+L19 = M63 ^ L4
+L20 = L0 ^ L1
+L21 = L1 ^ L7
+L22 = L3 ^ L12
+L23 = L18 ^ L2
+L24 = L15 ^ L9
+L25 = L6 ^ L10
+L26 = L7 ^ L9
+L27 = L8 ^ L10
+L28 = L11 ^ L14
+L29 = L11 ^ L17
+S0 = L6 ^ L24
+S1 = L16 ~^ L26
+S2 = L19 ~^ L28
+S3 = L6 ^ L21
+S4 = L20 ^ L22
+S5 = L25 ^ L29
+S6 = L13 ~^ L27
+S7 = L6 ~^ L23
+"""
+
+# Kode operasi sirkuit
+_OP_XOR, _OP_AND, _OP_XNOR, _OP_NOT = 0, 1, 2, 3
+
+# Cache sirkuit per S-Box
+_CIRCUIT_CACHE = {}
+
+
+def _parse_circuit(text):
+    """
+    Teks sirkuit → (n_reg, ops, outs).
+    Register 0..7 = bit input (LSB = 0); ops = list (dst, op, a, b);
+    outs = register untuk bit output 0..7.
+    """
+    reg = {f"U{i}": 7 - i for i in range(8)}
+    ops = []
+    codes = {"^": _OP_XOR, "&": _OP_AND, "~^": _OP_XNOR}
+    for line in text.strip().splitlines():
+        dst, expr = [p.strip() for p in line.split("=")]
+        a, op, b = expr.split()
+        reg[dst] = len(reg)
+        ops.append((reg[dst], codes[op], reg[a], reg[b]))
+    outs = [reg[f"S{7 - bit}"] for bit in range(8)]
+    return len(reg), ops, outs
+
+
+def sbox_anf(sbox):
+    """
+    Algebraic Normal Form tiap bit output S-Box (transformasi Möbius).
+    Return: list 8 elemen, anf[bit] = list monomial u (mask input) dengan koefisien 1.
+    """
+    anf = []
+    for bit in range(8):
+        f = [(sbox[x] >> bit) & 1 for x in range(256)]
+        for i in range(8):
+            step = 1 << i
+            for x in range(256):
+                if x & step:
+                    f[x] ^= f[x ^ step]
+        anf.append([u for u in range(256) if f[u]])
+    return anf
+
+
+def anf_circuit(sbox):
+    """Sirkuit XOR/AND generik dari ANF S-Box (monomial dibangun berbagi prefix)."""
+    anf = sbox_anf(sbox)
+    ops = []
+    mono = {1 << b: b for b in range(8)}   # monomial derajat 1 = register input
+    n_reg = 8
+
+    def monomial(u):
+        nonlocal n_reg
+        r = mono.get(u)
+        if r is None:
+            low = u & -u
+            a = monomial(u ^ low)
+            r = n_reg
+            n_reg += 1
+            ops.append((r, _OP_AND, a, mono[low]))
+            mono[u] = r
+        return r
+
+    outs = []
+    for bit in range(8):
+        terms = [monomial(u) for u in anf[bit] if u != 0]
+        const = 0 in anf[bit]
+        if not terms:
+            raise ValueError("S-Box tidak valid: bit output konstan.")
+        acc = terms[0]
+        for t in terms[1:]:
+            ops.append((n_reg, _OP_XOR, acc, t))
+            acc = n_reg
+            n_reg += 1
+        if const:
+            ops.append((n_reg, _OP_NOT, acc, acc))
+            acc = n_reg
+            n_reg += 1
+        outs.append(acc)
+    return n_reg, ops, outs
+
+
+def get_sbox_circuit(sbox):
+    """Sirkuit S-Box: Boyar–Peralta untuk AES_SBOX, selain itu diturunkan dari ANF."""
+    cache_key = tuple(sbox)
+    circuit = _CIRCUIT_CACHE.get(cache_key)
+    if circuit is None:
+        if cache_key == tuple(AES_SBOX):
+            circuit = _parse_circuit(_BP_AES_SBOX_CIRCUIT)
+        else:
+            circuit = anf_circuit(sbox)
+        _CIRCUIT_CACHE[cache_key] = circuit
+    return circuit
+
+
+def eval_circuit(circuit, xbits, ones):
+    """Evaluasi sirkuit pada 8 plane input (LSB dulu); `ones` = plane all-ones."""
+    n_reg, ops, outs = circuit
+    r = [0] * n_reg
+    r[0:8] = xbits
+    for d, op, a, b in ops:
+        if op == _OP_XOR:
+            r[d] = r[a] ^ r[b]
+        elif op == _OP_AND:
+            r[d] = r[a] & r[b]
+        elif op == _OP_XNOR:
+            r[d] = r[a] ^ r[b] ^ ones
+        else:
+            r[d] = r[a] ^ ones
+    return [r[o] for o in outs]
+
+
+# --------------------------
+# Packing bytes ↔ bit-plane
+# --------------------------
+_BIT_TO_ASCII = bytes.maketrans(b"\x00\x01", b"01")
+_ASCII_TO_BIT = bytes.maketrans(b"01", b"\x00\x01")
+
+
+def bitslice_pack(data):
+    """Data (N blok × 16 byte) → (128 plane, N)."""
+    data = bytes(data)
+    n = len(data) // 16
+    lsb_mask = int.from_bytes(b"\x01" * n, "little")
+    planes = []
+    for i in range(16):
+        col = int.from_bytes(data[i::16], "little")
+        for b in range(8):
+            spread = ((col >> b) & lsb_mask).to_bytes(n, "little")
+            planes.append(int(spread.translate(_BIT_TO_ASCII)[::-1], 2))
+    return planes, n
+
+
+def bitslice_unpack(planes, n) -> bytes:
+    """Kebalikan bitslice_pack: 128 plane → bytes N×16."""
+    out = bytearray(16 * n)
+    for i in range(16):
+        col = 0
+        for b in range(8):
+            bits = format(planes[8*i + b], f"0{n}b")[::-1].encode()
+            col |= int.from_bytes(bits.translate(_ASCII_TO_BIT), "little") << b
+        out[i::16] = col.to_bytes(n, "little")
+    return bytes(out)
+
+
+# --------------------------
+# Ronde bitsliced
+# --------------------------
+def _bs_xtime(a):
+    """xtime pada 1 byte bitsliced (list 8 plane, LSB dulu)."""
+    a7 = a[7]
+    return [a7, a[0] ^ a7, a[1], a[2] ^ a7, a[3] ^ a7, a[4], a[5], a[6]]
+
+
+def _bs_xor(a, b):
+    return [x ^ y for x, y in zip(a, b)]
+
+
+def _bs_mix_columns(state):
+    """state: list 16 byte-bitsliced (masing-masing list 8 plane)."""
+    out = [None] * 16
+    for c in range(0, 16, 4):
+        a0, a1, a2, a3 = state[c:c+4]
+        t = _bs_xor(_bs_xor(a0, a1), _bs_xor(a2, a3))
+        out[c]     = _bs_xor(_bs_xor(a0, t), _bs_xtime(_bs_xor(a0, a1)))
+        out[c + 1] = _bs_xor(_bs_xor(a1, t), _bs_xtime(_bs_xor(a1, a2)))
+        out[c + 2] = _bs_xor(_bs_xor(a2, t), _bs_xtime(_bs_xor(a2, a3)))
+        out[c + 3] = _bs_xor(_bs_xor(a3, t), _bs_xtime(_bs_xor(a3, a0)))
+    return out
+
+
+def _bs_inv_mix_columns(state):
+    """InvMixColumns = MixColumns ∘ (a0^=u, a1^=v, a2^=u, a3^=v), u=4·(a0^a2), v=4·(a1^a3)."""
+    pre = [None] * 16
+    for c in range(0, 16, 4):
+        a0, a1, a2, a3 = state[c:c+4]
+        u = _bs_xtime(_bs_xtime(_bs_xor(a0, a2)))
+        v = _bs_xtime(_bs_xtime(_bs_xor(a1, a3)))
+        pre[c:c+4] = [_bs_xor(a0, u), _bs_xor(a1, v), _bs_xor(a2, u), _bs_xor(a3, v)]
+    return _bs_mix_columns(pre)
+
+
+def _bs_add_round_key(state, round_key, ones):
+    out = []
+    for i in range(16):
+        k = round_key[i]
+        out.append([p ^ ones if (k >> b) & 1 else p for b, p in enumerate(state[i])])
+    return out
+
+
+def bitsliced_encrypt_blocks(data, round_keys, sbox=AES_SBOX) -> bytes:
+    """
+    Enkripsi ECB bitsliced untuk data kelipatan 16 byte.
+    round_keys: 176 byte hasil key expansion dengan S-Box yang sama.
+    """
+    if len(data) % 16 != 0:
+        raise ValueError("Panjang data (dalam byte) harus kelipatan 16.")
+    if not data:
+        return b""
+
+    circuit = get_sbox_circuit(sbox)
+    planes, n = bitslice_pack(data)
+    ones = (1 << n) - 1
+    rk = [round_keys[16*r : 16*(r+1)] for r in range(Nr + 1)]
+
+    state = [planes[8*i : 8*(i+1)] for i in range(16)]
+    state = _bs_add_round_key(state, rk[0], ones)
+    for rnd in range(1, Nr + 1):
+        state = [eval_circuit(circuit, byte, ones) for byte in state]   # SubBytes
+        state = [state[j] for j in SHIFT_ROWS_IDX]                      # ShiftRows
+        if rnd != Nr:
+            state = _bs_mix_columns(state)
+        state = _bs_add_round_key(state, rk[rnd], ones)
+
+    return bitslice_unpack([p for byte in state for p in byte], n)
+
+
+def bitsliced_decrypt_blocks(data, round_keys, sbox=AES_SBOX) -> bytes:
+    """Dekripsi ECB bitsliced (sirkuit invers S-Box diturunkan dari ANF)."""
+    if len(data) % 16 != 0:
+        raise ValueError("Panjang ciphertext (dalam byte) harus kelipatan 16.")
+    if not data:
+        return b""
+
+    circuit = get_sbox_circuit(inverse_sbox(sbox))
+    planes, n = bitslice_pack(data)
+    ones = (1 << n) - 1
+    rk = [round_keys[16*r : 16*(r+1)] for r in range(Nr + 1)]
+
+    state = [planes[8*i : 8*(i+1)] for i in range(16)]
+    state = _bs_add_round_key(state, rk[Nr], ones)
+    for rnd in range(Nr - 1, -1, -1):
+        state = [state[j] for j in INV_SHIFT_ROWS_IDX]                  # InvShiftRows
+        state = [eval_circuit(circuit, byte, ones) for byte in state]   # InvSubBytes
+        state = _bs_add_round_key(state, rk[rnd], ones)
+        if rnd != 0:
+            state = _bs_inv_mix_columns(state)
+
+    return bitslice_unpack([p for byte in state for p in byte], n)
+
+# ===========================================
+# Cell 5E — Code generation: ronde di-unroll per S-Box & key
+# ===========================================
+#
+# Untuk key yang dipakai lama, source Python straight-line (tanpa loop,
+# tanpa slicing round key) dibangkitkan lalu di-compile. Round key
+# di-inline sebagai konstanta; tabel T/Td jadi global fungsi hasil compile.
+
+from collections import OrderedDict, namedtuple
+
+# Batas jumlah fungsi hasil compile yang disimpan (LRU)
+COMPILED_CACHE_MAX = 64
+
+_COMPILED_CACHE = OrderedDict()
+
+CompiledCipher = namedtuple("CompiledCipher", ["encrypt_block", "decrypt_block", "source"])
+
+
+def _gen_rounds(lines, rk, tables, order, final_box):
+    """
+    Tambah baris source untuk 9 ronde penuh + final round.
+    order: indeks kolom sumber byte baris 1..3 (ShiftRows / InvShiftRows).
+    """
+    A, B, C, D = tables
+    src, dst = "s", "t"
+    lines.append("    s0, s1, s2, s3 = unpack(block)")
+    lines.append(f"    s0 ^= {rk[0]:#010x}; s1 ^= {rk[1]:#010x}; s2 ^= {rk[2]:#010x}; s3 ^= {rk[3]:#010x}")
+    for rnd in range(1, Nr):
+        for c in range(4):
+            c1, c2, c3 = order[c]
+            lines.append(
+                f"    {dst}{c} = {A}[{src}{c} >> 24] ^ {B}[{src}{c1} >> 16 & 255] ^ "
+                f"{C}[{src}{c2} >> 8 & 255] ^ {D}[{src}{c3} & 255] ^ {rk[4*rnd + c]:#010x}"
+            )
+        src, dst = dst, src
+    out = []
+    for c in range(4):
+        c1, c2, c3 = order[c]
+        out.append(
+            f"        ({final_box}[{src}{c} >> 24] << 24 | {final_box}[{src}{c1} >> 16 & 255] << 16 | "
+            f"{final_box}[{src}{c2} >> 8 & 255] << 8 | {final_box}[{src}{c3} & 255]) ^ {rk[40 + c]:#010x},"
+        )
+    lines.append("    return pack(")
+    lines.extend(out)
+    lines.append("    )")
+
+
+def generate_cipher_source(ek_words, dk_words) -> str:
+    """Source Python untuk encrypt_block/decrypt_block dengan round key ter-inline."""
+    enc_order = [((c + 1) % 4, (c + 2) % 4, (c + 3) % 4) for c in range(4)]
+    dec_order = [((c - 1) % 4, (c - 2) % 4, (c - 3) % 4) for c in range(4)]
+
+    lines = ["def encrypt_block(block):"]
+    _gen_rounds(lines, ek_words, ("T0", "T1", "T2", "T3"), enc_order, "S")
+    lines.append("")
+    lines.append("def decrypt_block(block):")
+    _gen_rounds(lines, dk_words, ("Td0", "Td1", "Td2", "Td3"), dec_order, "IS")
+    return "\n".join(lines) + "\n"
+
+
+def compile_cipher(key_bytes, sbox=AES_SBOX) -> CompiledCipher:
+    """
+    Compile encrypt/decrypt 1 blok yang di-unroll untuk (S-Box, key).
+    Hasil di-cache per (S-Box, key) dengan batas COMPILED_CACHE_MAX.
+    """
+    key_bytes = bytes(key_bytes)
+    sbox = tuple(sbox)
+    cache_key = (sbox, key_bytes)
+    compiled = _COMPILED_CACHE.get(cache_key)
+    if compiled is not None:
+        _COMPILED_CACHE.move_to_end(cache_key)
+        return compiled
+
+    cipher = get_cipher(key_bytes, sbox)
+    source = generate_cipher_source(cipher._ek, cipher._dk)
+    T0, T1, T2, T3, S = cipher._tables
+    Td0, Td1, Td2, Td3, IS = cipher._inv_tables
+    namespace = {
+        "T0": T0, "T1": T1, "T2": T2, "T3": T3, "S": S,
+        "Td0": Td0, "Td1": Td1, "Td2": Td2, "Td3": Td3, "IS": IS,
+        "unpack": _unpack_4w, "pack": _pack_4w,
+    }
+    exec(compile(source, f"<aes-unrolled {key_bytes.hex()[:8]}>", "exec"), namespace)
+
+    compiled = CompiledCipher(namespace["encrypt_block"], namespace["decrypt_block"], source)
+    _COMPILED_CACHE[cache_key] = compiled
+    if len(_COMPILED_CACHE) > COMPILED_CACHE_MAX:
+        _COMPILED_CACHE.popitem(last=False)
+    return compiled
+
+# ===========================================
+# Cell 5F — Registry backend (pilih engine tercepat otomatis)
+# ===========================================
+#
+# Setiap backend mendeklarasikan S-Box & mode yang didukung, perkiraan
+# kecepatan, dan jumlah blok minimal agar layak dipakai. AESCipher memilih
+# backend tercepat yang valid. Implementasi list-based (reference) tetap
+# jadi oracle: tiap backend dicek sekali (per S-Box) terhadap reference
+# sebelum dipakai; yang gagal dilewati.
+#
+# Mode "ecb" = engine blok mentah — semua mode (CTR, CBC, CFB, XTS, GCM)
+# dibangun di atasnya. Backend boleh menyediakan implementasi native untuk
+# mode lain lewat mode_impls (mis. OpenSSL untuk CBC/CTR).
+
+import warnings
+
+try:
+    from cryptography.hazmat.primitives.ciphers import Cipher as _OsslCipher
+    from cryptography.hazmat.primitives.ciphers import algorithms as _ossl_algorithms
+    from cryptography.hazmat.primitives.ciphers import modes as _ossl_modes
+except ImportError:  # cryptography opsional: backend OpenSSL tidak tersedia
+    _OsslCipher = None
+
+ALL_MODES = ("ecb", "cbc", "cfb", "ofb", "ctr", "gcm", "xts")
+
+MASK128 = (1 << 128) - 1
+
+# Ukuran chunk untuk *_into generik: alokasi sementara dibatasi sebesar ini
+INTO_CHUNK_SIZE = 1 << 20
+
+
+class CipherBackend:
+    """
+    Deskripsi 1 backend.
+    encrypt(cipher, data) / decrypt(cipher, data): ECB mentah, data kelipatan 16.
+    sboxes     : None = S-Box apa pun, atau set tuple S-Box yang didukung.
+    speed      : perkiraan relatif (lebih besar = lebih cepat).
+    min_blocks : di bawah ini backend tidak dipilih otomatis (overhead setup).
+    mode_impls : {mode: fn(cipher, iv, data, decrypt, offset)} implementasi native.
+    into       : fn(cipher, src, dst, decrypt) yang menulis langsung ke dst;
+                 tanpa ini dst diisi per chunk dari encrypt/decrypt.
+    """
+
+    def __init__(self, name, speed, encrypt, decrypt, sboxes=None, modes=ALL_MODES,
+                 min_blocks=1, is_available=None, mode_impls=None, into=None):
+        self.name = name
+        self.speed = speed
+        self.encrypt = encrypt
+        self.decrypt = decrypt
+        self.sboxes = sboxes
+        self.modes = tuple(modes)
+        self.min_blocks = min_blocks
+        self.is_available = is_available or (lambda: True)
+        self.mode_impls = mode_impls or {}
+        self.into = into
+
+    def crypt_into(self, cipher, src, dst, decrypt=False):
+        """src → dst (memoryview byte, panjang sama, kelipatan 16)."""
+        if self.into is not None:
+            return self.into(cipher, src, dst, decrypt)
+        crypt = self.decrypt if decrypt else self.encrypt
+        n = len(src)
+        for a in range(0, n, INTO_CHUNK_SIZE):
+            b = min(a + INTO_CHUNK_SIZE, n)
+            dst[a:b] = crypt(cipher, src[a:b])
+
+    def supports(self, sbox, mode="ecb"):
+        if mode not in self.modes or not self.is_available():
+            return False
+        return self.sboxes is None or tuple(sbox) in self.sboxes
+
+    def __repr__(self):
+        return f"CipherBackend({self.name!r}, speed={self.speed})"
+
+
+BACKENDS = {}
+
+# Hasil self-check per (nama backend, S-Box): True/False
+_BACKEND_CHECKED = {}
+
+
+def register_backend(backend):
+    BACKENDS[backend.name] = backend
+    for k in [k for k in _BACKEND_CHECKED if k[0] == backend.name]:
+        del _BACKEND_CHECKED[k]
+    return backend
+
+
+def get_backend(name) -> CipherBackend:
+    try:
+        return BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Backend tidak dikenal: {name!r} (tersedia: {', '.join(BACKENDS)})") from None
+
+
+# --------------------------
+# Reference (oracle)
+# --------------------------
+def sub_bytes(state, sbox):
+    """SubBytes untuk S-Box apa pun (versi generik sub_bytes_aes / sub_bytes_44)."""
+    return [sbox[b] for b in state]
+
+
+def reference_encrypt_block(block, round_keys, sbox):
+    """Enkripsi 1 blok versi list (SubBytes/ShiftRows/MixColumns/AddRoundKey terpisah)."""
+    state = add_round_key(list(block), round_keys[:16])
+    for rnd in range(1, Nr):
+        state = sub_bytes(state, sbox)
+        state = shift_rows(state)
+        state = mix_columns(state)
+        state = add_round_key(state, round_keys[16*rnd : 16*(rnd+1)])
+    state = sub_bytes(state, sbox)
+    state = shift_rows(state)
+    state = add_round_key(state, round_keys[160:176])
+    return bytes(state)
+
+
+def reference_decrypt_block(block, round_keys, inv_sbox):
+    state = add_round_key(list(block), round_keys[160:176])
+    state = inv_shift_rows(state)
+    state = sub_bytes(state, inv_sbox)
+    for rnd in range(Nr-1, 0, -1):
+        state = add_round_key(state, round_keys[16*rnd : 16*(rnd+1)])
+        state = inv_mix_columns(state)
+        state = inv_shift_rows(state)
+        state = sub_bytes(state, inv_sbox)
+    state = add_round_key(state, round_keys[:16])
+    return bytes(state)
+
+
+def _per_block(fn):
+    def run(data):
+        mv = memoryview(data)
+        return b"".join(fn(mv[i:i+16]) for i in range(0, len(mv), 16))
+    return run
+
+
+def _reference_encrypt(cipher, data):
+    rk, sbox = cipher.round_keys, cipher.sbox
+    return _per_block(lambda b: reference_encrypt_block(b, rk, sbox))(data)
+
+
+def _reference_decrypt(cipher, data):
+    rk, inv_sbox = cipher.round_keys, cipher.inv_sbox
+    return _per_block(lambda b: reference_decrypt_block(b, rk, inv_sbox))(data)
+
+
+# --------------------------
+# T-table & unrolled
+# --------------------------
+def _ttable_encrypt(cipher, data):
+    ek, tables = cipher._ek, cipher._tables
+    return _per_block(lambda b: ttable_encrypt_block(b, ek, tables))(data)
+
+
+def _ttable_decrypt(cipher, data):
+    dk, inv_tables = cipher._dk, cipher._inv_tables
+    return _per_block(lambda b: ttable_decrypt_block(b, dk, inv_tables))(data)
+
+
+def _ttable_into(cipher, src, dst, decrypt):
+    if decrypt:
+        fn, rk, tables = ttable_decrypt_block, cipher._dk, cipher._inv_tables
+    else:
+        fn, rk, tables = ttable_encrypt_block, cipher._ek, cipher._tables
+    for i in range(0, len(src), 16):
+        dst[i:i+16] = fn(src[i:i+16], rk, tables)
+
+
+def _unrolled_encrypt(cipher, data):
+    return _per_block(cipher.compiled().encrypt_block)(data)
+
+
+def _unrolled_decrypt(cipher, data):
+    return _per_block(cipher.compiled().decrypt_block)(data)
+
+
+# --------------------------
+# NumPy batch & bitsliced
+# --------------------------
+def _numpy_encrypt(cipher, data):
+    return cipher.encrypt_array(as_block_array(data)).tobytes()
+
+
+def _numpy_decrypt(cipher, data):
+    return cipher.decrypt_array(as_block_array(data)).tobytes()
+
+
+def _numpy_into(cipher, src, dst, decrypt):
+    src_arr = np.frombuffer(src, dtype=np.uint8).reshape(-1, 16)
+    dst_arr = np.frombuffer(dst, dtype=np.uint8).reshape(-1, 16)
+    crypt = cipher.decrypt_array if decrypt else cipher.encrypt_array
+    step = INTO_CHUNK_SIZE // 16
+    for a in range(0, len(src_arr), step):
+        dst_arr[a:a+step] = crypt(src_arr[a:a+step])
+
+
+def _bitsliced_encrypt(cipher, data):
+    return cipher.encrypt_bitsliced(data)
+
+
+def _bitsliced_decrypt(cipher, data):
+    return cipher.decrypt_bitsliced(data)
+
+
+# --------------------------
+# OpenSSL (cryptography) — hanya S-Box standar
+# --------------------------
+def _ossl_run(cipher, mode, data, decrypt):
+    ctx = _OsslCipher(_ossl_algorithms.AES(cipher.key), mode)
+    op = ctx.decryptor() if decrypt else ctx.encryptor()
+    return op.update(bytes(data)) + op.finalize()
+
+
+def _openssl_encrypt(cipher, data):
+    return _ossl_run(cipher, _ossl_modes.ECB(), data, decrypt=False)
+
+
+def _openssl_decrypt(cipher, data):
+    return _ossl_run(cipher, _ossl_modes.ECB(), data, decrypt=True)
+
+
+def _openssl_cbc(cipher, iv, data, decrypt, offset=0):
+    return _ossl_run(cipher, _ossl_modes.CBC(bytes(iv)), data, decrypt)
+
+
+def _openssl_ctr(cipher, iv, data, decrypt, offset=0):
+    block_idx, skip = divmod(offset, 16)
+    start = ((int.from_bytes(bytes(iv), "big") + block_idx) & MASK128).to_bytes(16, "big")
+    out = _ossl_run(cipher, _ossl_modes.CTR(start), bytes(skip) + bytes(data), decrypt)
+    return out[skip:]
+
+
+register_backend(CipherBackend(
+    "reference", 0, _reference_encrypt, _reference_decrypt))
+register_backend(CipherBackend(
+    "ttable", 10, _ttable_encrypt, _ttable_decrypt, into=_ttable_into))
+register_backend(CipherBackend(
+    "unrolled", 12, _unrolled_encrypt, _unrolled_decrypt, min_blocks=1024))
+register_backend(CipherBackend(
+    "bitsliced", 30, _bitsliced_encrypt, _bitsliced_decrypt, min_blocks=2048))
+register_backend(CipherBackend(
+    "numpy", 50, _numpy_encrypt, _numpy_decrypt, min_blocks=BATCH_MIN_BLOCKS,
+    is_available=lambda: np is not None, into=_numpy_into))
+register_backend(CipherBackend(
+    "openssl", 100, _openssl_encrypt, _openssl_decrypt,
+    sboxes={tuple(AES_SBOX)}, is_available=lambda: _OsslCipher is not None,
+    mode_impls={"cbc": _openssl_cbc, "ctr": _openssl_ctr}))
+
+
+def _self_check(backend, sbox) -> bool:
+    """Bandingkan backend dengan reference untuk 80 blok uji (sekali per S-Box)."""
+    key = (backend.name, tuple(sbox))
+    ok = _BACKEND_CHECKED.get(key)
+    if ok is not None:
+        return ok
+    if backend.name == "reference":
+        _BACKEND_CHECKED[key] = True
+        return True
+
+    cipher = AESCipher(bytes(range(16)), sbox, backend="reference")
+    data = bytes((7 * i + 3) & 0xFF for i in range(16 * 80))
+    expected = _reference_encrypt(cipher, data)
+    try:
+        out = bytearray(len(data))
+        backend.crypt_into(cipher, memoryview(data), memoryview(out))
+        ok = (backend.encrypt(cipher, data) == expected and out == expected and
+              backend.decrypt(cipher, expected) == data)
+    except Exception as exc:   # backend rusak → jangan dipakai
+        warnings.warn(f"Backend {backend.name!r} gagal self-check: {exc}")
+        ok = False
+    else:
+        if not ok:
+            warnings.warn(f"Backend {backend.name!r} tidak cocok dengan reference; dinonaktifkan.")
+    _BACKEND_CHECKED[key] = ok
+    return ok
+
+
+def available_backends(sbox=AES_SBOX, mode="ecb"):
+    """Backend yang mendukung (S-Box, mode), urut dari yang tercepat."""
+    return sorted(
+        (b for b in BACKENDS.values() if b.supports(sbox, mode)),
+        key=lambda b: b.speed, reverse=True,
+    )
+
+
+def select_backend(sbox=AES_SBOX, mode="ecb", n_blocks=1) -> CipherBackend:
+    """Backend tercepat yang valid & lolos self-check untuk (S-Box, mode, jumlah blok)."""
+    for backend in available_backends(sbox, mode):
+        if n_blocks >= backend.min_blocks and _self_check(backend, sbox):
+            return backend
+    return BACKENDS["reference"]
+
+
+def native_mode_impl(cipher, mode, n_blocks):
+    """Implementasi native mode dari backend terpilih (atau None → pakai versi generik)."""
+    backend = cipher.backend_for(mode, n_blocks)
+    return backend.mode_impls.get(mode)
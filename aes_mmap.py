@@ -0,0 +1,121 @@
+"""
+Enkripsi/dekripsi file besar lewat mmap (in-place atau ke mapping output).
+
+File di-mmap lalu diproses per chunk lewat memoryview dengan engine blok
+aes_backend (AESCipher.encrypt_into), tanpa membaca seluruh file ke objek bytes.
+Padding PKCS7 ditulis/dibuang langsung di ujung file.
+"""
+
+import mmap
+import os
+
+import aes_backend as ab
+
+# Default ukuran chunk yang diproses per langkah (kelipatan 16)
+MMAP_CHUNK_SIZE = 4 << 20
+
+
+def _crypt_chunks(cipher, src, dst, decrypt, chunk_size=MMAP_CHUNK_SIZE):
+    """
+    Proses src → dst (memoryview sama panjang, kelipatan 16) per chunk.
+    src dan dst boleh sama (in-place).
+    """
+    n = len(src)
+    chunk_size = max(16, chunk_size - chunk_size % 16)
+    crypt = cipher.decrypt_into if decrypt else cipher.encrypt_into
+    for a in range(0, n, chunk_size):
+        b = min(a + chunk_size, n)
+        crypt(src[a:b], dst[a:b])
+
+
+def _pad_len(n):
+    return 16 - n % 16
+
+
+def _check_unpad(mm, n):
+    return ab.pkcs7_unpad_length(mm, n)
+
+
+def encrypt_file_inplace(path, key_bytes, sbox=ab.AES_SBOX, chunk_size=MMAP_CHUNK_SIZE) -> int:
+    """
+    Enkripsi file di tempat (ECB + PKCS7). File bertambah 1..16 byte padding.
+    Return: ukuran file ciphertext.
+    """
+    cipher = ab.get_cipher(key_bytes, sbox)
+    with open(path, "r+b") as f:
+        n = os.fstat(f.fileno()).st_size
+        pad = _pad_len(n)
+        f.seek(n)
+        f.write(bytes([pad]) * pad)
+        f.flush()
+        total = n + pad
+
+        with mmap.mmap(f.fileno(), total) as mm, memoryview(mm) as mv:
+            _crypt_chunks(cipher, mv, mv, decrypt=False, chunk_size=chunk_size)
+            mm.flush()
+    return total
+
+
+def decrypt_file_inplace(path, key_bytes, sbox=ab.AES_SBOX, chunk_size=MMAP_CHUNK_SIZE) -> int:
+    """Dekripsi file di tempat lalu potong padding. Return: ukuran plaintext."""
+    cipher = ab.get_cipher(key_bytes, sbox)
+    with open(path, "r+b") as f:
+        total = os.fstat(f.fileno()).st_size
+        if total == 0 or total % 16 != 0:
+            raise ValueError("Panjang ciphertext (dalam byte) harus kelipatan 16.")
+
+        with mmap.mmap(f.fileno(), total) as mm:
+            with memoryview(mm) as mv:
+                _crypt_chunks(cipher, mv, mv, decrypt=True, chunk_size=chunk_size)
+            mm.flush()
+            n = _check_unpad(mm, total)
+        f.truncate(n)
+    return n
+
+
+def encrypt_file_mapped(src_path, dst_path, key_bytes, sbox=ab.AES_SBOX, chunk_size=MMAP_CHUNK_SIZE) -> int:
+    """
+    Enkripsi src → dst lewat dua mapping; dst dialokasikan dulu sebesar ciphertext.
+    Return: ukuran file ciphertext.
+    """
+    cipher = ab.get_cipher(key_bytes, sbox)
+    with open(src_path, "rb") as fin, open(dst_path, "w+b") as fout:
+        n = os.fstat(fin.fileno()).st_size
+        pad = _pad_len(n)
+        full = n - n % 16
+        total = n + pad
+        fout.truncate(total)
+
+        with mmap.mmap(fout.fileno(), total) as out_mm, memoryview(out_mm) as out_mv:
+            if full:
+                with mmap.mmap(fin.fileno(), n, access=mmap.ACCESS_READ) as in_mm, \
+                        memoryview(in_mm) as in_mv:
+                    _crypt_chunks(cipher, in_mv[:full], out_mv[:full], decrypt=False,
+                                  chunk_size=chunk_size)
+                    # Blok terakhir: sisa plaintext + padding
+                    out_mv[full:n] = in_mv[full:n]
+            elif n:
+                out_mv[:n] = fin.read(n)
+            out_mv[n:total] = bytes([pad]) * pad
+            out_mv[full:total] = cipher.encrypt_block(out_mv[full:total])
+            out_mm.flush()
+    return total
+
+
+def decrypt_file_mapped(src_path, dst_path, key_bytes, sbox=ab.AES_SBOX, chunk_size=MMAP_CHUNK_SIZE) -> int:
+    """Dekripsi src → dst lewat mapping, lalu potong padding. Return: ukuran plaintext."""
+    cipher = ab.get_cipher(key_bytes, sbox)
+    with open(src_path, "rb") as fin, open(dst_path, "w+b") as fout:
+        total = os.fstat(fin.fileno()).st_size
+        if total == 0 or total % 16 != 0:
+            raise ValueError("Panjang ciphertext (dalam byte) harus kelipatan 16.")
+        fout.truncate(total)
+
+        with mmap.mmap(fin.fileno(), total, access=mmap.ACCESS_READ) as in_mm, \
+                mmap.mmap(fout.fileno(), total) as out_mm:
+            with memoryview(in_mm) as in_mv, memoryview(out_mm) as out_mv:
+                _crypt_chunks(cipher, in_mv, out_mv, decrypt=True, chunk_size=chunk_size)
+            out_mm.flush()
+            n = _check_unpad(out_mm, total)
+        fout.truncate(n)
+    return n
@@ -0,0 +1,776 @@
+# -*- coding: utf-8 -*-
+"""
+Mode operasi & API level byte di atas aes_core.
+
+API byte zero-copy dan wrapper string (ECB), streaming, CTR, CBC/CFB/OFB,
+GCM dan XTS. Tidak ada kerja saat import.
+"""
+
+from aes_core import (
+    AES_SBOX,
+    BATCH_MIN_BLOCKS,
+    MASK128,
+    SBOX44,
+    AESCipher,
+    get_cipher,
+    native_mode_impl,
+    np,
+    pkcs7_pad,
+    pkcs7_unpad,
+)
+
+__all__ = [
+    "encrypt_ecb_into", "decrypt_ecb_into", "encrypt_aes_std_str",
+    "decrypt_aes_std_str", "encrypt_aes_44_str", "decrypt_aes_44_str",
+    "STREAM_CHUNK_SIZE", "BlockStream", "StreamEncryptor", "StreamDecryptor",
+    "encrypt_iter", "decrypt_iter", "encrypt_file", "decrypt_file", "CTR_BATCH_BLOCKS",
+    "ctr_counter_blocks", "ctr_keystream", "xor_bytes", "ctr_crypt", "CTRMode",
+    "encrypt_ctr", "decrypt_ctr_range", "cbc_encrypt_blocks", "cbc_decrypt_blocks",
+    "cfb_encrypt", "cfb_decrypt", "ofb_crypt", "encrypt_cbc", "decrypt_cbc",
+    "encrypt_cfb", "decrypt_cfb", "encrypt_ofb", "decrypt_ofb", "ghash_tables", "GHash",
+    "GCMEncryptor", "GCMDecryptor", "encrypt_gcm", "decrypt_gcm", "XTS_SECTOR_SIZE",
+    "XTSCipher",
+]
+
+# ===========================================
+# Cell 6 — API byte (zero-copy) & wrapper string (AES standar & SBOX44)
+# ===========================================
+#
+# Level byte menerima buffer apa pun dan menulis ke buffer milik pemanggil;
+# wrapper string/hex hanya shim tipis di atasnya.
+
+def encrypt_ecb_into(src, dst, key_bytes, sbox=AES_SBOX) -> int:
+    """
+    Enkripsi ECB + PKCS7 level byte: src (buffer apa pun) → dst (buffer writable,
+    minimal padded_length(len(src)) byte). Return: panjang ciphertext.
+    """
+    return get_cipher(key_bytes, sbox).encrypt_ecb_into(src, dst)
+
+
+def decrypt_ecb_into(src, dst, key_bytes, sbox=AES_SBOX) -> int:
+    """Kebalikan encrypt_ecb_into. Return: panjang plaintext yang valid di dst."""
+    return get_cipher(key_bytes, sbox).decrypt_ecb_into(src, dst)
+
+
+def _encrypt_str(plaintext, key_str, sbox, key_error) -> str:
+    key_bytes = key_str.encode("utf-8")
+    if len(key_bytes) != 16:
+        raise ValueError(key_error)
+    return get_cipher(key_bytes, sbox).encrypt_ecb(plaintext.encode("utf-8")).hex()
+
+
+def _decrypt_str(cipher_hex, key_str, sbox, key_error) -> str:
+    key_bytes = key_str.encode("utf-8")
+    if len(key_bytes) != 16:
+        raise ValueError(key_error)
+
+    ciphertext = bytes.fromhex(cipher_hex)
+    if len(ciphertext) % 16 != 0:
+        raise ValueError("Panjang ciphertext (dalam byte) harus kelipatan 16.")
+    return get_cipher(key_bytes, sbox).decrypt_ecb(ciphertext).decode("utf-8")
+
+
+_KEY_ERROR_STD = "Key untuk AES standar harus 16 byte (16 karakter ASCII/UTF-8 sederhana)."
+_KEY_ERROR_44 = "Key untuk AES SBOX44 harus 16 byte (16 karakter)."
+
+
+def encrypt_aes_std_str(plaintext: str, key_str: str) -> str:
+    """
+    Enkripsi plaintext (string bebas panjang) dengan AES standar (ECB, 128-bit).
+    Hasil: hex string.
+    """
+    return _encrypt_str(plaintext, key_str, AES_SBOX, _KEY_ERROR_STD)
+
+
+def decrypt_aes_std_str(cipher_hex: str, key_str: str) -> str:
+    """
+    Dekripsi hex string dengan AES standar (ECB, 128-bit).
+    Mengembalikan plaintext string.
+    """
+    return _decrypt_str(cipher_hex, key_str, AES_SBOX, _KEY_ERROR_STD)
+
+
+def encrypt_aes_44_str(plaintext: str, key_str: str) -> str:
+    """
+    Enkripsi plaintext (string) dengan AES yang memakai SBOX44 (ECB, 128-bit).
+    Hasil: hex string.
+    """
+    return _encrypt_str(plaintext, key_str, SBOX44, _KEY_ERROR_44)
+
+
+def decrypt_aes_44_str(cipher_hex: str, key_str: str) -> str:
+    """
+    Dekripsi hex string dengan AES yang memakai SBOX44 (ECB, 128-bit).
+    Mengembalikan plaintext string.
+    """
+    return _decrypt_str(cipher_hex, key_str, SBOX44, _KEY_ERROR_44)
+
+
+# ===========================================
+# Cell 6A — Streaming encrypt/decrypt (file-like & iterator)
+# ===========================================
+#
+# Data diproses per chunk: memori konstan berapa pun ukuran input.
+# PKCS7 hanya disentuh di finalize().
+
+# Default ukuran chunk baca file
+STREAM_CHUNK_SIZE = 1 << 20
+
+
+class BlockStream:
+    """
+    Basis streaming per blok 16 byte.
+    Subclass mengisi _process(mv) (mv kelipatan 16) dan _final(tail).
+    holdback=True → blok terakhir ditahan sampai finalize (untuk unpad);
+    None → pakai default kelas.
+    """
+
+    holdback = False
+
+    def __init__(self, key_bytes, sbox=AES_SBOX, holdback=None):
+        self.cipher = key_bytes if isinstance(key_bytes, AESCipher) else get_cipher(key_bytes, sbox)
+        if holdback is not None:
+            self.holdback = holdback
+        self._buf = bytearray()
+        self._done = False
+
+    def update(self, data) -> bytes:
+        if self._done:
+            raise ValueError("Stream sudah di-finalize.")
+        buf = self._buf
+        buf += data
+        n = len(buf) - len(buf) % 16
+        if self.holdback and n == len(buf):
+            n -= 16
+        if n <= 0:
+            return b""
+        mv = memoryview(buf)
+        try:
+            out = self._process(mv[:n])
+        finally:
+            mv.release()
+        del buf[:n]
+        return out
+
+    def finalize(self) -> bytes:
+        if self._done:
+            raise ValueError("Stream sudah di-finalize.")
+        self._done = True
+        tail = bytes(self._buf)
+        self._buf.clear()
+        return self._final(tail)
+
+
+class StreamEncryptor(BlockStream):
+    """Enkripsi ECB streaming; PKCS7 ditambahkan di finalize()."""
+
+    def _process(self, mv):
+        return self.cipher.encrypt_blocks(mv)
+
+    def _final(self, tail):
+        return self.cipher.encrypt_blocks(pkcs7_pad(tail, 16))
+
+
+class StreamDecryptor(BlockStream):
+    """Dekripsi ECB streaming; blok terakhir ditahan lalu di-unpad di finalize()."""
+
+    holdback = True
+
+    def _process(self, mv):
+        return self.cipher.decrypt_blocks(mv)
+
+    def _final(self, tail):
+        if len(tail) != 16:
+            raise ValueError("Panjang ciphertext (dalam byte) harus kelipatan 16.")
+        return pkcs7_unpad(self.cipher.decrypt_blocks(tail))
+
+
+def _stream_iter(stream, chunks):
+    for chunk in chunks:
+        out = stream.update(chunk)
+        if out:
+            yield out
+    out = stream.finalize()
+    if out:
+        yield out
+
+
+def encrypt_iter(chunks, key_bytes, sbox=AES_SBOX):
+    """Generator: iterable chunk plaintext (bytes) → chunk ciphertext."""
+    return _stream_iter(StreamEncryptor(key_bytes, sbox), chunks)
+
+
+def decrypt_iter(chunks, key_bytes, sbox=AES_SBOX):
+    """Generator: iterable chunk ciphertext (bytes) → chunk plaintext."""
+    return _stream_iter(StreamDecryptor(key_bytes, sbox), chunks)
+
+
+def _read_chunks(fin, chunk_size):
+    while True:
+        chunk = fin.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def _copy_stream(stream, fin, fout, chunk_size) -> int:
+    written = 0
+    for out in _stream_iter(stream, _read_chunks(fin, chunk_size)):
+        fout.write(out)
+        written += len(out)
+    return written
+
+
+def encrypt_file(fin, fout, key_bytes, sbox=AES_SBOX, chunk_size=STREAM_CHUNK_SIZE) -> int:
+    """
+    Enkripsi file biner (file object) ke file lain per chunk.
+    Return: jumlah byte ciphertext yang ditulis.
+    """
+    return _copy_stream(StreamEncryptor(key_bytes, sbox), fin, fout, chunk_size)
+
+
+def decrypt_file(fin, fout, key_bytes, sbox=AES_SBOX, chunk_size=STREAM_CHUNK_SIZE) -> int:
+    """Kebalikan encrypt_file. Return: jumlah byte plaintext yang ditulis."""
+    return _copy_stream(StreamDecryptor(key_bytes, sbox), fin, fout, chunk_size)
+
+# ===========================================
+# Cell 6B — Mode CTR (random access)
+# ===========================================
+#
+# Counter block = IV 16 byte yang dinaikkan sebagai integer 128-bit big-endian.
+# Keystream dibangkitkan per batch lewat AESCipher.encrypt_blocks (engine
+# tercepat yang tersedia). Byte ke-i memakai counter blok i // 16, jadi
+# rentang byte mana pun bisa didekripsi tanpa menyentuh blok lain.
+
+# Jumlah blok keystream per batch (1 MB)
+CTR_BATCH_BLOCKS = 1 << 16
+
+_MASK64 = (1 << 64) - 1
+
+
+def ctr_counter_blocks(iv, start_block, n_blocks, counter_bits=128) -> bytes:
+    """
+    Counter block ke-start_block .. start_block+n_blocks-1 (bytes n_blocks×16).
+    counter_bits=32 → hanya 4 byte terakhir yang dinaikkan (inc32, dipakai GCM).
+    """
+    if counter_bits == 32:
+        prefix = bytes(iv[:12])
+        low = (int.from_bytes(bytes(iv[12:]), "big") + start_block) & 0xFFFFFFFF
+        if np is not None and n_blocks >= BATCH_MIN_BLOCKS:
+            ctr = np.empty((n_blocks, 16), dtype=np.uint8)
+            ctr[:, :12] = np.frombuffer(prefix, dtype=np.uint8)
+            words = (np.arange(n_blocks, dtype=np.uint64) + np.uint64(low)) & np.uint64(0xFFFFFFFF)
+            ctr[:, 12:] = words.astype(">u4").view(np.uint8).reshape(-1, 4)
+            return ctr.tobytes()
+        return b"".join(
+            prefix + ((low + i) & 0xFFFFFFFF).to_bytes(4, "big") for i in range(n_blocks)
+        )
+
+    base = (int.from_bytes(bytes(iv), "big") + start_block) & MASK128
+    if np is not None and n_blocks >= BATCH_MIN_BLOCKS:
+        hi, lo = base >> 64, base & _MASK64
+        ctr = np.empty((n_blocks, 2), dtype=">u8")
+        low = np.arange(n_blocks, dtype=np.uint64) + np.uint64(lo)   # wrap mod 2^64
+        ctr[:, 1] = low
+        ctr[:, 0] = (np.uint64(hi) + (low < np.uint64(lo))).astype(np.uint64)
+        return ctr.tobytes()
+    return b"".join(
+        ((base + i) & MASK128).to_bytes(16, "big") for i in range(n_blocks)
+    )
+
+
+def ctr_keystream(cipher, iv, start_block, n_blocks, counter_bits=128) -> bytes:
+    """Keystream CTR untuk blok start_block .. start_block+n_blocks-1."""
+    return cipher.encrypt_blocks(ctr_counter_blocks(iv, start_block, n_blocks, counter_bits))
+
+
+def xor_bytes(a, b) -> bytes:
+    """a ⊕ b[:len(a)] untuk data bytes-like (lewat satu integer besar)."""
+    n = len(a)
+    return (int.from_bytes(a, "little") ^ int.from_bytes(b[:n], "little")).to_bytes(n, "little")
+
+
+def ctr_crypt(cipher, iv, data, offset=0, counter_bits=128) -> bytes:
+    """
+    Enkripsi = dekripsi CTR untuk `data` yang berada di posisi byte `offset`
+    dari awal stream. Hanya counter block yang dibutuhkan yang dihitung.
+    """
+    if len(iv) != 16:
+        raise ValueError("IV/counter awal CTR harus 16 byte.")
+    if counter_bits == 128:
+        native = native_mode_impl(cipher, "ctr", (len(data) + 15) // 16)
+        if native is not None:
+            return native(cipher, iv, data, False, offset)
+    data = memoryview(data).cast("B")
+    out = []
+    pos = 0
+    while pos < len(data):
+        block_idx, skip = divmod(offset + pos, 16)
+        take = min(len(data) - pos, CTR_BATCH_BLOCKS * 16 - skip)
+        n_blocks = (skip + take + 15) // 16
+        ks = ctr_keystream(cipher, iv, block_idx, n_blocks, counter_bits)
+        out.append(xor_bytes(data[pos:pos + take], ks[skip:skip + take]))
+        pos += take
+    return b"".join(out)
+
+
+class CTRMode:
+    """
+    Stream CTR yang bisa di-seek.
+
+    ctr = CTRMode(key, iv, sbox=SBOX44)
+    ct  = ctr.update(data)             # posisi maju otomatis
+    pt  = ctr.crypt_at(ct[4096:8192], 4096)   # random access
+    """
+
+    def __init__(self, key_bytes, iv, sbox=AES_SBOX):
+        self.cipher = key_bytes if isinstance(key_bytes, AESCipher) else get_cipher(key_bytes, sbox)
+        if len(iv) != 16:
+            raise ValueError("IV/counter awal CTR harus 16 byte.")
+        self.iv = bytes(iv)
+        self.position = 0
+
+    def seek(self, offset):
+        self.position = offset
+
+    def update(self, data) -> bytes:
+        out = ctr_crypt(self.cipher, self.iv, data, self.position)
+        self.position += len(out)
+        return out
+
+    def crypt_at(self, data, offset) -> bytes:
+        return ctr_crypt(self.cipher, self.iv, data, offset)
+
+    # CTR simetris
+    encrypt = decrypt = update
+
+
+def encrypt_ctr(data, key_bytes, iv, sbox=AES_SBOX) -> bytes:
+    """Enkripsi CTR sekali jalan (tanpa padding)."""
+    return ctr_crypt(get_cipher(key_bytes, sbox), iv, data)
+
+
+def decrypt_ctr_range(ciphertext_range, offset, key_bytes, iv, sbox=AES_SBOX) -> bytes:
+    """Dekripsi potongan ciphertext yang dimulai di byte `offset` dari stream CTR."""
+    return ctr_crypt(get_cipher(key_bytes, sbox), iv, ciphertext_range, offset)
+
+# ===========================================
+# Cell 6C — Mode CBC / CFB / OFB
+# ===========================================
+#
+# Enkripsi CBC/CFB/OFB berantai (serial). Dekripsi CBC & CFB paralel:
+# plaintext blok i hanya bergantung pada C[i] dan C[i-1], jadi semua blok
+# di-(de)kripsi sekaligus lewat engine bulk lalu di-XOR dalam satu langkah.
+# CFB di sini CFB-128 (segmen 16 byte); CFB & OFB tanpa padding.
+
+
+def _check_iv(iv):
+    if len(iv) != 16:
+        raise ValueError("IV harus 16 byte.")
+    return bytes(iv)
+
+
+def cbc_encrypt_blocks(cipher, iv, data) -> bytes:
+    """CBC tanpa padding (panjang kelipatan 16)."""
+    if len(data) % 16 != 0:
+        raise ValueError("Panjang data (dalam byte) harus kelipatan 16.")
+    native = native_mode_impl(cipher, "cbc", len(data) // 16)
+    if native is not None:
+        return native(cipher, _check_iv(iv), data, False)
+    encrypt_block = cipher.encrypt_block
+    prev = int.from_bytes(_check_iv(iv), "big")
+    mv = memoryview(data)
+    out = []
+    for i in range(0, len(data), 16):
+        block = encrypt_block((int.from_bytes(mv[i:i+16], "big") ^ prev).to_bytes(16, "big"))
+        out.append(block)
+        prev = int.from_bytes(block, "big")
+    return b"".join(out)
+
+
+def cbc_decrypt_blocks(cipher, iv, data) -> bytes:
+    """CBC tanpa padding: D(C[i]) ^ C[i-1] untuk semua blok sekaligus."""
+    if len(data) % 16 != 0:
+        raise ValueError("Panjang ciphertext (dalam byte) harus kelipatan 16.")
+    if not data:
+        return b""
+    native = native_mode_impl(cipher, "cbc", len(data) // 16)
+    if native is not None:
+        return native(cipher, _check_iv(iv), data, True)
+    data = bytes(data)
+    decrypted = cipher.decrypt_blocks(data)
+    return xor_bytes(decrypted, _check_iv(iv) + data[:-16])
+
+
+def cfb_encrypt(cipher, iv, data) -> bytes:
+    """CFB-128: C[i] = P[i] ^ E(C[i-1]); blok terakhir boleh parsial."""
+    encrypt_block = cipher.encrypt_block
+    prev = _check_iv(iv)
+    mv = memoryview(data)
+    out = []
+    for i in range(0, len(data), 16):
+        block = xor_bytes(mv[i:i+16], encrypt_block(prev))
+        out.append(block)
+        prev = block
+    return b"".join(out)
+
+
+def cfb_decrypt(cipher, iv, data) -> bytes:
+    """CFB-128: keystream E(IV || C[0..n-2]) dihitung dalam satu batch."""
+    if not data:
+        return b""
+    data = bytes(data)
+    n_full = (len(data) - 1) // 16          # blok ciphertext yang jadi input keystream
+    feed = _check_iv(iv) + data[:16 * n_full]
+    return xor_bytes(data, cipher.encrypt_blocks(feed))
+
+
+def ofb_crypt(cipher, iv, data) -> bytes:
+    """OFB: keystream O[i] = E(O[i-1]) (serial); enkripsi = dekripsi."""
+    encrypt_block = cipher.encrypt_block
+    n_blocks = (len(data) + 15) // 16
+    o = _check_iv(iv)
+    ks = []
+    for _ in range(n_blocks):
+        o = encrypt_block(o)
+        ks.append(o)
+    return xor_bytes(data, b"".join(ks))
+
+
+# --------------------------
+# Wrapper bytes (key + S-Box)
+# --------------------------
+def encrypt_cbc(data, key_bytes, iv, sbox=AES_SBOX) -> bytes:
+    """CBC + PKCS7."""
+    return cbc_encrypt_blocks(get_cipher(key_bytes, sbox), iv, pkcs7_pad(bytes(data), 16))
+
+
+def decrypt_cbc(ciphertext, key_bytes, iv, sbox=AES_SBOX) -> bytes:
+    return pkcs7_unpad(cbc_decrypt_blocks(get_cipher(key_bytes, sbox), iv, ciphertext))
+
+
+def encrypt_cfb(data, key_bytes, iv, sbox=AES_SBOX) -> bytes:
+    return cfb_encrypt(get_cipher(key_bytes, sbox), iv, data)
+
+
+def decrypt_cfb(ciphertext, key_bytes, iv, sbox=AES_SBOX) -> bytes:
+    return cfb_decrypt(get_cipher(key_bytes, sbox), iv, ciphertext)
+
+
+def encrypt_ofb(data, key_bytes, iv, sbox=AES_SBOX) -> bytes:
+    return ofb_crypt(get_cipher(key_bytes, sbox), iv, data)
+
+
+decrypt_ofb = encrypt_ofb
+
+# ===========================================
+# Cell 6D — Mode GCM (AEAD) dengan GHASH berbasis tabel
+# ===========================================
+#
+# CTR (inc32) + GHASH dalam satu lintasan. Perkalian GF(2^128) dengan
+# hash key H memakai tabel 8-bit per posisi byte: tab[pos][b] = (b di posisi
+# pos) · H, jadi X·H = XOR 16 lookup, tanpa loop bit & tanpa reduksi.
+# Blok 128-bit direpresentasikan sebagai integer big-endian (bit MSB byte 0
+# = koefisien x^0, sesuai konvensi GCM).
+
+import hmac
+from functools import lru_cache
+
+_GCM_R = 0xE1 << 120
+
+
+def _gf128_mulx(v):
+    """v · x di GF(2^128) (representasi GCM: geser kanan + reduksi)."""
+    return (v >> 1) ^ _GCM_R if v & 1 else v >> 1
+
+
+@lru_cache(maxsize=32)
+def ghash_tables(h: bytes):
+    """
+    Tabel perkalian untuk hash key H (16 byte):
+    tab[pos][b] = integer 128-bit dari (byte b di posisi pos) · H.
+    Di-cache per H: dibangun sekali per key, bukan per pesan.
+    """
+    v = int.from_bytes(bytes(h), "big")
+    powers = []                      # powers[i] = H · x^i
+    for _ in range(128):
+        powers.append(v)
+        v = _gf128_mulx(v)
+
+    tables = []
+    for pos in range(16):
+        # bit j dari byte di posisi pos = koefisien x^(8*pos + 7 - j)
+        basis = [powers[8*pos + 7 - j] for j in range(8)]
+        tab = [0] * 256
+        for b in range(1, 256):
+            low = b & -b
+            tab[b] = tab[b ^ low] ^ basis[low.bit_length() - 1]
+        tables.append(tuple(tab))
+    return tuple(tables)
+
+
+class GHash:
+    """Akumulator GHASH dengan tabel per hash key."""
+
+    def __init__(self, h):
+        self._tab = ghash_tables(bytes(h))
+        self.y = 0
+
+    def _mul(self, x):
+        t = self._tab
+        b = x.to_bytes(16, "big")
+        return (t[0][b[0]] ^ t[1][b[1]] ^ t[2][b[2]] ^ t[3][b[3]] ^
+                t[4][b[4]] ^ t[5][b[5]] ^ t[6][b[6]] ^ t[7][b[7]] ^
+                t[8][b[8]] ^ t[9][b[9]] ^ t[10][b[10]] ^ t[11][b[11]] ^
+                t[12][b[12]] ^ t[13][b[13]] ^ t[14][b[14]] ^ t[15][b[15]])
+
+    def update(self, data):
+        """Tambah data; blok terakhir yang parsial di-pad nol."""
+        mul = self._mul
+        y = self.y
+        mv = memoryview(data).cast("B")
+        for i in range(0, len(mv), 16):
+            block = mv[i:i+16]
+            x = int.from_bytes(block, "big")
+            if len(block) < 16:
+                x <<= 8 * (16 - len(block))
+            y = mul(y ^ x)
+        self.y = y
+
+    def digest(self) -> bytes:
+        return self.y.to_bytes(16, "big")
+
+
+class _GCMBase:
+    """
+    Konteks GCM streaming. Urutan pakai: update_aad(...) dulu (boleh berkali-kali),
+    lalu update(...) untuk data, terakhir finalize().
+    """
+
+    def __init__(self, key_bytes, iv, sbox=AES_SBOX):
+        self.cipher = key_bytes if isinstance(key_bytes, AESCipher) else get_cipher(key_bytes, sbox)
+        iv = bytes(iv)
+        if not iv:
+            raise ValueError("IV GCM tidak boleh kosong.")
+
+        h = self.cipher.encrypt_block(bytes(16))
+        if len(iv) == 12:
+            j0 = iv + b"\x00\x00\x00\x01"
+        else:
+            g = GHash(h)
+            g.update(iv)
+            g.update((8 * len(iv)).to_bytes(16, "big"))
+            j0 = g.digest()
+
+        self._ghash = GHash(h)
+        self._ek_j0 = self.cipher.encrypt_block(j0)
+        self._j0 = j0
+        self._aad_buf = bytearray()
+        self._ct_buf = bytearray()
+        self._aad_len = 0
+        self._ct_len = 0
+        self._in_data = False
+        self._done = False
+
+    def update_aad(self, aad):
+        if self._in_data or self._done:
+            raise ValueError("AAD harus diberikan sebelum data.")
+        self._aad_len += len(aad)
+        self._absorb(self._aad_buf, aad)
+
+    def _absorb(self, buf, data):
+        """Masukkan data ke GHASH per blok penuh; sisa disimpan di buf."""
+        buf += data
+        n = len(buf) - len(buf) % 16
+        if n:
+            self._ghash.update(buf[:n])
+            del buf[:n]
+
+    def _start_data(self):
+        if not self._in_data:
+            if self._aad_buf:
+                self._ghash.update(self._aad_buf)     # pad nol
+                self._aad_buf.clear()
+            self._in_data = True
+
+    def _ctr(self, data) -> bytes:
+        out = ctr_crypt(self.cipher, self._j0, data, 16 + self._ct_len, counter_bits=32)
+        self._ct_len += len(data)
+        return out
+
+    def _tag(self) -> bytes:
+        self._start_data()
+        if self._ct_buf:
+            self._ghash.update(self._ct_buf)
+            self._ct_buf.clear()
+        self._ghash.update((8 * self._aad_len).to_bytes(8, "big") + (8 * self._ct_len).to_bytes(8, "big"))
+        return xor_bytes(self._ghash.digest(), self._ek_j0)
+
+
+class GCMEncryptor(_GCMBase):
+    """Enkripsi GCM streaming; tag tersedia di .tag setelah finalize()."""
+
+    tag = None
+
+    def update(self, data) -> bytes:
+        if self._done:
+            raise ValueError("Stream sudah di-finalize.")
+        self._start_data()
+        ct = self._ctr(data)
+        self._absorb(self._ct_buf, ct)
+        return ct
+
+    def finalize(self) -> bytes:
+        if self._done:
+            raise ValueError("Stream sudah di-finalize.")
+        self.tag = self._tag()
+        self._done = True
+        return b""
+
+
+class GCMDecryptor(_GCMBase):
+    """Dekripsi GCM streaming; finalize(tag) memverifikasi tag (ValueError kalau gagal)."""
+
+    def update(self, data) -> bytes:
+        if self._done:
+            raise ValueError("Stream sudah di-finalize.")
+        self._start_data()
+        self._absorb(self._ct_buf, data)
+        return self._ctr(data)
+
+    def finalize(self, tag) -> bytes:
+        if self._done:
+            raise ValueError("Stream sudah di-finalize.")
+        self._done = True
+        if not hmac.compare_digest(self._tag(), bytes(tag)):
+            raise ValueError("Tag GCM tidak valid (data/AAD/key tidak cocok).")
+        return b""
+
+
+def encrypt_gcm(data, key_bytes, iv, aad=b"", sbox=AES_SBOX):
+    """GCM sekali jalan. Return: (ciphertext, tag 16 byte)."""
+    enc = GCMEncryptor(key_bytes, iv, sbox)
+    if aad:
+        enc.update_aad(aad)
+    ct = enc.update(data)
+    enc.finalize()
+    return ct, enc.tag
+
+
+def decrypt_gcm(ciphertext, tag, key_bytes, iv, aad=b"", sbox=AES_SBOX) -> bytes:
+    """GCM sekali jalan; ValueError kalau tag tidak valid."""
+    dec = GCMDecryptor(key_bytes, iv, sbox)
+    if aad:
+        dec.update_aad(aad)
+    pt = dec.update(ciphertext)
+    dec.finalize(tag)
+    return pt
+
+# ===========================================
+# Cell 6E — Mode XTS (enkripsi per sektor)
+# ===========================================
+#
+# XTS (IEEE 1619) dengan dua konteks cipher: data_key untuk blok data,
+# tweak_key untuk tweak awal sektor T = E_K2(nomor sektor, little-endian).
+# Tweak blok berikutnya = T · α (geser kiri + 0x87), dihitung inkremental.
+# Sektor dienkripsi independen; sektor yang bukan kelipatan 16 byte
+# memakai ciphertext stealing. encrypt_sectors/decrypt_sectors memproses
+# banyak sektor sekaligus: tweak semua sektor dibangkitkan dulu, lalu
+# seluruh data lewat engine bulk dalam satu panggilan.
+
+# Ukuran sektor default (byte)
+XTS_SECTOR_SIZE = 4096
+
+
+def _xts_tweaks(t0, n_blocks):
+    """Tweak blok 0..n_blocks-1 dari tweak awal t0 (int little-endian)."""
+    out = []
+    t = t0
+    for _ in range(n_blocks):
+        out.append(t.to_bytes(16, "little"))
+        t <<= 1
+        if t >> 128:
+            t = (t & MASK128) ^ 0x87
+    return out
+
+
+class XTSCipher:
+    """
+    XTS-AES-128 untuk S-Box apa pun.
+
+    xts = XTSCipher(data_key, tweak_key, sbox=SBOX44, sector_size=4096)
+    ct  = xts.encrypt_sector(7, sector_bytes)
+    ct  = xts.encrypt_sectors(image_bytes, first_sector=0)
+    """
+
+    def __init__(self, data_key, tweak_key, sbox=AES_SBOX, sector_size=XTS_SECTOR_SIZE):
+        self.data_cipher = data_key if isinstance(data_key, AESCipher) else get_cipher(data_key, sbox)
+        self.tweak_cipher = tweak_key if isinstance(tweak_key, AESCipher) else get_cipher(tweak_key, sbox)
+        if self.data_cipher.key == self.tweak_cipher.key:
+            raise ValueError("Key data dan key tweak XTS harus berbeda.")
+        if sector_size < 16:
+            raise ValueError("Ukuran sektor XTS minimal 16 byte.")
+        self.sector_size = sector_size
+
+    def _tweak0(self, sector):
+        return int.from_bytes(self.tweak_cipher.encrypt_block(sector.to_bytes(16, "little")), "little")
+
+    def _crypt_sector(self, sector, data, decrypt):
+        n = len(data)
+        if n < 16:
+            raise ValueError("Data sektor XTS minimal 16 byte.")
+        data = bytes(data)
+        m, rem = divmod(n, 16)
+        tweaks = _xts_tweaks(self._tweak0(sector), m + (1 if rem else 0))
+        crypt = self.data_cipher.decrypt_blocks if decrypt else self.data_cipher.encrypt_blocks
+
+        if not rem:
+            tw = b"".join(tweaks)
+            return xor_bytes(crypt(xor_bytes(data, tw)), tw)
+
+        # Ciphertext stealing: blok penuh terakhir & blok parsial
+        head = 16 * (m - 1)
+        tw = b"".join(tweaks[:m - 1])
+        out_head = xor_bytes(crypt(xor_bytes(data[:head], tw)), tw) if head else b""
+
+        last_full, tail = data[head:head + 16], data[head + 16:]
+        t_a, t_b = (tweaks[m], tweaks[m - 1]) if decrypt else (tweaks[m - 1], tweaks[m])
+        cc = xor_bytes(crypt(xor_bytes(last_full, t_a)), t_a)
+        pp = tail + cc[rem:]
+        last = xor_bytes(crypt(xor_bytes(pp, t_b)), t_b)
+        return out_head + last + cc[:rem]
+
+    def encrypt_sector(self, sector, data) -> bytes:
+        return self._crypt_sector(sector, data, decrypt=False)
+
+    def decrypt_sector(self, sector, data) -> bytes:
+        return self._crypt_sector(sector, data, decrypt=True)
+
+    def _crypt_sectors(self, data, first_sector, decrypt):
+        size = self.sector_size
+        if len(data) % size != 0:
+            raise ValueError("Panjang data harus kelipatan ukuran sektor.")
+        n_sectors = len(data) // size
+        if size % 16 != 0:
+            return b"".join(
+                self._crypt_sector(first_sector + s, data[s*size:(s+1)*size], decrypt)
+                for s in range(n_sectors)
+            )
+
+        # Tweak awal semua sektor dalam satu batch
+        sector_ids = b"".join((first_sector + s).to_bytes(16, "little") for s in range(n_sectors))
+        t0s = self.tweak_cipher.encrypt_blocks(sector_ids)
+        per_sector = size // 16
+        tw = b"".join(
+            b"".join(_xts_tweaks(int.from_bytes(t0s[16*s:16*(s+1)], "little"), per_sector))
+            for s in range(n_sectors)
+        )
+        crypt = self.data_cipher.decrypt_blocks if decrypt else self.data_cipher.encrypt_blocks
+        return xor_bytes(crypt(xor_bytes(data, tw)), tw)
+
+    def encrypt_sectors(self, data, first_sector=0) -> bytes:
+        """Enkripsi banyak sektor berurutan mulai dari first_sector (bulk)."""
+        return self._crypt_sectors(data, first_sector, decrypt=False)
+
+    def decrypt_sectors(self, data, first_sector=0) -> bytes:
+        return self._crypt_sectors(data, first_sector, decrypt=True)
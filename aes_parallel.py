@@ -0,0 +1,263 @@
+"""
+Enkripsi/dekripsi paralel (ECB & CTR) untuk API bulk aes_backend.
+
+Input dipecah jadi chunk kelipatan 16 byte dan dikirim ke ProcessPoolExecutor.
+Data input/output lewat multiprocessing.shared_memory, jadi chunk tidak pernah
+di-pickle — yang dikirim ke worker hanya nama segmen + offset.
+Tiap worker di-inisialisasi SEKALI dengan konteks cipher (AESCipher).
+"""
+
+import atexit
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+
+import aes_backend as ab
+
+# Default ukuran chunk per task (dibulatkan ke kelipatan 16)
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# Jumlah pool (key, S-Box, workers) yang dipertahankan oleh parallel_*_bytes,
+# dan berapa detik pool menganggur sebelum worker-nya dimatikan
+POOL_CACHE_MAX = 2
+POOL_IDLE_TIMEOUT = 30.0
+
+
+# ===========================================
+# Sisi worker
+# ===========================================
+
+_worker_cipher = None
+
+
+def _init_worker(key_bytes, sbox, backend=None):
+    global _worker_cipher
+    _worker_cipher = ab.AESCipher(key_bytes, sbox, backend)
+
+
+def _op_encrypt(cipher, src, dst, start, arg):
+    cipher.encrypt_into(src, dst)
+
+
+def _op_decrypt(cipher, src, dst, start, arg):
+    cipher.decrypt_into(src, dst)
+
+
+def _op_ctr(cipher, src, dst, start, iv):
+    dst[:] = ab.ctr_crypt(cipher, iv, src, start)
+
+
+_CHUNK_OPS = {
+    "encrypt": _op_encrypt,
+    "decrypt": _op_decrypt,
+    "ctr": _op_ctr,
+}
+
+
+def _run_chunk(op, in_name, out_name, start, end, arg=None):
+    """Proses data[start:end] dari segmen input, tulis langsung ke offset yang sama di output."""
+    # Segmen milik proses induk (yang meng-unlink); worker cukup attach + close.
+    shm_in = shared_memory.SharedMemory(name=in_name)
+    shm_out = shared_memory.SharedMemory(name=out_name)
+    src = shm_in.buf[start:end]
+    dst = shm_out.buf[start:end]
+    try:
+        _CHUNK_OPS[op](_worker_cipher, src, dst, start, arg)
+    finally:
+        src.release()
+        dst.release()
+        shm_in.close()
+        shm_out.close()
+    return end - start
+
+
+# ===========================================
+# Sisi induk
+# ===========================================
+
+class ParallelCipher:
+    """
+    Pool proses dengan konteks cipher ter-cache di tiap worker.
+
+    with ParallelCipher(key, sbox=SBOX44, workers=32) as pc:
+        ct = pc.encrypt_blocks(data_padded)
+    """
+
+    def __init__(self, key_bytes, sbox=ab.AES_SBOX, workers=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                 backend=None):
+        key_bytes = bytes(key_bytes)
+        if len(key_bytes) != 16:
+            raise ValueError("Key harus 16 byte (AES-128).")
+
+        self.key = key_bytes
+        self.sbox = tuple(sbox)
+        self.backend = backend
+        if backend is not None and not ab.get_backend(backend).supports(self.sbox):
+            raise ValueError(f"Backend {backend!r} tidak mendukung S-Box ini.")
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = max(16, chunk_size - chunk_size % 16)
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(self.key, self.sbox, backend),
+        )
+
+    def close(self):
+        self._pool.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _run(self, op, data, arg=None, aligned=True) -> bytes:
+        n = len(data)
+        if aligned and n % 16 != 0:
+            raise ValueError("Panjang data (dalam byte) harus kelipatan 16.")
+        if n == 0:
+            return b""
+
+        shm_in = shared_memory.SharedMemory(create=True, size=n)
+        shm_out = shared_memory.SharedMemory(create=True, size=n)
+        try:
+            shm_in.buf[:n] = data
+            futures = [
+                self._pool.submit(_run_chunk, op, shm_in.name, shm_out.name,
+                                  start, min(start + self.chunk_size, n), arg)
+                for start in range(0, n, self.chunk_size)
+            ]
+            for f in futures:
+                f.result()
+            return bytes(shm_out.buf[:n])
+        finally:
+            shm_in.close()
+            shm_in.unlink()
+            shm_out.close()
+            shm_out.unlink()
+
+    def encrypt_blocks(self, data) -> bytes:
+        """ECB tanpa padding (panjang kelipatan 16), dikerjakan paralel."""
+        return self._run("encrypt", data)
+
+    def decrypt_blocks(self, data) -> bytes:
+        """Kebalikan encrypt_blocks."""
+        return self._run("decrypt", data)
+
+    def ctr_crypt(self, data, iv) -> bytes:
+        """CTR paralel: tiap chunk menghitung counter dari offset-nya sendiri."""
+        if len(iv) != 16:
+            raise ValueError("IV/counter awal CTR harus 16 byte.")
+        return self._run("ctr", data, bytes(iv), aligned=False)
+
+    def encrypt_ecb(self, data) -> bytes:
+        return self.encrypt_blocks(ab.pkcs7_pad(bytes(data), 16))
+
+    def decrypt_ecb(self, data) -> bytes:
+        return ab.pkcs7_unpad(self.decrypt_blocks(data))
+
+
+# ===========================================
+# Pool bersama untuk fungsi praktis
+# ===========================================
+# Pool dipinjam lewat shared_parallel_cipher() dan dihitung pemakainya:
+# pool yang tergusur dari cache atau menganggur POOL_IDLE_TIMEOUT detik baru
+# ditutup setelah pemakai terakhir selesai, dan close() selalu di luar lock.
+
+class _SharedPool:
+    """ParallelCipher bersama + jumlah pemakai aktif."""
+
+    def __init__(self, cache_key):
+        self.cipher = ParallelCipher(*cache_key)
+        self.refs = 0
+        self.evicted = False
+        self.timer = None
+
+    def cancel_timer(self):
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+
+
+_POOLS = OrderedDict()
+_POOL_LOCK = threading.Lock()
+
+
+def _expire_pool(cache_key, pool):
+    with _POOL_LOCK:
+        if pool.refs or _POOLS.get(cache_key) is not pool:
+            return
+        del _POOLS[cache_key]
+        pool.timer = None
+    pool.cipher.close()
+
+
+@contextmanager
+def shared_parallel_cipher(key_bytes, sbox=ab.AES_SBOX, workers=None):
+    """
+    Pinjam ParallelCipher bersama per (key, S-Box, workers): worker di-inisialisasi
+    sekali lalu dipakai ulang antar panggilan selama pool masih di cache.
+
+    with shared_parallel_cipher(key, SBOX44) as pc:
+        ct = pc.encrypt_blocks(data_padded)
+    """
+    cache_key = (bytes(key_bytes), tuple(sbox), workers or os.cpu_count() or 1)
+    to_close = []
+    with _POOL_LOCK:
+        pool = _POOLS.get(cache_key)
+        if pool is None:
+            pool = _POOLS[cache_key] = _SharedPool(cache_key)
+        _POOLS.move_to_end(cache_key)
+        pool.refs += 1
+        pool.cancel_timer()
+        while len(_POOLS) > POOL_CACHE_MAX:
+            _, old = _POOLS.popitem(last=False)
+            old.evicted = True
+            if not old.refs:
+                old.cancel_timer()
+                to_close.append(old)
+    for old in to_close:
+        old.cipher.close()
+
+    try:
+        yield pool.cipher
+    finally:
+        close = False
+        with _POOL_LOCK:
+            pool.refs -= 1
+            if not pool.refs:
+                if pool.evicted:
+                    close = True
+                else:
+                    pool.timer = threading.Timer(POOL_IDLE_TIMEOUT, _expire_pool, (cache_key, pool))
+                    pool.timer.daemon = True
+                    pool.timer.start()
+        if close:
+            pool.cipher.close()
+
+
+@atexit.register
+def close_parallel_pools():
+    """Tutup semua pool bersama yang sedang tidak dipakai."""
+    with _POOL_LOCK:
+        idle = [pool for pool in _POOLS.values() if not pool.refs]
+        for pool in idle:
+            pool.evicted = True
+            pool.cancel_timer()
+        _POOLS.clear()
+    for pool in idle:
+        pool.cipher.close()
+
+
+def parallel_encrypt_bytes(data_padded, key_bytes, sbox=ab.AES_SBOX, workers=None) -> bytes:
+    """Versi paralel dari encrypt_bytes_std / encrypt_bytes_44 (pool dipakai ulang)."""
+    with shared_parallel_cipher(key_bytes, sbox, workers) as pc:
+        return pc.encrypt_blocks(data_padded)
+
+
+def parallel_decrypt_bytes(ciphertext, key_bytes, sbox=ab.AES_SBOX, workers=None) -> bytes:
+    with shared_parallel_cipher(key_bytes, sbox, workers) as pc:
+        return pc.decrypt_blocks(ciphertext)
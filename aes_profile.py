@@ -0,0 +1,211 @@
+"""
+Profiling per tahap AES & fungsi analisis S-Box (opt-in).
+
+Saat aktif, fungsi tahap (SubBytes, ShiftRows, MixColumns, AddRoundKey, gmul,
+key expansion, analisis S-Box, ...) ditukar dengan versi ber-timer di tabel
+fungsi (globals) aes_core, aes_modes, aes_analysis dan fasad aes_backend.
+Pemanggilan internal lewat nama global otomatis terukur; saat nonaktif fungsi
+asli dikembalikan, jadi tidak ada overhead sama sekali (tidak ada `if` di loop
+ronde).
+
+    with aes_profile.profile() as prof:
+        aes_backend.aes_decrypt_block_std(block, key)
+    print(prof.format_table())
+    prof.write_collapsed("aes.folded")     # untuk flamegraph.pl / speedscope
+
+Atau lewat env var saat import aes_backend:
+    AES_PROFILE=1             → tabel dicetak ke stderr saat proses selesai
+    AES_PROFILE=aes.folded    → tabel + file collapsed stack
+
+Catatan: engine cepat (T-table, NumPy, bitsliced, unrolled) menggabungkan
+tahap-tahap jadi satu, jadi rinciannya hanya terlihat di jalur referensi
+(aes_encrypt_block_*, backend "reference") dan fungsi analisis.
+"""
+
+import atexit
+import os
+import sys
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter
+
+# Nama fungsi yang ditukar, per kelompok (yang tidak ada di modul dilewati)
+STAGES = {
+    "round": (
+        "sub_bytes", "sub_bytes_aes", "inv_sub_bytes_aes", "sub_bytes_44", "inv_sub_bytes_44",
+        "shift_rows", "inv_shift_rows",
+        "mix_columns", "mix_single_column", "inv_mix_columns", "xtime", "gmul",
+        "add_round_key",
+    ),
+    "key": (
+        "key_expansion_aes", "key_expansion_sbox44", "key_expansion_sbox",
+    ),
+    "block": (
+        "aes_encrypt_block_std", "aes_decrypt_block_std",
+        "aes_encrypt_block_44", "aes_decrypt_block_44",
+        "reference_encrypt_block", "reference_decrypt_block",
+        "encrypt_bytes_std", "encrypt_bytes_44",
+    ),
+    "analysis": (
+        "avalanche_plaintext", "key_sensitivity", "bit_diff_stats",
+        "sbox_bool_coords", "walsh_spectrum", "nonlinearity_from_walsh", "nonlinearity_per_bit",
+        "fwht", "fwht_rows", "component_walsh", "sbox_nonlinearity",
+        "linear_approximation_table", "lat_linearity", "lat_spectrum", "lap_from_lat",
+        "difference_distribution_table", "differential_uniformity", "differential_spectrum",
+        "dap_from_ddt", "boomerang_connectivity_table", "boomerang_uniformity", "bct_param",
+        "sac_matrix", "sac_stats_per_bit", "bic_nl", "bic_sac", "lap_param", "dap_param",
+    ),
+}
+
+ENV_VAR = "AES_PROFILE"
+
+
+class StageProfiler:
+    """Pencatat waktu & jumlah panggilan per fungsi, plus collapsed stack (self time)."""
+
+    def __init__(self, modules=None, stages=STAGES):
+        if modules is None:
+            import aes_analysis
+            import aes_backend
+            import aes_core
+            import aes_modes
+            modules = (aes_core, aes_modes, aes_analysis, aes_backend)
+        self.modules = tuple(modules)
+        self.names = [
+            n for group in stages.values() for n in group
+            if any(hasattr(m, n) for m in self.modules)
+        ]
+        self.calls = Counter()
+        self.total = Counter()      # waktu inklusif (detik)
+        self.own = Counter()        # waktu tanpa anak yang juga diprofil
+        self.stacks = Counter()     # "a;b;c" → self time
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._originals = {}
+
+    @property
+    def active(self):
+        return bool(self._originals)
+
+    def _frames(self):
+        frames = getattr(self._local, "frames", None)
+        if frames is None:
+            frames = self._local.frames = []
+        return frames
+
+    def _wrap(self, name, fn):
+        frames_of = self._frames
+
+        @wraps(fn)
+        def timed(*args, **kwargs):
+            frames = frames_of()
+            frame = [name, 0.0]
+            frames.append(frame)
+            t0 = perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                dt = perf_counter() - t0
+                frames.pop()
+                if frames:
+                    frames[-1][1] += dt
+                path = ";".join(f[0] for f in frames + [frame])
+                with self._lock:
+                    self.calls[name] += 1
+                    self.total[name] += dt
+                    self.own[name] += dt - frame[1]
+                    self.stacks[path] += dt - frame[1]
+
+        timed.__wrapped_stage__ = fn
+        return timed
+
+    # --------------------------
+    # Tukar tabel fungsi
+    # --------------------------
+    def enable(self):
+        if self.active:
+            return self
+        wrapped = {}
+        for module in self.modules:
+            for name in self.names:
+                fn = getattr(module, name, None)
+                if fn is None:
+                    continue
+                # Nama yang sama di beberapa modul (re-export) → wrapper yang sama
+                if id(fn) not in wrapped:
+                    wrapped[id(fn)] = self._wrap(name, fn)
+                self._originals[module, name] = fn
+                setattr(module, name, wrapped[id(fn)])
+        return self
+
+    def disable(self):
+        for (module, name), fn in self._originals.items():
+            setattr(module, name, fn)
+        self._originals.clear()
+        return self
+
+    def reset(self):
+        for counter in (self.calls, self.total, self.own, self.stacks):
+            counter.clear()
+
+    # --------------------------
+    # Laporan
+    # --------------------------
+    def rows(self):
+        """(nama, panggilan, total s, self s, µs/panggilan) urut dari self time terbesar."""
+        return [
+            (name, self.calls[name], self.total[name], self.own[name],
+             1e6 * self.total[name] / self.calls[name])
+            for name in sorted(self.calls, key=self.own.__getitem__, reverse=True)
+        ]
+
+    def format_table(self):
+        grand = sum(self.own.values()) or 1.0
+        lines = [
+            f"{'fungsi':<26} {'panggilan':>10} {'total (s)':>10} {'self (s)':>10} {'self %':>7} {'µs/call':>9}",
+            "-" * 77,
+        ]
+        for name, calls, total, own, per_call in self.rows():
+            lines.append(
+                f"{name:<26} {calls:>10} {total:>10.4f} {own:>10.4f} {100 * own / grand:>6.1f}% {per_call:>9.2f}"
+            )
+        return "\n".join(lines)
+
+    def collapsed(self):
+        """Format collapsed stack (Brendan Gregg): 'a;b;c <mikrodetik>' per baris."""
+        return "\n".join(
+            f"{path} {round(seconds * 1e6)}" for path, seconds in sorted(self.stacks.items())
+        ) + "\n"
+
+    def write_collapsed(self, path):
+        with open(path, "w") as f:
+            f.write(self.collapsed())
+
+
+@contextmanager
+def profile(modules=None, stages=STAGES):
+    """Context manager: aktifkan profiler selama blok `with`, lalu kembalikan fungsi asli."""
+    prof = StageProfiler(modules, stages).enable()
+    try:
+        yield prof
+    finally:
+        prof.disable()
+
+
+def enable_from_env(modules=None, environ=os.environ):
+    """Aktifkan profiler kalau AES_PROFILE di-set; laporan ditulis saat proses keluar."""
+    value = environ.get(ENV_VAR, "")
+    if not value or value == "0":
+        return None
+    prof = StageProfiler(modules).enable()
+
+    def report():
+        prof.disable()
+        print(prof.format_table(), file=sys.stderr)
+        if value not in ("1", "table"):
+            prof.write_collapsed(value)
+
+    atexit.register(report)
+    return prof
@@ -0,0 +1,336 @@
+"""
+Microservice HTTP lokal (stdlib) untuk enkripsi/dekripsi & analisis S-Box.
+
+Satu proses "hangat": aes_backend di-import sekali, konteks key di-cache
+(get_cipher), dan request kecil yang datang hampir bersamaan dengan key,
+S-Box dan arah yang sama digabung jadi 1 panggilan engine blok (BlockBatcher).
+HTTP/1.1 keep-alive aktif.
+
+    python -m aes_server --port 8044
+
+Endpoint:
+    GET  /health
+    GET  /sbox/metrics?sbox=std|44
+    POST /encrypt, /decrypt
+         JSON  : {"key": "16 karakter", "sbox": "std"|"44", "plaintext": ...} / {"ciphertext": hex}
+         biner : Content-Type application/octet-stream, header X-AES-Key (hex), ?sbox=44
+    POST /avalanche, /key-sensitivity   JSON {"plaintext": ..., "key": ...}
+"""
+
+import argparse
+import json
+import threading
+import time
+from concurrent.futures import Future
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import aes_backend as ab
+
+SBOXES = {
+    "std": ab.AES_SBOX,
+    "44": ab.SBOX44,
+}
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8044
+
+# Jendela pengumpulan batch (detik) & batas ukuran request yang ikut batching
+BATCH_WINDOW = 0.002
+BATCH_MAX_BYTES = 1 << 20
+
+# Batas body request
+MAX_BODY_SIZE = 256 << 20
+
+# Antrian koneksi listen(): burst klien bersamaan tidak kena connection reset
+REQUEST_QUEUE_SIZE = 128
+
+
+# ===========================================
+# Micro-batching
+# ===========================================
+
+class BlockBatcher:
+    """
+    Gabungkan request ECB kecil dengan (key, S-Box, arah) sama jadi 1 panggilan
+    encrypt_blocks/decrypt_blocks. Request besar langsung diproses di thread-nya.
+    """
+
+    def __init__(self, window=BATCH_WINDOW, max_bytes=BATCH_MAX_BYTES):
+        self.window = window
+        self.max_bytes = max_bytes
+        self.requests = 0
+        self.batches = 0
+        self._pending = {}
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._loop, name="aes-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, key_bytes, sbox_name, op, data) -> bytes:
+        """op: "encrypt" / "decrypt"; data kelipatan 16 byte."""
+        if len(data) >= self.max_bytes:
+            return _crypt(ab.get_cipher(key_bytes, SBOXES[sbox_name]), op, data)
+
+        fut = Future()
+        with self._cond:
+            self._pending.setdefault((key_bytes, sbox_name, op), []).append((data, fut))
+            self._cond.notify()
+        return fut.result()
+
+    def _loop(self):
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+            # Beri waktu request lain yang datang hampir bersamaan untuk ikut batch
+            time.sleep(self.window)
+            with self._cond:
+                pending, self._pending = self._pending, {}
+            for (key_bytes, sbox_name, op), jobs in pending.items():
+                self._run_batch(key_bytes, sbox_name, op, jobs)
+
+    def _run_batch(self, key_bytes, sbox_name, op, jobs):
+        self.requests += len(jobs)
+        self.batches += 1
+        try:
+            cipher = ab.get_cipher(key_bytes, SBOXES[sbox_name])
+            out = _crypt(cipher, op, b"".join(data for data, _ in jobs))
+        except Exception as exc:
+            for _, fut in jobs:
+                fut.set_exception(exc)
+            return
+
+        pos = 0
+        for data, fut in jobs:
+            fut.set_result(out[pos:pos + len(data)])
+            pos += len(data)
+
+
+def _crypt(cipher, op, data) -> bytes:
+    if op == "decrypt":
+        return cipher.decrypt_blocks(data)
+    return cipher.encrypt_blocks(data)
+
+
+# ===========================================
+# Analisis (di-cache per S-Box)
+# ===========================================
+
+@lru_cache(maxsize=None)
+def sbox_metrics(sbox_name):
+    """NL, SAC, BIC, LAP, DAP, BCT untuk S-Box terdaftar (dihitung sekali)."""
+    sbox = SBOXES[sbox_name]
+    return {
+        "sbox": sbox_name,
+        "nl_per_bit": ab.nonlinearity_per_bit(sbox),
+        "sac_stats_per_bit": ab.sac_stats_per_bit(ab.sac_matrix(sbox)),
+        "bic_nl": ab.bic_nl(sbox),
+        "bic_sac": ab.bic_sac(sbox),
+        "lap": ab.lap_param(sbox),
+        "dap": ab.dap_param(sbox),
+        "bct": ab.bct_param(sbox),
+    }
+
+
+# ===========================================
+# HTTP
+# ===========================================
+
+class AESRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"   # keep-alive
+    server_version = "AESBackend/1.0"
+
+    # --------------------------
+    # Helper respon
+    # --------------------------
+    def _send(self, status, body: bytes, content_type):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, obj, status=200):
+        self._send(status, json.dumps(obj).encode("utf-8"), "application/json")
+
+    def _send_error_json(self, status, message):
+        self._send_json({"error": message}, status)
+
+    def _read_body(self) -> bytes:
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        if not 0 <= length <= MAX_BODY_SIZE:
+            # Body tidak dibaca: sisa byte di socket tidak boleh dianggap request berikutnya
+            self.close_connection = True
+            if length < 0:
+                raise ValueError("Content-Length tidak valid.")
+            raise ValueError("Body request terlalu besar.")
+        return self.rfile.read(length)
+
+    def _read_json(self, body) -> dict:
+        req = json.loads(body)
+        if not isinstance(req, dict):
+            raise ValueError("Body JSON harus berupa object.")
+        return req
+
+    @staticmethod
+    def _field(req, name, required=True):
+        """Ambil field string dari body JSON (None kalau opsional & tidak ada)."""
+        value = req.get(name)
+        if value is None:
+            if required:
+                raise ValueError(f"Field {name!r} wajib diisi.")
+            return None
+        if not isinstance(value, str):
+            raise ValueError(f"Field {name!r} harus berupa string.")
+        return value
+
+    def _sbox_name(self, value):
+        name = value or "std"
+        if name not in SBOXES:
+            raise ValueError(f"S-Box tidak dikenal: {name!r} (pilih: {', '.join(SBOXES)}).")
+        return name
+
+    def log_message(self, fmt, *args):
+        if self.server.verbose:
+            super().log_message(fmt, *args)
+
+    # --------------------------
+    # Routing
+    # --------------------------
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        try:
+            if url.path == "/health":
+                batcher = self.server.batcher
+                self._send_json({
+                    "status": "ok",
+                    "requests": batcher.requests,
+                    "batches": batcher.batches,
+                })
+            elif url.path == "/sbox/metrics":
+                self._send_json(sbox_metrics(self._sbox_name(query.get("sbox", [None])[0])))
+            else:
+                self._send_error_json(404, "Endpoint tidak ditemukan.")
+        except ValueError as exc:
+            self._send_error_json(400, str(exc))
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        routes = {
+            "/encrypt": self._handle_crypt,
+            "/decrypt": self._handle_crypt,
+            "/avalanche": self._handle_analysis,
+            "/key-sensitivity": self._handle_analysis,
+        }
+        handler = routes.get(url.path)
+        try:
+            body = self._read_body()
+            if handler is None:
+                self._send_error_json(404, "Endpoint tidak ditemukan.")
+                return
+            handler(url, body)
+        except (ValueError, KeyError, UnicodeDecodeError) as exc:
+            self._send_error_json(400, str(exc))
+
+    # --------------------------
+    # Endpoint
+    # --------------------------
+    def _handle_crypt(self, url, body):
+        op = url.path.strip("/")
+        batcher = self.server.batcher
+
+        if self.headers.get("Content-Type", "").startswith("application/octet-stream"):
+            # Mode biner: body mentah, tanpa hex/JSON
+            key_bytes = bytes.fromhex(self.headers.get("X-AES-Key", ""))
+            sbox_name = self._sbox_name(parse_qs(url.query).get("sbox", [None])[0])
+            out = self._ecb(batcher, key_bytes, sbox_name, op, body)
+            self._send(200, out, "application/octet-stream")
+            return
+
+        req = self._read_json(body)
+        if "key_hex" in req:
+            key_bytes = bytes.fromhex(self._field(req, "key_hex"))
+        else:
+            key_bytes = self._field(req, "key").encode("utf-8")
+        sbox_name = self._sbox_name(self._field(req, "sbox", required=False))
+
+        if op == "encrypt":
+            data = self._field(req, "plaintext").encode("utf-8")
+            out = self._ecb(batcher, key_bytes, sbox_name, op, data)
+            self._send_json({"ciphertext": out.hex(), "sbox": sbox_name})
+        else:
+            data = bytes.fromhex(self._field(req, "ciphertext"))
+            out = self._ecb(batcher, key_bytes, sbox_name, op, data)
+            self._send_json({"plaintext": out.decode("utf-8"), "sbox": sbox_name})
+
+    @staticmethod
+    def _ecb(batcher, key_bytes, sbox_name, op, data) -> bytes:
+        """ECB + PKCS7 lewat batcher."""
+        if len(key_bytes) != 16:
+            raise ValueError("Key harus 16 byte (AES-128).")
+        if op == "encrypt":
+            return batcher.submit(key_bytes, sbox_name, op, ab.pkcs7_pad(data, 16))
+        if not data or len(data) % 16 != 0:
+            raise ValueError("Panjang ciphertext (dalam byte) harus kelipatan 16.")
+        # Unpad tervalidasi: key salah → ValueError (400), bukan plaintext kosong/sampah
+        return ab.pkcs7_unpad(batcher.submit(key_bytes, sbox_name, op, data), strict=True)
+
+    def _handle_analysis(self, url, body):
+        req = self._read_json(body)
+        fn = ab.avalanche_plaintext if url.path == "/avalanche" else ab.key_sensitivity
+        self._send_json(fn(self._field(req, "plaintext"), self._field(req, "key"), debug=False))
+
+
+class AESServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = REQUEST_QUEUE_SIZE
+
+    def __init__(self, address, batcher=None, verbose=False, request_queue_size=None):
+        if request_queue_size is not None:
+            # Harus di-set sebelum server_activate() (listen) di konstruktor induk
+            self.request_queue_size = request_queue_size
+        super().__init__(address, AESRequestHandler)
+        self.batcher = batcher or BlockBatcher()
+        self.verbose = verbose
+
+
+def warm_up():
+    """Ekspansi tabel & self-check backend sebelum request pertama datang."""
+    for sbox in SBOXES.values():
+        ab.get_cipher(bytes(16), sbox).encrypt_blocks(bytes(16 * ab.BATCH_MIN_BLOCKS))
+
+
+def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, batch_window=BATCH_WINDOW, verbose=False,
+          backlog=REQUEST_QUEUE_SIZE):
+    warm_up()
+    server = AESServer((host, port), BlockBatcher(window=batch_window), verbose=verbose,
+                       request_queue_size=backlog)
+    print(f"AES service di http://{host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Microservice HTTP AES (standar & SBOX44).")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--batch-window", type=float, default=BATCH_WINDOW,
+                        help="jendela micro-batching dalam detik (default: %(default)s)")
+    parser.add_argument("--backlog", type=int, default=REQUEST_QUEUE_SIZE,
+                        help="antrian koneksi listen() (default: %(default)s)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="log tiap request")
+    args = parser.parse_args(argv)
+    serve(args.host, args.port, args.batch_window, args.verbose, args.backlog)
+
+
+if __name__ == "__main__":
+    main()